@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import time
+from types import FunctionType
+
+import cadnano.proxies.cnproxy as cnp
+from cadnano.undocommand import UndoCommand
+
+
+class CommandProfiler(object):
+    """Opt-in timing of the `redo` and `undo` of every `UndoCommand`
+    subclass.  While active the methods of the command classes are wrapped,
+    so commands run through the undo stack, `util.doCmd`,
+    `util.execCommandList` or with ``use_undostack=False`` are all counted.
+    Nothing is wrapped while no profiler is active.
+
+    A command is a macro if other commands ran inside it and a leaf
+    otherwise.  Commands are keyed by class name, except plain pure python
+    `UndoCommand` macros, which are keyed by their name, e.g. "Resize
+    Selection", so each user action gets its own row.  Self time excludes
+    the time of the nested commands, i.e.::
+
+        with CommandProfiler() as profiler:
+            doc.readFile('design.json')
+        profiler.writeJSON('commands.json')
+        profiler.writeChromeTrace('trace.json')
+
+    Only the subclasses defined when :meth:`start` is called are wrapped,
+    so the modules of the commands to time must be imported before, which
+    importing `cadnano.document` does for the model commands.
+
+    Args:
+        trace (bool, optional): keep an event per command call for
+            :meth:`writeChromeTrace`, default ``True``
+    """
+    _active = None
+
+    def __init__(self, trace=True):
+        self._trace = trace
+        self._stats = {}
+        self._events = []
+        self._stack = []
+        self._patched = []
+        self._t0 = None
+    # end def
+
+    def __enter__(self):
+        self.start()
+        return self
+    # end def
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+    # end def
+
+    def isActive(self):
+        return CommandProfiler._active is self
+    # end def
+
+    def start(self):
+        """Wrap the command classes defined so far.  Only one profiler can
+        be active
+
+        Raises:
+            RuntimeError: if a profiler is already active
+        """
+        if CommandProfiler._active is not None:
+            raise RuntimeError("a CommandProfiler is already active")
+        CommandProfiler._active = self
+        if self._t0 is None:
+            self._t0 = time.perf_counter()
+        for cls in _commandClasses(cnp.UndoCommand):
+            for op in ('redo', 'undo'):
+                method = cls.__dict__.get(op)
+                # skip inherited methods and those of extension types like
+                # QUndoCommand
+                if not isinstance(method, FunctionType):
+                    continue
+                setattr(cls, op, self._wrap(method, op))
+                self._patched.append((cls, op, method))
+    # end def
+
+    def stop(self):
+        """Restore the command classes
+        """
+        if CommandProfiler._active is not self:
+            return
+        for cls, op, method in reversed(self._patched):
+            setattr(cls, op, method)
+        self._patched = []
+        self._stack = []
+        CommandProfiler._active = None
+    # end def
+
+    def reset(self):
+        """Drop the recorded statistics and events
+        """
+        self._stats = {}
+        self._events = []
+        self._t0 = time.perf_counter()
+    # end def
+
+    def _wrap(self, method, op):
+        stack = self._stack
+
+        def wrapper(cmd, *args):
+            # a super() call of an already timed command
+            if stack and stack[-1][0] is cmd:
+                return method(cmd, *args)
+            frame = [cmd, 0.]  # command, time of nested commands
+            stack.append(frame)
+            start = time.perf_counter()
+            try:
+                return method(cmd, *args)
+            finally:
+                elapsed = time.perf_counter() - start
+                stack.pop()
+                if stack:
+                    stack[-1][1] += elapsed
+                self._record(cmd, op, start, elapsed, frame[1], len(stack))
+        wrapper.__name__ = method.__name__
+        wrapper.__doc__ = method.__doc__
+        return wrapper
+    # end def
+
+    def _record(self, cmd, op, start, elapsed, nested_time, depth):
+        cls = type(cmd)
+        if cls is UndoCommand and cmd.name:
+            name = cmd.name
+        else:
+            name = cls.__name__
+        is_macro = nested_time > 0.
+        stat = self._stats.get((name, op))
+        if stat is None:
+            stat = self._stats[(name, op)] = {'count': 0, 'leaf_count': 0, 'macro_count': 0,
+                                              'total_time': 0., 'self_time': 0., 'max_time': 0.}
+        stat['count'] += 1
+        stat['macro_count' if is_macro else 'leaf_count'] += 1
+        stat['total_time'] += elapsed
+        stat['self_time'] += elapsed - nested_time
+        if elapsed > stat['max_time']:
+            stat['max_time'] = elapsed
+        if self._trace:
+            self._events.append((name, op, start, elapsed, depth, is_macro))
+    # end def
+
+    def stats(self):
+        """
+        Returns:
+            dict: of form {(command class or macro name, 'redo' or 'undo'):
+                dict} with the keys count, leaf_count, macro_count,
+                total_time, self_time and max_time in seconds
+        """
+        return {key: dict(stat) for key, stat in self._stats.items()}
+    # end def
+
+    def summary(self):
+        """
+        Returns:
+            list: of :obj:`dict` of :meth:`stats` with a command and op key
+                sorted by decreasing self time
+        """
+        rows = [dict(stat, command=name, op=op) for (name, op), stat in self._stats.items()]
+        rows.sort(key=lambda row: row['self_time'], reverse=True)
+        return rows
+    # end def
+
+    def writeJSON(self, filename):
+        """Write the :meth:`summary` as JSON
+
+        Args:
+            filename (str): path or open file
+        """
+        _dump(filename, {'commands': self.summary()})
+    # end def
+
+    def chromeTrace(self):
+        """
+        Returns:
+            dict: Chrome trace event format of the command calls, which loads
+                in chrome://tracing or Perfetto
+        """
+        t0 = self._t0 or 0.
+        pid = os.getpid()
+        events = []
+        for name, op, start, elapsed, depth, is_macro in self._events:
+            events.append({'name': name, 'cat': op, 'ph': 'X', 'pid': pid, 'tid': 0,
+                           'ts': (start - t0)*1e6, 'dur': elapsed*1e6,
+                           'args': {'depth': depth, 'macro': is_macro}})
+        events.sort(key=lambda event: event['ts'])
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+    # end def
+
+    def writeChromeTrace(self, filename):
+        """
+        Args:
+            filename (str): path or open file
+        """
+        _dump(filename, self.chromeTrace())
+    # end def
+# end class
+
+
+def _commandClasses(base):
+    """
+    Returns:
+        list: of `base` and all its subclasses
+    """
+    classes = [base]
+    seen = {base}
+    i = 0
+    while i < len(classes):
+        for cls in classes[i].__subclasses__():
+            if cls not in seen:
+                seen.add(cls)
+                classes.append(cls)
+        i += 1
+    return classes
+# end def
+
+
+def _dump(filename, obj):
+    if hasattr(filename, 'write'):
+        json.dump(obj, filename, indent=1)
+    else:
+        with open(filename, 'w') as fd:
+            json.dump(obj, fd, indent=1)
+# end def
@@ -767,7 +767,7 @@ class DocumentController(object):
             fname = QFileDialog.getSaveFileName(self.win,
                                                 "%s - Save As" % QApplication.applicationName(),
                                                 directory,
-                                                "%s (*.json)" % QApplication.applicationName())
+                                                "%s (*.json *.cnz)" % QApplication.applicationName())
             if isinstance(fname, (list, tuple)):
                 fname = fname[0]
             self.writeDocumentToFile(fname)
@@ -775,7 +775,7 @@ class DocumentController(object):
             fdialog = QFileDialog(self.win,
                                   "%s - Save As" % QApplication.applicationName(),
                                   directory,
-                                  "%s (*.json)" % QApplication.applicationName())
+                                  "%s (*.json *.cnz)" % QApplication.applicationName())
             fdialog.setAcceptMode(QFileDialog.AcceptSave)
             fdialog.setWindowFlags(Qt.Sheet)
             fdialog.setWindowModality(Qt.WindowModal)
@@ -833,9 +833,8 @@ class DocumentController(object):
         # write the file
         ap = self._document.activePart()
         if ap is not None:
-            output = ap.getSequences()
             with open(fname, 'w') as f:
-                f.write(output)
+                ap.writeSequences(f)
     # end def
 
     def newClickedCallback(self):
@@ -903,7 +902,7 @@ class DocumentController(object):
             fname = selected
         if fname is None or os.path.isdir(fname):
             return False
-        if not fname.lower().endswith(".json"):
+        if not fname.lower().endswith((".json", ".cnz")):
             fname += ".json"
         if self.filesavedialog is not None:
             self.filesavedialog.filesSelected.disconnect(self.saveFileDialogCallback)
@@ -961,14 +960,14 @@ class DocumentController(object):
         if util.isWindows():  # required for native looking file window#"/",
             fname = QFileDialog.getOpenFileName(None,
                                                 "Open Document", path,
-                                                "cadnano1 / cadnano2 Files (*.nno *.json *.c25)")
+                                                "cadnano1 / cadnano2 Files (*.nno *.json *.c25 *.cnz)")
             self.filesavedialog = None
             self.openAfterMaybeSaveCallback(fname)
         else:  # access through non-blocking callback
             fdialog = QFileDialog(self.win,
                                   "Open Document",
                                   path,
-                                  "cadnano1 / cadnano2 Files (*.nno *.json *.c25)")
+                                  "cadnano1 / cadnano2 Files (*.nno *.json *.c25 *.cnz)")
             fdialog.setAcceptMode(QFileDialog.AcceptOpen)
             fdialog.setWindowFlags(Qt.Sheet)
             fdialog.setWindowModality(Qt.WindowModal)
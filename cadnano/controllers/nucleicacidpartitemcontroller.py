@@ -14,6 +14,7 @@ class NucleicAcidPartItemController(PartItemController):
     ('partInstancePropertySignal',             'partInstancePropertySlot'),            # noqa
 
     ('partVirtualHelixAddedSignal',            'partVirtualHelixAddedSlot'),           # noqa
+    ('partVirtualHelicesAddedSignal',          'partVirtualHelicesAddedSlot'),         # noqa
     ('partVirtualHelixRemovingSignal',         'partVirtualHelixRemovingSlot'),        # noqa
     ('partVirtualHelixRemovedSignal',          'partVirtualHelixRemovedSlot'),         # noqa
     ('partVirtualHelixResizedSignal',          'partVirtualHelixResizedSlot'),         # noqa
@@ -22,6 +23,7 @@ class NucleicAcidPartItemController(PartItemController):
     ('partVirtualHelicesSelectedSignal',       'partVirtualHelicesSelectedSlot'),      # noqa
     ('partVirtualHelixPropertyChangedSignal',  'partVirtualHelixPropertyChangedSlot'), # noqa
 
-    ('partOligoAddedSignal',                   'partOligoAddedSlot')                   # noqa
+    ('partOligoAddedSignal',                   'partOligoAddedSlot'),                  # noqa
+    ('partOligosRebuiltSignal',                'partOligosRebuiltSlot')                # noqa
     ]
 # end class
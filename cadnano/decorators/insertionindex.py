@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# encoding: utf-8
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+
+
+class InsertionIndex(dict):
+    """The :class:`Insertion` objects of a virtual helix keyed by index
+
+    A sorted list of the indices and the cumulative lengths of the
+    insertions in that order are rebuilt lazily after a change, so range
+    queries are a pair of bisects.  Changing the length of an `Insertion`
+    in place must be followed by a call to :meth:`lengthChanged`
+    """
+    __slots__ = '_idxs', '_prefix_lengths'
+
+    def __init__(self, *args, **kwargs):
+        super(InsertionIndex, self).__init__(*args, **kwargs)
+        self._idxs = None
+        self._prefix_lengths = None
+    # end def
+
+    def __setitem__(self, idx, insertion):
+        super(InsertionIndex, self).__setitem__(idx, insertion)
+        self._idxs = None
+    # end def
+
+    def __delitem__(self, idx):
+        super(InsertionIndex, self).__delitem__(idx)
+        self._idxs = None
+    # end def
+
+    def pop(self, *args):
+        self._idxs = None
+        return super(InsertionIndex, self).pop(*args)
+    # end def
+
+    def clear(self):
+        super(InsertionIndex, self).clear()
+        self._idxs = None
+    # end def
+
+    def update(self, *args, **kwargs):
+        super(InsertionIndex, self).update(*args, **kwargs)
+        self._idxs = None
+    # end def
+
+    def lengthChanged(self):
+        """Call after changing the length of an `Insertion` in place
+        """
+        self._prefix_lengths = None
+    # end def
+
+    def _range(self, idx_low, idx_high):
+        """
+        Returns:
+            tuple: of :obj:`int` the slice of the sorted indices between
+                `idx_low` and `idx_high` inclusive
+        """
+        if self._idxs is None:
+            self._idxs = sorted(self)
+            self._prefix_lengths = None
+        if self._prefix_lengths is None:
+            self._prefix_lengths = [0]
+            self._prefix_lengths += accumulate(self[idx].length() for idx in self._idxs)
+        idxs = self._idxs
+        return bisect_left(idxs, idx_low), bisect_right(idxs, idx_high)
+    # end def
+
+    def insertionsBetween(self, idx_low, idx_high):
+        """
+        Args:
+            idx_low (int): low index
+            idx_high (int): high index
+
+        Returns:
+            list: of :class:`Insertion` between `idx_low` and `idx_high`
+                inclusive sorted by index
+        """
+        lo, hi = self._range(idx_low, idx_high)
+        return [self[idx] for idx in self._idxs[lo:hi]]
+    # end def
+
+    def lengthBetween(self, idx_low, idx_high):
+        """
+        Args:
+            idx_low (int): low index
+            idx_high (int): high index
+
+        Returns:
+            int: the total length of the insertions and skips between
+                `idx_low` and `idx_high` inclusive
+        """
+        lo, hi = self._range(idx_low, idx_high)
+        prefix_lengths = self._prefix_lengths
+        return prefix_lengths[hi] - prefix_lengths[lo]
+    # end def
+# end class
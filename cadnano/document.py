@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # encoding: utf-8
 
+from contextlib import contextmanager
 from operator import itemgetter
 from uuid import uuid4
 
@@ -8,7 +9,8 @@ from cadnano import app, setBatch, util
 from cadnano.addinstancecmd import AddInstanceCommand
 from cadnano.proxies.cnenum import ModType, GridType
 from cadnano.proxies.cnobject import CNObject
-from cadnano.proxies.cnproxy import ProxySignal, UndoStack
+from cadnano.proxies.cnproxy import (ProxySignal, UndoStack,
+                                     beginDeferredEmit, endDeferredEmit)
 from cadnano.docmodscmd import (AddModCommand, ModifyModCommand,
                                 RemoveModCommand)
 from cadnano.fileio.decode import decodeFile
@@ -82,6 +84,28 @@ class Document(CNObject):
         """
         return self._undostack
 
+    @contextmanager
+    def deferSignals(self, aggregator=None):
+        """Context manager for bulk edits that queues the signals emitted by
+        the model until it exits.  Repeated emissions of a signal by the same
+        sender with the same arguments are emitted once.  Transactions nest,
+        only the outermost one flushes, i.e.::
+
+            with doc.deferSignals():
+                for strand in strands:
+                    strand.resize(...)
+
+        Args:
+            aggregator (callable, optional): see
+                :func:`cadnano.proxies.cnproxy.beginDeferredEmit`
+        """
+        beginDeferredEmit(aggregator)
+        try:
+            yield
+        finally:
+            endDeferredEmit()
+    # end def
+
     def children(self):
         """Returns a list of parts associated with the document.
 
@@ -611,17 +635,18 @@ class Document(CNObject):
         if use_undostack:
             us.beginMacro("Resize Selection")
 
-        for strand, idx_low, idx_high in resize_list:
-            Strand.resize(strand,
-                          (idx_low, idx_high),
-                          use_undostack,
-                          update_segments=False)
-        if resize_list:
-            cmd = RefreshSegmentsCommand(part, vh_set)
-            if use_undostack:
-                us.push(cmd)
-            else:
-                cmd.redo()
+        with self.deferSignals():
+            for strand, idx_low, idx_high in resize_list:
+                Strand.resize(strand,
+                              (idx_low, idx_high),
+                              use_undostack,
+                              update_segments=False)
+            if resize_list:
+                cmd = RefreshSegmentsCommand(part, vh_set)
+                if use_undostack:
+                    us.push(cmd)
+                else:
+                    cmd.redo()
 
         if use_undostack:
             us.endMacro()
@@ -691,13 +716,28 @@ class Document(CNObject):
     # end def
 
     # PUBLIC METHODS FOR EDITING THE MODEL #
-    def createNucleicAcidPart(self, use_undostack=True, grid_type=GridType.HONEYCOMB):
+    def createNucleicAcidPart(self, use_undostack=True, grid_type=GridType.HONEYCOMB,
+                              chunked_coordinates=False, parametric_coordinates=False,
+                              single_precision=False):
         """ Create and store a new DnaPart and instance, and return the instance.
 
         Args:
             use_undostack (bool): optional, defaults to True
+            chunked_coordinates (bool): optional, store coordinates per
+                virtual helix so resizing costs are independent of the part
+                size. defaults to False
+            parametric_coordinates (bool): optional, store only the helix
+                parameters of each virtual helix and evaluate points on
+                demand. Takes precedence over `chunked_coordinates`.
+                defaults to False
+            single_precision (bool): optional, store coordinates as
+                :obj:`numpy.float32` and ID numbers and indices as
+                :obj:`numpy.int32`. defaults to False
         """
-        dna_part = NucleicAcidPart(document=self, grid_type=grid_type)
+        dna_part = NucleicAcidPart(document=self, grid_type=grid_type,
+                                   chunked_coordinates=chunked_coordinates,
+                                   parametric_coordinates=parametric_coordinates,
+                                   single_precision=single_precision)
         self._addPart(dna_part, use_undostack=use_undostack)
         return dna_part
     # end def
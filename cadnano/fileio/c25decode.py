@@ -240,7 +240,7 @@ def decode(document, obj, emit_signals=True):
 
     # need to heal all oligo connections into a continuous
     # oligo for the next steps
-    RefreshOligosCommand(part).redo()
+    RefreshOligosCommand(part, emit_signals=False).redo()
 
     # COLORS, INSERTIONS, deletions
     for helix in obj['vstrands']:
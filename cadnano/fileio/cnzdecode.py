@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+import json
+import struct
+import zipfile
+
+import numpy as np
+
+from cadnano.fileio.cnzencode import HEADER_NAME, OLIGO_COLUMNS
+from cadnano.fileio.v3decode import (decodeModifications, decodeStrands,
+                                     determineLatticeType, determineOrthoViewType)
+from cadnano.proxies.cnenum import PointType
+
+# size and format of the fixed part of a zip local file header
+_LOCAL_HEADER = struct.Struct('<4s5H3L2H')
+
+
+def decode(document, filename, emit_signals=False):
+    """ Decode a file written by :func:`cnzencode.encodeToFile`
+
+    Args:
+        document (Document):
+        filename (str): path of the file
+    """
+    header, arrays = readArchive(filename)
+
+    for i, part_header in enumerate(header['parts']):
+        prefix = 'part%d/' % i
+        part_arrays = {name[len(prefix):]: array for name, array in arrays.items()
+                       if name.startswith(prefix)}
+        decodePart(document, part_header, part_arrays, emit_signals=emit_signals)
+
+    decodeModifications(document, header['modifications'])
+# end def
+
+
+def readArchive(filename):
+    """Read the JSON header and memory-map the arrays of a file.  The file
+    is mapped read only once and the arrays of members stored uncompressed
+    are views of it, other members are read.  The arrays are only valid
+    while the file is unchanged, decoding copies what it keeps
+
+    Args:
+        filename (str): path of the file
+
+    Returns:
+        tuple: of form (header, arrays) where header is a :obj:`dict` and
+            arrays a :obj:`dict` of :obj:`ndarray` keyed by member name
+
+    Raises:
+        ValueError: the file is not a cnz file
+    """
+    arrays = {}
+    file_map = None
+    with zipfile.ZipFile(filename, 'r') as zf:
+        if HEADER_NAME not in zf.namelist():
+            raise ValueError("%s is not a cadnano cnz file" % filename)
+        header = json.loads(zf.read(HEADER_NAME).decode('utf-8'))
+        with open(filename, 'rb') as fd:
+            for info in zf.infolist():
+                if not info.filename.endswith('.npy'):
+                    continue
+                name = info.filename[:-4]
+                if info.compress_type != zipfile.ZIP_STORED:
+                    with zf.open(info) as member:
+                        arrays[name] = np.lib.format.read_array(member, allow_pickle=False)
+                    continue
+                offset, shape, fortran_order, dtype = _readArrayHeader(fd, info)
+                order = 'F' if fortran_order else 'C'
+                count = int(np.prod(shape))
+                if count == 0:
+                    arrays[name] = np.empty(shape, dtype=dtype, order=order)
+                    continue
+                if file_map is None:
+                    file_map = np.memmap(filename, dtype=np.uint8, mode='r')
+                array = file_map[offset:offset + count*dtype.itemsize].view(dtype)
+                arrays[name] = array.reshape(shape, order=order)
+    return header, arrays
+# end def
+
+
+def _readArrayHeader(fd, info):
+    """
+    Args:
+        fd (file): the file opened in binary mode
+        info (ZipInfo): an uncompressed `.npy` member
+
+    Returns:
+        tuple: of form (offset, shape, fortran_order, dtype) where offset is
+            the position of the data of the array in the file
+
+    Raises:
+        ValueError: the array holds python objects
+    """
+    # the local header may have different extra fields than the central
+    # directory, so find the data from it
+    fd.seek(info.header_offset)
+    fields = _LOCAL_HEADER.unpack(fd.read(_LOCAL_HEADER.size))
+    name_length, extra_length = fields[-2:]
+    fd.seek(info.header_offset + _LOCAL_HEADER.size + name_length + extra_length)
+    version = np.lib.format.read_magic(fd)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(fd)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(fd)
+    if dtype.hasobject:
+        raise ValueError("object array %s" % info.filename)
+    return fd.tell(), shape, fortran_order, dtype
+# end def
+
+
+def decodePart(document, part_header, arrays, emit_signals=False):
+    """ Decode a Part from its header and arrays.  Only reading the arrays
+    is memory-mapped: :meth:`NucleicAcidPart.importVirtualHelices` copies
+    the virtual helix columns into the property store of the Part and
+    computes the points again, and the strands, crossovers and oligos are
+    built like those of a v3 file, so nothing of the Part refers to the file
+
+    Args:
+        document (Document):
+        part_header (dict): the non array properties of the Part
+        arrays (dict): of :obj:`ndarray` of the Part keyed by name
+    """
+    id_nums = arrays['vh_ids'].tolist()
+    vh_id_list = [[id_num, size] for id_num, size in zip(id_nums, arrays['vh_sizes'].tolist())]
+    is_arbitrary = part_header.get('point_type') == PointType.ARBITRARY
+    if is_arbitrary:
+        origins = None
+        lattice_dict = {'vh_list': [], 'origins': {}}
+    else:
+        origins = arrays['origins']
+        lattice_dict = {'vh_list': vh_id_list, 'origins': dict(zip(id_nums, origins.tolist()))}
+
+    grid_type = determineLatticeType(lattice_dict)
+    document.setSliceOrGridViewVisible(value=determineOrthoViewType(lattice_dict, grid_type))
+    part = document.createNucleicAcidPart(use_undostack=False, grid_type=grid_type,
+                                          single_precision=part_header.get('single_precision', False))
+    part.setActive(True)
+
+    if not is_arbitrary and id_nums:
+        properties = {}
+        for key in part_header['vh_property_keys']:
+            name = 'vh/' + key
+            if name + '_offsets' in arrays:
+                properties[key] = _unpackStrings(arrays, name)
+            else:
+                properties[key] = arrays[name]
+        properties['neighbors'] = _split(arrays['neighbors'].tolist(),
+                                         arrays['neighbor_counts'].tolist())
+        xyz = np.column_stack((origins, properties['z']))
+        part.importVirtualHelices(id_nums, xyz, arrays['vh_sizes'].tolist(), properties)
+        # zoom to fit
+        if emit_signals:
+            part.partZDimensionsChangedSignal.emit(part, *part.zBoundsIds(), True)
+
+    # the rest is decoded like a v3 file
+    strand_idxs = _split(arrays['strand_idxs'].tolist(), arrays['strand_counts'].ravel().tolist())
+    strand_colors = _split(_unpackColors(arrays, 'strand_colors'), arrays['strand_counts'].ravel().tolist())
+    part_dict = dict(part_header)
+    part_dict['vh_list'] = vh_id_list
+    part_dict['strands'] = {'indices': list(zip(strand_idxs[::2], strand_idxs[1::2])),
+                            'properties': list(zip(strand_colors[::2], strand_colors[1::2]))}
+    part_dict['xovers'] = [(from_id, bool(from_is_fwd), from_idx, to_id, bool(to_is_fwd), to_idx)
+                           for from_id, from_is_fwd, from_idx, to_id, to_is_fwd, to_idx
+                           in arrays['xovers'].tolist()]
+    part_dict['insertions'] = arrays['insertions'].tolist()
+    part_dict['virtual_helix_order'] = arrays['virtual_helix_order'].tolist()
+    part_dict['oligos'] = _decodeOligos(arrays)
+    decodeStrands(part, part_dict, emit_signals=emit_signals)
+# end def
+
+
+def _decodeOligos(arrays):
+    """
+    Returns:
+        list: of :obj:`dict` like the 'oligos' of a v3 file
+    """
+    oligos = []
+    for row, name, color, sequence, has_sequence in zip(arrays['oligos'].tolist(),
+                                                         _unpackStrings(arrays, 'oligo_names'),
+                                                         _unpackColors(arrays, 'oligo_colors'),
+                                                         _unpackStrings(arrays, 'oligo_sequences'),
+                                                         arrays['oligo_has_sequence'].tolist()):
+        oligo = dict(zip(OLIGO_COLUMNS, row))
+        for key in ('is_5p_fwd', 'is_circular', 'is_visible'):
+            oligo[key] = bool(oligo[key])
+        oligo['name'] = name
+        oligo['color'] = color
+        oligo['sequence'] = sequence if has_sequence else None
+        oligos.append(oligo)
+    return oligos
+# end def
+
+
+def _unpackStrings(arrays, name):
+    """Inverse of `cnzencode._packStrings`
+
+    Returns:
+        list: of :obj:`str`
+    """
+    data = arrays[name].tobytes()
+    offsets = arrays[name + '_offsets'].tolist()
+    return [data[start:end].decode('utf-8') for start, end in zip(offsets, offsets[1:])]
+# end def
+
+
+def _unpackColors(arrays, name):
+    """Inverse of `cnzencode._packColors`
+
+    Returns:
+        list: of :obj:`str`
+    """
+    table = _unpackStrings(arrays, name + '_table')
+    return [table[i] for i in arrays[name].tolist()]
+# end def
+
+
+def _split(values, counts):
+    """
+    Args:
+        values (list): flat list
+        counts (list): of :obj:`int` length of each chunk of `values`
+
+    Returns:
+        list: of :obj:`list` chunks of `values`
+    """
+    chunks = []
+    start = 0
+    for count in counts:
+        chunks.append(values[start:start + count])
+        start += count
+    return chunks
+# end def
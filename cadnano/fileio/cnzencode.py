@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+import json
+import zipfile
+from datetime import datetime
+
+import numpy as np
+
+from cadnano.fileio.v3encode import FORMAT_VERSION
+from cadnano.proxies.cnenum import PointType
+
+CNZ_EXTENSION = '.cnz'
+CNZ_FORMAT_VERSION = '1'
+HEADER_NAME = 'document.json'
+
+OLIGO_COLUMNS = ('id_num', 'idx5p', 'is_5p_fwd', 'is_circular', 'length', 'is_visible')
+
+
+def encodeToFile(filename, document):
+    """Write the document as a zip of uncompressed `.npy` arrays, one per
+    column of the v3 format, and a JSON header of everything else, so the
+    arrays can be read with a memory map when loading, see :mod:`cnzdecode`.
+
+    Args:
+        filename (str): Filename path for writing
+        document (Document): Document to encode
+    """
+    from cadnano.fileio.encode import EncoderforPandas
+    header, arrays = encodeDocument(document)
+    with zipfile.ZipFile(filename, 'w', compression=zipfile.ZIP_STORED) as zf:
+        zf.writestr(HEADER_NAME, json.dumps(header, separators=(',', ':'), cls=EncoderforPandas))
+        for name, array in arrays.items():
+            with zf.open(name + '.npy', 'w', force_zip64=array.nbytes > 0x7fff0000) as fd:
+                np.lib.format.write_array(fd, np.ascontiguousarray(array), allow_pickle=False)
+# end def
+
+
+def encodeDocument(document):
+    """
+    Args:
+        document (Document):
+
+    Returns:
+        tuple: of form (header, arrays) where header is a JSON serializable
+            :obj:`dict` and arrays a :obj:`dict` of :obj:`ndarray` keyed by
+            member name
+    """
+    header = {'format': FORMAT_VERSION,
+              'cnz_format': CNZ_FORMAT_VERSION,
+              'date': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+              'name': '',
+              'parts': [],
+              'modifications': document.modifications()
+              }
+    arrays = {}
+    for i, part in enumerate(document.getParts()):
+        part_header, part_arrays = encodePart(part)
+        header['parts'].append(part_header)
+        prefix = 'part%d/' % i
+        for name, array in part_arrays.items():
+            arrays[prefix + name] = array
+    return header, arrays
+# end def
+
+
+def encodePart(part):
+    """
+    Args:
+        part (Part):
+
+    Returns:
+        tuple: of form (header, arrays) of the part
+    """
+    header = {key: value for key, value in part.getModelProperties().items()
+              if key != 'virtual_helix_order'}
+    header['instance_properties'] = list(part.instanceProperties())
+    header['uuid'] = part.uuid
+    arrays = {}
+
+    id_nums = part.getidNums()
+    ids = np.array(id_nums, dtype=np.int64)
+    if header.get('point_type') != PointType.ARBITRARY:
+        _, origins = part.helixPropertiesAndOrigins(id_nums)
+        arrays['origins'] = np.asarray(origins, dtype=float).reshape((-1, 2))
+        vh_properties = part.vh_properties
+        keys = []
+        for key in vh_properties.keys():
+            if key == 'neighbors':
+                continue
+            column = vh_properties.column(key)[ids]
+            if column.dtype.kind == 'O':
+                _packStrings(arrays, 'vh/' + key, column.tolist())
+            else:
+                arrays['vh/' + key] = column
+            keys.append(key)
+        header['vh_property_keys'] = keys
+
+        neighbors = [part.getVirtualHelixNeighbors(id_num) for id_num in id_nums]
+        arrays['neighbor_counts'] = np.array([len(x) for x in neighbors], dtype=np.int32)
+        arrays['neighbors'] = np.array([x for ns in neighbors for x in ns], dtype=np.int32)
+
+    # strands of each strandset in order, forward first
+    xover_list = []
+    strand_counts = []
+    strand_idxs = []
+    strand_colors = []
+    sizes = []
+    for id_num in id_nums:
+        offset, size = part.getOffsetAndSize(id_num)
+        sizes.append(size)
+        for strandset in part.getStrandSets(id_num):
+            idxs, colors = strandset.dump(xover_list)
+            strand_counts.append(len(idxs))
+            strand_idxs += idxs
+            strand_colors += colors
+    arrays['vh_ids'] = ids.astype(np.int32)
+    arrays['vh_sizes'] = np.array(sizes, dtype=np.int32)
+    arrays['strand_counts'] = np.array(strand_counts, dtype=np.int32).reshape((-1, 2))
+    arrays['strand_idxs'] = np.array(strand_idxs, dtype=np.int32).reshape((-1, 2))
+    _packColors(arrays, 'strand_colors', strand_colors)
+    arrays['xovers'] = np.array(xover_list, dtype=np.int32).reshape((-1, 6))
+    arrays['insertions'] = np.array(list(part.dumpInsertions()), dtype=np.int32).reshape((-1, 3))
+    arrays['virtual_helix_order'] = np.array(part.getProperty('virtual_helix_order'), dtype=np.int32)
+
+    oligos = [oligo.dump() for oligo in part.oligos()]
+    arrays['oligos'] = np.array([[o[key] for key in OLIGO_COLUMNS] for o in oligos],
+                                dtype=np.int32).reshape((-1, len(OLIGO_COLUMNS)))
+    _packStrings(arrays, 'oligo_names', [o['name'] for o in oligos])
+    _packColors(arrays, 'oligo_colors', [o['color'] for o in oligos])
+    sequences = [o['sequence'] for o in oligos]
+    arrays['oligo_has_sequence'] = np.array([seq is not None for seq in sequences], dtype=bool)
+    _packStrings(arrays, 'oligo_sequences', ['' if seq is None else seq for seq in sequences])
+    return header, arrays
+# end def
+
+
+def _packStrings(arrays, name, strings):
+    """Store strings as their concatenated utf-8 bytes `name` and the
+    `name_offsets` of each string in them
+
+    Args:
+        arrays (dict): of :obj:`ndarray` to add to
+        name (str): array name
+        strings (list): of :obj:`str`
+    """
+    encoded = [string.encode('utf-8') for string in strings]
+    arrays[name] = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    arrays[name + '_offsets'] = np.cumsum([0] + [len(x) for x in encoded], dtype=np.int64)
+# end def
+
+
+def _packColors(arrays, name, colors):
+    """Store the few distinct colors of many objects as `name_table` packed
+    with :func:`_packStrings` and the index `name` of each color in it
+
+    Args:
+        arrays (dict): of :obj:`ndarray` to add to
+        name (str): array name
+        colors (list): of :obj:`str`
+    """
+    table = {}
+    index = [table.setdefault(color, len(table)) for color in colors]
+    arrays[name] = np.array(index, dtype=np.int32)
+    _packStrings(arrays, name + '_table', list(table))
+# end def
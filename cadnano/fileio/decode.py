@@ -5,15 +5,20 @@ import os.path
 
 import cadnano.fileio.v2decode as v2decode
 import cadnano.fileio.c25decode as c25decode
+import cadnano.fileio.cnzdecode as cnzdecode
 import cadnano.fileio.v3decode as v3decode
+from cadnano.fileio.cnzencode import CNZ_EXTENSION
 
 
 def decodeFile(filename, document=None, emit_signals=False):
-    with io.open(filename, 'r', encoding='utf-8') as fd:
-        nno_dict = json.load(fd)
     if document is None:
         from cadnano.document import Document
         document = Document()
+    if os.path.splitext(filename)[1].lower() == CNZ_EXTENSION:
+        cnzdecode.decode(document, filename, emit_signals=emit_signals)
+        return document
+    with io.open(filename, 'r', encoding='utf-8') as fd:
+        nno_dict = json.load(fd)
     if 'format' not in nno_dict:
         if os.path.splitext(filename)[1] == '.c25':
             c25decode.decode(document, nno_dict, emit_signals=emit_signals)
@@ -1,19 +1,31 @@
 import io
 import json
+import os.path
 import numpy as np
+import cadnano.fileio.cnzencode as cnzencode
 import cadnano.fileio.v2encode as v2encode
 import cadnano.fileio.v3encode as v3encode
 
 
 def encodeToFile(filename, document, legacy=False):
     """
-    Encodes the document as json object and outputs to file.
+    Encodes the document as json object and outputs to file.  A filename
+    ending with `cnzencode.CNZ_EXTENSION` writes the binary cnz format
+    instead.
 
     Args:
         filename (str): Filename path for writing
         document (Document): Document to encode
         legacy (bool): Export for use with legacy (pre v2.5) cadnano versions.
+
+    Raises:
+        ValueError: legacy export to a cnz file
     """
+    if os.path.splitext(filename)[1].lower() == cnzencode.CNZ_EXTENSION:
+        if legacy:
+            raise ValueError("legacy files can only be json: %s" % filename)
+        cnzencode.encodeToFile(filename, document)
+        return
     json_string = encode(document, legacy)
     with io.open(filename, 'w', encoding='utf-8') as fd:
         fd.write(json_string)
@@ -225,7 +225,7 @@ def decode(document, obj, emit_signals=False):
 
     # need to heal all oligo connections into a continuous
     # oligo for the next steps
-    RefreshOligosCommand(part).redo()
+    RefreshOligosCommand(part, emit_signals=False).redo()
 
     # COLORS, INSERTIONS, SKIPS
     for helix in obj['vstrands']:
@@ -23,8 +23,17 @@ def decode(document, obj, emit_signals=False):
         decodePart(document, part_dict, grid_type=grid_type,
                    emit_signals=emit_signals)
 
-    modifications = obj['modifications']
+    decodeModifications(document, obj['modifications'])
+# end def
+
 
+def decodeModifications(document, modifications):
+    """ Decode the modifications of a deserialized Document dictionary
+
+    Args:
+        document (Document):
+        modifications (dict):
+    """
     for mod_id, item in modifications.items():
         document.createMod(item['props'], mod_id)
         ext_locations = item['ext_locations']
@@ -107,32 +116,44 @@ def decodePart(document, part_dict, grid_type, emit_signals=False):
         document (Document):
         part_dict (dict): deserialized dictionary describing the Part
     """
-    part = document.createNucleicAcidPart(use_undostack=False, grid_type=grid_type)
+    part = document.createNucleicAcidPart(use_undostack=False, grid_type=grid_type,
+                                          single_precision=part_dict.get('single_precision', False))
     part.setActive(True)
 
     vh_id_list = part_dict.get('vh_list')
     vh_props = part_dict.get('virtual_helices')
     origins = part_dict.get('origins')
-    keys = list(vh_props.keys())
 
     if part_dict.get('point_type') == PointType.ARBITRARY:
         # TODO add code to deserialize parts
         pass
-    else:
-        for id_num, size in vh_id_list:
-            x, y = origins[id_num]
-            z = vh_props['z'][id_num]
-            vals = [vh_props[k][id_num] for k in keys]
-            part.createVirtualHelix(x, y, z, size,
-                                    id_num=id_num,
-                                    properties=(keys, vals),
-                                    safe=False,
-                                    use_undostack=False)
-        # end for
+    elif vh_id_list:
+        # allocate all virtual helices with their properties at once
+        id_nums = [id_num for id_num, size in vh_id_list]
+        z_list = vh_props['z']
+        xyz = [(origins[id_num][0], origins[id_num][1], z_list[id_num]) for id_num in id_nums]
+        properties = {key: [values[id_num] for id_num in id_nums]
+                      for key, values in vh_props.items()}
+        part.importVirtualHelices(id_nums, xyz,
+                                  [size for id_num, size in vh_id_list],
+                                  properties)
         # zoom to fit
         if emit_signals:
             part.partZDimensionsChangedSignal.emit(part, *part.zBoundsIds(), True)
 
+    decodeStrands(part, part_dict, emit_signals=emit_signals)
+# end def
+
+
+def decodeStrands(part, part_dict, emit_signals=False):
+    """ Decode the strands, crossovers, oligos, insertions and Part properties
+    of a deserialized Part dictionary into a Part with its virtual helices
+
+    Args:
+        part (NucleicAcidPart):
+        part_dict (dict): deserialized dictionary describing the Part
+    """
+    vh_id_list = part_dict.get('vh_list')
     strands = part_dict['strands']
     strand_index_list = strands['indices']
     color_list = strands['properties']
@@ -143,28 +164,14 @@ def decodePart(document, part_dict, grid_type, emit_signals=False):
             fwd_strand_set, rev_strand_set = part.getStrandSets(id_num)
             fwd_idxs, rev_idxs = idx_set
             fwd_colors, rev_colors = color_list[i]
-            for idxs, color in zip(fwd_idxs, fwd_colors):
-                low_idx, high_idx = idxs
-                fwd_strand_set.createDeserializedStrand(low_idx, high_idx, color,
-                                                        use_undostack=False)
-            for idxs, color in zip(rev_idxs, rev_colors):
-                low_idx, high_idx = idxs
-                rev_strand_set.createDeserializedStrand(low_idx, high_idx, color,
-                                                        use_undostack=False)
+            fwd_strand_set.importStrands(fwd_idxs, fwd_colors, emit_signals=emit_signals)
+            rev_strand_set.importStrands(rev_idxs, rev_colors, emit_signals=emit_signals)
             part.refreshSegments(id_num)   # update segments
     # end for
 
-    xovers = part_dict['xovers']
-    for from_id, from_is_fwd, from_idx, to_id, to_is_fwd, to_idx in xovers:
-        from_strand = part.getStrand(from_is_fwd, from_id, from_idx)
-        to_strand = part.getStrand(to_is_fwd, to_id, to_idx)
-        part.createXover(from_strand, from_idx,
-                         to_strand, to_idx,
-                         update_oligo=False,
-                         use_undostack=False)
-    # end for
+    part.importXovers(part_dict['xovers'])
 
-    RefreshOligosCommand(part).redo()
+    RefreshOligosCommand(part, emit_signals=False).redo()
     for oligo in part_dict['oligos']:
         id_num = oligo['id_num']
         idx = oligo['idx5p']
@@ -178,7 +185,7 @@ def decodePart(document, part_dict, grid_type, emit_signals=False):
         if sequence is not None:
             this_oligo.applySequence(sequence, use_undostack=False)
         if name is not None:
-            this_oligo.setProperty('name', name)
+            this_oligo.setProperty('name', name, use_undostack=False)
     # end for
 
     # INSERTIONS, SKIPS
@@ -200,7 +207,7 @@ def decodePart(document, part_dict, grid_type, emit_signals=False):
     vh_order = part_dict['virtual_helix_order']
     if vh_order:
         # print("import order", vh_order)
-        part.setImportedVHelixOrder(vh_order)
+        part.setImportedVHelixOrder(vh_order, use_undostack=False)
 
     # Restore additional Part properties
     for key in ('name',
@@ -296,7 +303,7 @@ def importToPart(part_instance, copy_dict, offset=None, use_undostack=True, igno
                          update_oligo=use_undostack,
                          use_undostack=use_undostack)
     if not use_undostack:
-        RefreshOligosCommand(part).redo()
+        RefreshOligosCommand(part, emit_signals=False).redo()
 
     # INSERTIONS, SKIPS
     for id_num, idx, length in copy_dict['insertions']:
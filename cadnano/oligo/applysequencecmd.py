@@ -10,45 +10,41 @@ class ApplySequenceCommand(UndoCommand):
         self._old_sequence = oligo.sequence()
     # end def
 
-    def redo(self):
+    def _applySequence(self, sequence):
+        """Apply `sequence` from the 5' end of the oligo and copy the
+        complement of each strand onto the overlapping strands
+
+        Args:
+            sequence (str or list): or ``None`` to clear the sequence
+
+        Returns:
+            list: of :class:`Oligo` whose sequence changed
+        """
         olg = self._oligo
-        n_s = ''.join(self._new_sequence) if self._new_sequence else None
-        n_s_original = self._new_sequence
+        seq = ''.join(sequence).encode('utf-8') if sequence else None
         oligo_list = [olg]
         for strand in olg.strand5p().generator3pStrand():
-            used_seq, n_s = strand.setSequence(n_s)
-            # get the compliment ahead of time
-            used_seq = util.comp(used_seq) if used_seq else None
+            used_seq, seq = strand.setSequence(seq)
+            # get the compliment ahead of time, from the low to the high index
+            comp_seq = strand._sequence.translate(util.complement_bytes) if used_seq else None
             for comp_strand in strand.getComplementStrands():
-                comp_strand.setComplementSequence(used_seq, strand)
+                comp_strand.setComplementSequence(comp_seq, strand)
                 oligo_list.append(comp_strand.oligo())
             # end for
             # as long as the new Applied Sequence is not None
-            if n_s is None and n_s_original:
+            if seq is None and sequence:
                 break
         # end for
-        for oligo in oligo_list:
+        return oligo_list
+    # end def
+
+    def redo(self):
+        for oligo in self._applySequence(self._new_sequence):
             oligo.oligoSequenceAddedSignal.emit(oligo)
     # end def
 
     def undo(self):
-        olg = self._oligo
-        o_s = ''.join(self._old_sequence) if self._old_sequence else None
-
-        oligo_list = [olg]
-
-        for strand in olg.strand5p().generator3pStrand():
-            used_seq, o_s = strand.setSequence(o_s)
-
-            # get the compliment ahead of time
-            used_seq = util.comp(used_seq) if used_seq else None
-            for comp_strand in strand.getComplementStrands():
-                comp_strand.setComplementSequence(used_seq, strand)
-                oligo_list.append(comp_strand.oligo())
-            # end for
-        # for
-
-        for oligo in oligo_list:
+        for oligo in self._applySequence(self._old_sequence):
             oligo.oligoSequenceAddedSignal.emit(oligo)
     # end def
 # end class
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 import sys
 import traceback
+from bisect import bisect_right
+from itertools import accumulate
 
 from cadnano import util
 from cadnano.proxies.cnobject import CNObject
@@ -18,6 +20,8 @@ MAX_HIGHLIGHT_LENGTH = 800
 
 PROPERTY_KEYS = ['name', 'color', 'length', 'is_visible']
 ALL_KEYS = ['id_num', 'idx5p', 'is_circular'] + PROPERTY_KEYS
+SEQUENCE_EXPORT_KEYS = ('Start', 'End', 'Color', 'Mod5',
+                        'Sequence', 'Mod3', 'AbstractSequence')
 
 
 class CircularOligoException(Exception):
@@ -45,6 +49,8 @@ class Oligo(CNObject):
         self._part = part
         self._strand5p = None
         self._is_circular = False
+        self._length_table = None
+        self._length_table_key = None
         self._props = {'name': "oligo%s" % str(id(self))[-4:],
                        'color': "#cc0000" if color is None else color,
                        'length': length,
@@ -273,15 +279,14 @@ class Oligo(CNObject):
             return None
     # end def
 
-    def sequenceExport(self, output):
-        """ Iterative appending to argument `output` which is a dictionary of
-        lists
-
-        Args:
-            output (dict): dictionary with keys given in `NucleicAcidPart.getSequences`
-
+    def sequenceExportRow(self):
+        """
         Returns:
-            dict: output with this oligo's values appended for each key
+            tuple: of :obj:`str` export values of this oligo in the order of
+                `SEQUENCE_EXPORT_KEYS`
+
+        Raises:
+            CircularOligoException: the oligo is circular
         """
         part = self.part()
         vh_num5p = self.strand5p().idNum()
@@ -306,19 +311,22 @@ class Oligo(CNObject):
                                                             ModType.END_3PRIME)
         seq = ''.join(seq)
         seq = modseq5p + seq + modseq3p
-        # output = "%d[%d]\t%d[%d]\t%s\t%s\t%s\t%s\t(%s)\n" % \
-        #          (vh_num5p, idx5p, vh_num3p, idx3p, self.getColor(),
-        #           modseq5p_name, seq, modseq3p_name, a_seq)
-        # these are the keys
-        # keys = ['Start','End','Color', 'Mod5',
-        #         'Sequence','Mod3','AbstractSequence']
-        output['Start'].append("%d[%d]" % (vh_num5p, idx5p))
-        output['End'].append("%d[%d]" % (vh_num3p, idx3p))
-        output['Color'].append(self.getColor())
-        output['Mod5'].append(modseq5p_name)
-        output['Sequence'].append(seq)
-        output['Mod3'].append(modseq3p_name)
-        output['AbstractSequence'].append(a_seq)
+        return ("%d[%d]" % (vh_num5p, idx5p), "%d[%d]" % (vh_num3p, idx3p),
+                self.getColor(), modseq5p_name, seq, modseq3p_name, a_seq)
+    # end def
+
+    def sequenceExport(self, output):
+        """ Iterative appending to argument `output` which is a dictionary of
+        lists
+
+        Args:
+            output (dict): dictionary with keys given in `SEQUENCE_EXPORT_KEYS`
+
+        Returns:
+            dict: output with this oligo's values appended for each key
+        """
+        for key, value in zip(SEQUENCE_EXPORT_KEYS, self.sequenceExportRow()):
+            output[key].append(value)
         return output
     # end def
 
@@ -392,6 +400,25 @@ class Oligo(CNObject):
         self._is_circular = bool
     # end def
 
+    def _lengthTable(self):
+        """The strands of the oligo in 5' to 3' order and the offset of each
+        from the 5' end.  Cached until a strand of the part is connected,
+        resized or has its insertions changed.
+
+        Returns:
+            tuple: of form (strands, offsets) where ``offsets`` has one more
+                item than ``strands``, the length of the oligo
+        """
+        key = (self._strand5p, self._is_circular, self._part._strand_version)
+        if self._length_table_key != key:
+            strands = list(self._strand5p.generator3pStrand())
+            offsets = [0]
+            offsets += accumulate(strand.totalLength() for strand in strands)
+            self._length_table = (strands, offsets)
+            self._length_table_key = key
+        return self._length_table
+    # end def
+
     def getStrandLengths(self):
         """
         Traverses the oligo and builds up a list of each strand's total length,
@@ -400,11 +427,8 @@ class Oligo(CNObject):
         Returns:
             list: lengths of individual strands in the oligo
         """
-        strand5p = self.strand5p()
-        strand_lengths = []
-        for strand in strand5p.generator3pStrand():
-            strand_lengths.append(strand.totalLength())
-        return strand_lengths
+        strands, offsets = self._lengthTable()
+        return [offsets[i + 1] - offsets[i] for i in range(len(strands))]
 
     def getNumberOfBasesToEachXover(self, use_3p_idx=False):
         """
@@ -414,15 +438,10 @@ class Oligo(CNObject):
         Args:
             use_3p_idx: Adds a 1-base office to return 3' xover idx instead of
         """
-        strand5p = self.strand5p()
-        num_bases_to_xovers = []
+        strands, offsets = self._lengthTable()
         offset = 1 if use_3p_idx else 0  # 3p xover idx is always the next base
-        i = 0
-        for strand in strand5p.generator3pStrand():
-            if strand.connection3p():
-                i = i + strand.totalLength()
-                num_bases_to_xovers.append(i+offset)
-        return num_bases_to_xovers
+        return [offsets[i + 1] + offset for i, strand in enumerate(strands)
+                if strand.connection3p()]
 
     def splitAtAbsoluteLengths(self, len_list):
         self._part.splitOligoAtAbsoluteLengths(self, len_list)
@@ -442,18 +461,41 @@ class Oligo(CNObject):
 
         Args:
             len_for_pos: length in bases for position lookup
+
+        Returns:
+            tuple: of form (vh, strandset, baseidx) or ``None`` if
+                `len_for_pos` is not less than the length of the oligo
         """
-        strand5p = self.strand5p()
-        temp_len = 0
-        for strand in strand5p.generator3pStrand():
-            if (temp_len + strand.totalLength()) > len_for_pos:
-                vh = strand.idNum()
-                strandset = strand.strandType()
-                baseidx = strand.idx5Prime() + len_for_pos - temp_len
-                return (vh, strandset, baseidx)
+        return self.getAbsolutePositionsAtLengths((len_for_pos,))[0]
+    # end def
+
+    def getAbsolutePositionsAtLengths(self, len_list):
+        """Batch version of :meth:`getAbsolutePositionAtLength` that looks
+        up every length with a bisect of the cached length table.
+
+        Args:
+            len_list (iterable): of :obj:`int` lengths in bases from the 5'
+                end of the oligo
+
+        Returns:
+            list: of :obj:`tuple` of form (vh, strandset, baseidx), or
+                ``None`` for lengths outside of the oligo, in the order of
+                `len_list`.  See :meth:`Strand.idxAtLength`
+        """
+        strands, offsets = self._lengthTable()
+        num_strands = len(strands)
+        positions = []
+        for len_for_pos in len_list:
+            # the last strand starting at or before the length skips any
+            # strands of zero length
+            i = max(bisect_right(offsets, len_for_pos) - 1, 0)
+            idx = strands[i].idxAtLength(len_for_pos - offsets[i]) if i < num_strands else None
+            if idx is None:
+                positions.append(None)
             else:
-                temp_len += strand.totalLength()
-        return None
+                strand = strands[i]
+                positions.append((strand.idNum(), strand.strandType(), idx))
+        return positions
     # end def
 
     def setPart(self, part):
@@ -483,13 +525,10 @@ class Oligo(CNObject):
     # end def
 
     def refreshLength(self, emit_signals=False):
-        temp = self.strand5p()
-        if not temp:
+        if not self._strand5p:
             return
-        length = 0
-        for strand in temp.generator3pStrand():
-            length += strand.totalLength()
-        self._setLength(length, emit_signals)
+        strands, offsets = self._lengthTable()
+        self._setLength(offsets[-1], emit_signals)
     # end def
 
     def removeFromPart(self, emit_signals=False):
@@ -1,6 +1,5 @@
-from ast import literal_eval
-import bisect
 from cadnano.proxies.cnproxy import UndoCommand
+from .neighborgraph import NeighborGraph
 
 
 class CreateVirtualHelixCommand(UndoCommand):
@@ -32,7 +31,7 @@ class CreateVirtualHelixCommand(UndoCommand):
         if safe:
             self.neighbors = []
         else:
-            self.neighbors = literal_eval(self.values[self.keys.index('neighbors')])
+            self.neighbors = NeighborGraph.fromString(self.values[self.keys.index('neighbors')])
 
         self.threshold = 2.1*part.radius()
         self.safe = safe
@@ -51,13 +50,8 @@ class CreateVirtualHelixCommand(UndoCommand):
                 self.neighbors = part._getVirtualHelixOriginNeighbors(id_num, self.threshold)
 
             neighbors = self.neighbors
-            part.vh_properties.loc[id_num, 'neighbors'] = str(list(neighbors))
-            for neighbor_id in neighbors:
-                nneighbors = literal_eval(
-                    part.getVirtualHelixProperties(neighbor_id, 'neighbors')
-                )
-                bisect.insort_left(nneighbors, id_num)
-                part.vh_properties.loc[neighbor_id, 'neighbors'] = str(list(nneighbors))
+            part._neighbor_graph.setNeighbors(id_num, neighbors)
+            part._neighbor_graph.link(id_num, neighbors)
         else:
             neighbors = self.neighbors
         if self.keys is not None:
@@ -73,10 +67,7 @@ class CreateVirtualHelixCommand(UndoCommand):
         part = self.part
         id_num = self.id_num
         # since we're hashing on the object in the views do this first
-        for neighbor_id in self.neighbors:
-            nneighbors = literal_eval(part.getVirtualHelixProperties(neighbor_id, 'neighbors'))
-            nneighbors.remove(id_num)
-            part.vh_properties.loc[neighbor_id, 'neighbors'] = str(list(nneighbors))
+        part._neighbor_graph.unlink(id_num, self.neighbors)
 
         # signaling the view is two parts to clean up signals properly
         # and then allow the views to refresh
@@ -88,3 +79,65 @@ class CreateVirtualHelixCommand(UndoCommand):
         part.partVirtualHelixRemovedSignal.emit(part, id_num)
     # end def
 # end class
+
+
+class BatchCreateVirtualHelicesCommand(UndoCommand):
+    """Create many virtual helices at once.  Coordinates and neighbors are
+    computed for the whole batch and a single `partVirtualHelicesAddedSignal`
+    is emitted instead of one `partVirtualHelixAddedSignal` per virtual helix
+    """
+
+    def __init__(self, part, origins, lengths, id_nums):
+        """
+        Args:
+            part (NucleicAcidPart):
+            origins (list): of :obj:`tuple` (x, y, z) of each virtual helix
+            lengths (list): of :obj:`int` length of each virtual helix
+            id_nums (list): of :obj:`int` reserved ID numbers
+        """
+        super(BatchCreateVirtualHelicesCommand, self).__init__("create virtual helices")
+        self.part = part
+        self.id_nums = list(id_nums)
+        for id_num in self.id_nums:
+            part._reserveIdNum(id_num)
+        self.origins = origins
+        self.lengths = lengths
+        self.color = part.getColor()
+        self.neighbors = None
+        self.threshold = 2.1*part.radius()
+        self.old_limits = None
+    # end def
+
+    def redo(self):
+        part = self.part
+        id_nums = self.id_nums
+        self.old_limits = part.getVirtualHelixOriginLimits()
+        part._createHelices(id_nums, self.origins, (0, 0, 1), self.lengths, self.color)
+
+        if self.neighbors is None:
+            self.neighbors = {id_num: [] for id_num in id_nums}
+            pairs = part._blockOriginNeighbors(set(id_nums), self.threshold, include_internal=True)
+            for id_num, neighbor_id in pairs:
+                self.neighbors[id_num].append(neighbor_id)
+        graph = part._neighbor_graph
+        batch = set(id_nums)
+        for id_num, neighbors in self.neighbors.items():
+            graph.setNeighbors(id_num, neighbors)
+            # links within the batch are already symmetric
+            graph.link(id_num, [x for x in neighbors if x not in batch])
+        part.partVirtualHelicesAddedSignal.emit(part, id_nums)
+    # end def
+
+    def undo(self):
+        part = self.part
+        graph = part._neighbor_graph
+        for id_num in self.id_nums:
+            graph.unlink(id_num, self.neighbors[id_num])
+        for id_num in reversed(self.id_nums):
+            part.partVirtualHelixRemovingSignal.emit(
+                part, id_num, part.getVirtualHelix(id_num), self.neighbors[id_num])
+            part._removeHelix(id_num)
+            part.partVirtualHelixRemovedSignal.emit(part, id_num)
+        part.setVirtualHelixOriginLimits(self.old_limits)
+    # end def
+# end class
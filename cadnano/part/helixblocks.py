@@ -0,0 +1,299 @@
+import numpy as np
+
+
+class HelixBlock(object):
+    """Growable storage of the axis, forward and reverse points of a single
+    virtual helix.  Points live in rows `[lo:hi]` of arrays with spare
+    capacity at both ends so appending and prepending is amortized O(1)
+    per point
+    """
+    __slots__ = ('axis_pts', 'fwd_pts', 'rev_pts', 'lo', 'hi', 'z_bounds')
+
+    def __init__(self, dtype=float):
+        self.axis_pts = np.empty((0, 3), dtype=dtype)
+        self.fwd_pts = np.empty((0, 3), dtype=dtype)
+        self.rev_pts = np.empty((0, 3), dtype=dtype)
+        self.lo = 0
+        self.hi = 0
+        self.z_bounds = None
+    # end def
+
+    def size(self):
+        return self.hi - self.lo
+    # end def
+
+    def views(self):
+        lo, hi = self.lo, self.hi
+        return (self.axis_pts[lo:hi],
+                self.fwd_pts[lo:hi],
+                self.rev_pts[lo:hi])
+    # end def
+
+    def _reserve(self, num_points, is_right):
+        """Make room for `num_points` on one end, reallocating with headroom
+        on both ends when the spare capacity is exhausted
+        """
+        lo, hi = self.lo, self.hi
+        capacity = len(self.axis_pts)
+        if is_right and hi + num_points <= capacity:
+            return
+        if not is_right and lo - num_points >= 0:
+            return
+        size = hi - lo
+        new_size = size + num_points
+        new_capacity = max(2*new_size, 16)
+        new_lo = (new_capacity - new_size) // 2
+        if not is_right:
+            new_lo += num_points
+        for attr in ('axis_pts', 'fwd_pts', 'rev_pts'):
+            old = getattr(self, attr)
+            new = np.full((new_capacity, 3), np.inf, dtype=old.dtype)
+            new[new_lo:new_lo + size] = old[lo:hi]
+            setattr(self, attr, new)
+        self.lo, self.hi = new_lo, new_lo + size
+    # end def
+
+    def add(self, points, is_right):
+        new_axis_pts, new_fwd_pts, new_rev_pts = points
+        num_points = len(new_axis_pts)
+        self._reserve(num_points, is_right)
+        if is_right:
+            lo, hi = self.hi, self.hi + num_points
+            self.hi = hi
+        else:
+            lo, hi = self.lo - num_points, self.lo
+            self.lo = lo
+        self.axis_pts[lo:hi] = new_axis_pts
+        self.fwd_pts[lo:hi] = new_fwd_pts
+        self.rev_pts[lo:hi] = new_rev_pts
+        self.z_bounds = None
+    # end def
+
+    def trim(self, length, is_right):
+        if is_right:
+            self.hi -= length
+        else:
+            self.lo += length
+        self.z_bounds = None
+    # end def
+
+    def zBounds(self):
+        """
+        Returns:
+            tuple: of :obj:`float` (z_min, z_max) of the axis points
+        """
+        if self.z_bounds is None:
+            z = self.axis_pts[self.lo:self.hi, 2]
+            self.z_bounds = (z.min(), z.max()) if len(z) else (np.inf, -np.inf)
+        return self.z_bounds
+    # end def
+# end class
+
+
+class HelixBlocks(object):
+    """Chunked coordinate storage for a `NucleicAcidPart` where every
+    virtual helix owns a :class:`HelixBlock`.  Resizing a virtual helix only
+    touches its own block.  The contiguous global arrays and offsets used
+    by vectorized queries are materialized lazily by :meth:`compact`
+    """
+
+    def __init__(self, dtype=float, index_dtype=int):
+        """
+        Args:
+            dtype (type): optional, NumPy dtype of the points. Default is
+                :obj:`float`
+            index_dtype (type): optional, NumPy dtype of the compacted ID
+                numbers and indices. Default is :obj:`int`
+        """
+        self._dtype = dtype
+        self._index_dtype = index_dtype
+        self._blocks = {}
+        self._sorted_id_nums = []
+        self._offsets_valid = False
+        self._layout_valid = False
+        self._dirty = set()
+        self._compacted = None
+        self.total_points = 0
+    # end def
+
+    def __contains__(self, id_num):
+        return id_num in self._blocks
+
+    def create(self, id_num):
+        self._blocks[id_num] = HelixBlock(self._dtype)
+        self._layoutChanged()
+    # end def
+
+    def remove(self, id_num):
+        block = self._blocks.pop(id_num)
+        self.total_points -= block.size()
+        self._layoutChanged()
+    # end def
+
+    def _layoutChanged(self):
+        self._sorted_id_nums = None
+        self._offsets_valid = False
+        self._layout_valid = False
+    # end def
+
+    def views(self, id_num):
+        """
+        Returns:
+            tuple: of :obj:'ndarray' views of the form::
+
+                (axis_pts, fwd_pts, rev_pts)
+        """
+        return self._blocks[id_num].views()
+    # end def
+
+    def axisPoint(self, id_num, idx):
+        return self._blocks[id_num].views()[0][idx]
+    # end def
+
+    def size(self, id_num):
+        return self._blocks[id_num].size()
+    # end def
+
+    def add(self, id_num, points, is_right):
+        self._blocks[id_num].add(points, is_right)
+        self.total_points += len(points[0])
+        self._layoutChanged()
+    # end def
+
+    def trim(self, id_num, length, is_right):
+        self._blocks[id_num].trim(length, is_right)
+        self.total_points -= length
+        self._layoutChanged()
+    # end def
+
+    def set(self, id_num, points, idx_start):
+        block = self._blocks[id_num]
+        new_axis_pts, new_fwd_pts, new_rev_pts = points
+        lo = block.lo + idx_start
+        hi = lo + len(new_axis_pts)
+        block.axis_pts[lo:hi] = new_axis_pts
+        block.fwd_pts[lo:hi] = new_fwd_pts
+        block.rev_pts[lo:hi] = new_rev_pts
+        self.invalidate([id_num])
+    # end def
+
+    def translate(self, id_num, delta):
+        """
+        Args:
+            id_num (int): virtual helix ID number
+            delta (array-like): of :obj:`float` of length 3
+        """
+        for pts in self._blocks[id_num].views():
+            pts += delta  # use += to modify the view
+        self.invalidate([id_num])
+    # end def
+
+    def invalidate(self, id_nums):
+        """Mark the points of virtual helices changed in place, for instance
+        after a translation of the views returned by :meth:`views`
+        """
+        blocks = self._blocks
+        for id_num in id_nums:
+            block = blocks.get(id_num)
+            if block is not None:
+                block.z_bounds = None
+        self._dirty.update(id_nums)
+    # end def
+
+    def sortedIdNums(self):
+        if self._sorted_id_nums is None:
+            self._sorted_id_nums = sorted(self._blocks)
+        return self._sorted_id_nums
+    # end def
+
+    def refreshOffsets(self, offset_and_size):
+        """Write the offsets of the compacted layout into `offset_and_size`
+
+        Args:
+            offset_and_size (list): of :obj:`tuple` (offset, size) indexed by
+                ID number
+        """
+        if self._offsets_valid:
+            return
+        blocks = self._blocks
+        offset = 0
+        for id_num in self.sortedIdNums():
+            size = blocks[id_num].size()
+            offset_and_size[id_num] = (offset, size)
+            offset += size
+        self._offsets_valid = True
+    # end def
+
+    def isCompact(self):
+        return self._layout_valid and not self._dirty
+    # end def
+
+    def compact(self, offset_and_size):
+        """Materialize the global point arrays.  If only point values
+        changed since the last call, only those virtual helices are copied
+
+        Args:
+            offset_and_size (list): of :obj:`tuple` (offset, size) indexed by
+                ID number
+
+        Returns:
+            tuple: of :obj:`ndarray` of the form::
+
+                (axis_pts, fwd_pts, rev_pts, id_nums, indices)
+        """
+        self.refreshOffsets(offset_and_size)
+        blocks = self._blocks
+        if self._layout_valid:
+            axis_pts, fwd_pts, rev_pts, _, _ = self._compacted
+            for id_num in self._dirty:
+                if id_num not in blocks:
+                    continue
+                offset, size = offset_and_size[id_num]
+                block_axis_pts, block_fwd_pts, block_rev_pts = blocks[id_num].views()
+                axis_pts[offset:offset + size] = block_axis_pts
+                fwd_pts[offset:offset + size] = block_fwd_pts
+                rev_pts[offset:offset + size] = block_rev_pts
+            self._dirty = set()
+            return self._compacted
+
+        id_num_list = self.sortedIdNums()
+        total_points = self.total_points
+        dtype = self._dtype
+        axis_pts = np.empty((total_points, 3), dtype=dtype)
+        fwd_pts = np.empty((total_points, 3), dtype=dtype)
+        rev_pts = np.empty((total_points, 3), dtype=dtype)
+        sizes = np.empty((len(id_num_list),), dtype=int)
+        for i, id_num in enumerate(id_num_list):
+            offset, size = offset_and_size[id_num]
+            block_axis_pts, block_fwd_pts, block_rev_pts = blocks[id_num].views()
+            axis_pts[offset:offset + size] = block_axis_pts
+            fwd_pts[offset:offset + size] = block_fwd_pts
+            rev_pts[offset:offset + size] = block_rev_pts
+            sizes[i] = size
+        index_dtype = self._index_dtype
+        id_nums = np.repeat(np.array(id_num_list, dtype=index_dtype), sizes)
+        offsets = np.cumsum(sizes) - sizes
+        indices = (np.arange(total_points) - np.repeat(offsets, sizes)).astype(index_dtype)
+        self._compacted = (axis_pts, fwd_pts, rev_pts, id_nums, indices)
+        self._layout_valid = True
+        self._dirty = set()
+        return self._compacted
+    # end def
+
+    def zBoundsIds(self):
+        """
+        Returns:
+            tuple: of :obj:`int`, of form (ID_z_min, ID_z_max)
+        """
+        id_z_min = id_z_max = -1
+        z_min, z_max = np.inf, -np.inf
+        blocks = self._blocks
+        for id_num in self.sortedIdNums():
+            lo, hi = blocks[id_num].zBounds()
+            if lo < z_min:
+                z_min, id_z_min = lo, id_num
+            if hi > z_max:
+                z_max, id_z_max = hi, id_num
+        return id_z_min, id_z_max
+    # end def
+# end class
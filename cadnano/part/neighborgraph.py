@@ -0,0 +1,147 @@
+import numpy as np
+
+_EMPTY = np.empty((0,), dtype=int)
+_EMPTY.flags.writeable = False
+
+
+class NeighborGraph(object):
+    """Adjacency of virtual helices stored as a sorted :obj:`int` array of
+    neighbor ID numbers per virtual helix.
+
+    The file format stores the neighbors of a virtual helix as a string of a
+    list, see :meth:`toString` and :meth:`fromString`.  Virtual helices whose
+    adjacency changed are tracked so the string form only needs to be
+    regenerated for those, see :meth:`popChanged`.
+    """
+
+    def __init__(self):
+        self._adjacency = {}
+        """dict: of form {id_num: sorted ndarray of neighbor ID numbers}"""
+        self._changed = set()
+    # end def
+
+    def __contains__(self, id_num):
+        return id_num in self._adjacency
+
+    def copy(self):
+        """
+        Returns:
+            NeighborGraph: a new graph with the same contents
+        """
+        new_graph = NeighborGraph()
+        new_graph._adjacency = self._adjacency.copy()   # arrays are never modified in place
+        new_graph._changed = set(self._changed)
+        return new_graph
+    # end def
+
+    def neighbors(self, id_num):
+        """
+        Args:
+            id_num (int): virtual helix ID number
+
+        Returns:
+            ndarray: read only sorted neighbor ID numbers of `id_num`
+        """
+        return self._adjacency.get(id_num, _EMPTY)
+    # end def
+
+    def setNeighbors(self, id_num, neighbors):
+        """Replace the neighbors of `id_num` only.  The neighbors of the
+        neighbors are not updated, see :meth:`link` for that
+
+        Args:
+            id_num (int): virtual helix ID number
+            neighbors (iterable): of :obj:`int` neighbor ID numbers
+
+        Returns:
+            bool: ``True`` if the neighbors changed
+        """
+        new_neighbors = np.unique(np.fromiter(neighbors, dtype=int))
+        new_neighbors.flags.writeable = False
+        old_neighbors = self._adjacency.get(id_num)
+        if old_neighbors is not None and np.array_equal(old_neighbors, new_neighbors):
+            return False
+        self._adjacency[id_num] = new_neighbors
+        self._changed.add(id_num)
+        return True
+    # end def
+
+    def _insert(self, id_num, neighbor_id):
+        neighbors = self.neighbors(id_num)
+        i = np.searchsorted(neighbors, neighbor_id)
+        if i < len(neighbors) and neighbors[i] == neighbor_id:
+            return
+        new_neighbors = np.insert(neighbors, i, neighbor_id)
+        new_neighbors.flags.writeable = False
+        self._adjacency[id_num] = new_neighbors
+        self._changed.add(id_num)
+    # end def
+
+    def _discard(self, id_num, neighbor_id):
+        neighbors = self.neighbors(id_num)
+        i = np.searchsorted(neighbors, neighbor_id)
+        if i == len(neighbors) or neighbors[i] != neighbor_id:
+            return
+        new_neighbors = np.delete(neighbors, i)
+        new_neighbors.flags.writeable = False
+        self._adjacency[id_num] = new_neighbors
+        self._changed.add(id_num)
+    # end def
+
+    def link(self, id_num, neighbor_ids):
+        """Add `id_num` to the neighbors of each of `neighbor_ids`
+
+        Args:
+            id_num (int): virtual helix ID number
+            neighbor_ids (iterable): of :obj:`int` neighbor ID numbers
+        """
+        for neighbor_id in neighbor_ids:
+            self._insert(neighbor_id, id_num)
+    # end def
+
+    def unlink(self, id_num, neighbor_ids):
+        """Remove `id_num` from the neighbors of each of `neighbor_ids`
+
+        Args:
+            id_num (int): virtual helix ID number
+            neighbor_ids (iterable): of :obj:`int` neighbor ID numbers
+        """
+        for neighbor_id in neighbor_ids:
+            self._discard(neighbor_id, id_num)
+    # end def
+
+    def popChanged(self):
+        """
+        Returns:
+            set: ID numbers whose neighbors changed since the last call
+        """
+        changed = self._changed
+        self._changed = set()
+        return changed
+    # end def
+
+    @staticmethod
+    def toString(neighbors):
+        """
+        Args:
+            neighbors (ndarray): of :obj:`int`
+
+        Returns:
+            str: the file format of a neighbor list i.e. ``'[1, 5]'``
+        """
+        return str(neighbors.tolist())
+    # end def
+
+    @staticmethod
+    def fromString(neighbors):
+        """
+        Args:
+            neighbors (str): of form ``'[1, 5]'``
+
+        Returns:
+            list: of :obj:`int` neighbor ID numbers
+        """
+        neighbors = neighbors.strip()[1:-1]
+        return [int(x) for x in neighbors.split(',')] if neighbors.strip() else []
+    # end def
+# end class
@@ -1,16 +1,17 @@
 # -*- coding: utf-8 -*-
+import csv
+import io
 import math
-from ast import literal_eval
 from bisect import bisect_left
 from collections import defaultdict, deque
 from heapq import heapify, heappush, nsmallest
 from itertools import count as icount
 
 import numpy as np
-import pandas as pd
 
 from cadnano import util
-from cadnano.oligo import RemoveOligoCommand
+from cadnano.decorators.insertionindex import InsertionIndex
+from cadnano.oligo import RemoveOligoCommand, SEQUENCE_EXPORT_KEYS
 from cadnano.proxies.cnenum import GridType, PartType, PointType, StrandType
 from cadnano.proxies.cnobject import CNObject
 from cadnano.proxies.cnproxy import ProxySignal
@@ -18,11 +19,18 @@ from cadnano.part.part import Part
 from cadnano.removeinstancecmd import RemoveInstanceCommand
 from cadnano.setpropertycmd import SetVHPropertyCommand
 from cadnano.strandset import SplitCommand, StrandSet
-from .createvhelixcmd import CreateVirtualHelixCommand
+from .createvhelixcmd import BatchCreateVirtualHelicesCommand, CreateVirtualHelixCommand
+from .helixblocks import HelixBlocks
+from .neighborgraph import NeighborGraph
+from .origingrid import OriginGrid
+from .parametrichelices import ParametricHelices
+from .pointindex import PointIndex
 from .removevhelixcmd import RemoveVirtualHelixCommand
 from .resizevirtualhelixcmd import ResizeVirtualHelixCommand
+from .rotationsweep import RotationSweep
 from .translatevhelixcmd import TranslateVirtualHelicesCommand
 from .virtualhelix import VirtualHelix
+from .vhpropertystore import VHPropertyStore
 from .xovercmds import CreateXoverCommand, RemoveXoverCommand
 
 """
@@ -65,14 +73,12 @@ def _defaultProperties(id_num, grid_type=GridType.HONEYCOMB):
 
 
 VH_PROPERTY_KEYS = set([x for x in _defaultProperties(0)[0]])
-Z_PROP_INDEX = -1  # index for Dataframe.iloc calls
 
 
-def _defaultDataFrame(size, grid_type=GridType.HONEYCOMB):
+def _defaultPropertyStore(size, grid_type=GridType.HONEYCOMB):
     dummy_id_num = 999
     columns, row = _defaultProperties(dummy_id_num, grid_type)
-    df = pd.DataFrame([row for i in range(size)], columns=columns)
-    return df
+    return VHPropertyStore(columns, row, size)
 # end def
 
 
@@ -82,6 +88,8 @@ DEFAULT_RADIUS = 1.0  # nm - It was set to 1.25 before
 HONEYCOMB_SUB_STEP_SIZE = 7
 SQUARE_SUB_STEP_SIZE = 8
 
+_OLIGO_SIGNAL_NAMES = ('strandHasNewOligoSignal', 'strandConnectionChangedSignal')
+
 
 class NucleicAcidPart(Part):
     """NucleicAcidPart is a group of VirtualHelix items that are on the same
@@ -119,6 +127,15 @@ class NucleicAcidPart(Part):
         'z'
     ]
 
+    # properties that change the crossover candidates of a virtual helix
+    _XOVER_PROPERTY_KEYS = frozenset([
+        'bases_per_repeat',
+        'eulerZ',
+        'helical_pitch',
+        'minor_groove_angle',
+        'turns_per_repeat'
+    ])
+
     @classmethod
     def _count(cls):
         NucleicAcidPart.__count += 1
@@ -132,10 +149,14 @@ class NucleicAcidPart(Part):
             return
 
         self._radius = DEFAULT_RADIUS     # probably a property???
-        self._insertions = defaultdict(dict)  # dict of insertions per virtualhelix
+        self._insertions = defaultdict(InsertionIndex)  # dict of insertions per virtualhelix
         self._mods = {'int_instances': {},
                       'ext_instances': {}}
         self._oligos = set()
+        self._strand_version = 0
+        """int: incremented when strand connections, indices or insertions
+        change, see `Oligo` length tables
+        """
 
         # Helix parameters
         if grid_type == GridType.HONEYCOMB:
@@ -173,19 +194,36 @@ class NucleicAcidPart(Part):
         gps['virtual_helix_order'] = []
         gps['point_type'] = kwargs.get('point_type', PointType.Z_ONLY)
         gps['workplane_idxs'] = (3, 35)
+        gps['single_precision'] = kwargs.get('single_precision', False)
 
         ############################
         # Begin low level attributes
         ############################
 
         # 1. per virtual base pair allocations
+        if gps['single_precision']:
+            self._point_dtype, self._index_dtype = np.float32, np.int32
+        else:
+            self._point_dtype, self._index_dtype = float, int
+        if kwargs.get('parametric_coordinates', False):
+            if gps['point_type'] != PointType.Z_ONLY:
+                raise ValueError("parametric coordinates require PointType.Z_ONLY")
+            self._helix_blocks = ParametricHelices(self)
+        elif kwargs.get('chunked_coordinates', False):
+            self._helix_blocks = HelixBlocks(self._point_dtype, self._index_dtype)
+        else:
+            self._helix_blocks = None
+        """Optional per virtual helix coordinate storage, either chunked
+        points or parametric helices evaluated on demand.  When set, the
+        global point arrays below are a lazily compacted view of it
+        """
         self.total_points = 0
-        self.axis_pts = np.full((DEFAULT_FULL_SIZE, 3), np.inf, dtype=float)
+        self.axis_pts = np.full((DEFAULT_FULL_SIZE, 3), np.inf, dtype=self._point_dtype)
         # self.axis_pts[:, 2] = 0.0
-        self.fwd_pts = np.full((DEFAULT_FULL_SIZE, 3), np.inf, dtype=float)
-        self.rev_pts = np.full((DEFAULT_FULL_SIZE, 3), np.inf, dtype=float)
-        self.id_nums = np.full((DEFAULT_FULL_SIZE,), -1, dtype=int)
-        self.indices = np.zeros((DEFAULT_FULL_SIZE,), dtype=int)
+        self.fwd_pts = np.full((DEFAULT_FULL_SIZE, 3), np.inf, dtype=self._point_dtype)
+        self.rev_pts = np.full((DEFAULT_FULL_SIZE, 3), np.inf, dtype=self._point_dtype)
+        self.id_nums = np.full((DEFAULT_FULL_SIZE,), -1, dtype=self._index_dtype)
+        self.indices = np.zeros((DEFAULT_FULL_SIZE,), dtype=self._index_dtype)
 
         # 2. per virtual helix allocations
         self.total_id_nums = 0  # should be equal to len(self.reserved_ids)
@@ -194,6 +232,8 @@ class NucleicAcidPart(Part):
         """For doing 2D X,Y manipulation for now.  keep track of
         XY position of virtual helices
         """
+        self._origin_grid = OriginGrid(2*self._radius)
+        """Spatial hash of `_origin_pts` cells sized to the lattice spacing"""
 
         self.origin_limits = (0., 0., 0., 0.)
 
@@ -207,7 +247,11 @@ class NucleicAcidPart(Part):
 
         self.reserved_ids = set()
 
-        self.vh_properties = _defaultDataFrame(DEFAULT_SIZE, grid_type)
+        self.vh_properties = _defaultPropertyStore(DEFAULT_SIZE, grid_type)
+        self._neighbor_graph = NeighborGraph()
+        """NeighborGraph: source of truth of the 'neighbors' property, written
+        back to `vh_properties` as strings only when read
+        """
 
         self.fwd_strandsets = [None] * DEFAULT_SIZE
         self.rev_strandsets = [None] * DEFAULT_SIZE
@@ -220,6 +264,13 @@ class NucleicAcidPart(Part):
         self._origin_cache = None
         self._origin_cache_keys = None
         self._resetOriginCache()
+        self._xover_index = {}
+        """Part wide index of crossover candidates of the form
+        {id_num: {neighbor_id: (fwd_axis_hits, rev_axis_hits)}}
+        """
+        self._point_indices = {'axis': PointIndex(self, 0),
+                               'fwd': PointIndex(self, 1),
+                               'rev': PointIndex(self, 2)}
 
         # scratch allocations for vector calculations
         self.m3_scratch0 = np.zeros((3, 3), dtype=float)
@@ -248,6 +299,9 @@ class NucleicAcidPart(Part):
     partVirtualHelixAddedSignal = ProxySignal(object, int, object, object, name='partVirtualHelixAddedSignal')
     """self, virtual_helix id_num, virtual_helix, neighbor list"""
 
+    partVirtualHelicesAddedSignal = ProxySignal(object, object, name='partVirtualHelicesAddedSignal')
+    """self, list of virtual_helix id_nums"""
+
     partVirtualHelixRemovingSignal = ProxySignal(object, int, object, object, name='partVirtualHelixRemovingSignal')
     """self, virtual_helix id_num, virtual_helix, neighbor list"""
 
@@ -271,6 +325,9 @@ class NucleicAcidPart(Part):
     # C. Oligo
     partOligoAddedSignal = ProxySignal(CNObject, object, name='partOligoAddedSignal')
     """self, oligo"""
+
+    partOligosRebuiltSignal = ProxySignal(CNObject, object, name='partOligosRebuiltSignal')
+    """self, list of strands whose oligo or connections may have changed"""
     # D. Strand
     partStrandChangedSignal = ProxySignal(object, int, name='partStrandChangedSignal')
     """self, virtual_helix"""
@@ -290,6 +347,77 @@ class NucleicAcidPart(Part):
         self._point_cache_keys = deque([None] * DEFAULT_CACHE_SIZE)
     # end def
 
+    def _compactHelixBlocks(self):
+        """Materialize the global point arrays from the per virtual helix
+        blocks when using chunked coordinate storage
+        """
+        blocks = self._helix_blocks
+        if blocks.isCompact():
+            return
+        (self._axis_pts, self._fwd_pts, self._rev_pts,
+         self._id_nums, self._indices) = blocks.compact(self._offset_and_size)
+    # end def
+
+    @property
+    def axis_pts(self):
+        if self._helix_blocks is not None:
+            self._compactHelixBlocks()
+        return self._axis_pts
+
+    @axis_pts.setter
+    def axis_pts(self, value):
+        self._axis_pts = value
+
+    @property
+    def fwd_pts(self):
+        if self._helix_blocks is not None:
+            self._compactHelixBlocks()
+        return self._fwd_pts
+
+    @fwd_pts.setter
+    def fwd_pts(self, value):
+        self._fwd_pts = value
+
+    @property
+    def rev_pts(self):
+        if self._helix_blocks is not None:
+            self._compactHelixBlocks()
+        return self._rev_pts
+
+    @rev_pts.setter
+    def rev_pts(self, value):
+        self._rev_pts = value
+
+    @property
+    def id_nums(self):
+        if self._helix_blocks is not None:
+            self._compactHelixBlocks()
+        return self._id_nums
+
+    @id_nums.setter
+    def id_nums(self, value):
+        self._id_nums = value
+
+    @property
+    def indices(self):
+        if self._helix_blocks is not None:
+            self._compactHelixBlocks()
+        return self._indices
+
+    @indices.setter
+    def indices(self, value):
+        self._indices = value
+
+    @property
+    def total_points(self):
+        if self._helix_blocks is not None:
+            return self._helix_blocks.total_points
+        return self._total_points
+
+    @total_points.setter
+    def total_points(self, value):
+        self._total_points = value
+
     def copy(self, document, new_object=None):
         """Copy all arrays and counters and create new StrandSets
 
@@ -313,17 +441,21 @@ class NucleicAcidPart(Part):
         new_vhg.rev_pts = self.rev_pts.copy()
         new_vhg.id_nums = self.id_nums.copy()
         new_vhg.indices = self.indices.copy()
+        new_vhg._point_dtype = self._point_dtype
+        new_vhg._index_dtype = self._index_dtype
+        new_vhg._group_properties['single_precision'] = self._group_properties['single_precision']
 
         new_vhg.total_id_nums = self.total_id_nums
         new_vhg._origin_pts = self._origin_pts
+        new_vhg._origin_grid = self._origin_grid.copy()
         new_vhg.origin_limits = self.origin_limits
         new_vhg.directions = self.directions
 
         new_vhg.offset_and_size = self._offset_and_size.copy()
         new_vhg.reserved_ids = self.reserved_ids.copy()
 
-        new_vhg.vh_properties = _defaultDataFrame(DEFAULT_SIZE,
-                                                  self._group_properties['grid_type'])
+        new_vhg.vh_properties = self.vh_properties.copy()
+        new_vhg._neighbor_graph = self._neighbor_graph.copy()
 
         new_vhg.fwd_strandsets = [x.simpleCopy(new_vhg) for x in self.fwd_strandsets]
         new_vhg.rev_strandsets = [x.simpleCopy(new_vhg) for x in self.rev_strandsets]
@@ -371,6 +503,8 @@ class NucleicAcidPart(Part):
         if id_num > len(offset_and_size) - 1 or offset_and_size[id_num] is None:
             raise KeyError('id_num %s not in NucleicAcidPart' % id_num)
         else:
+            if self._helix_blocks is not None:
+                self._helix_blocks.refreshOffsets(offset_and_size)
             return offset_and_size[id_num]
     # end def
 
@@ -515,6 +649,8 @@ class NucleicAcidPart(Part):
             for a given virtual helix ID number
         """
         offset, size = self.getOffsetAndSize(id_num)
+        if self._helix_blocks is not None:
+            return self._helix_blocks.views(id_num)
         lo, hi = offset, offset + size
         return (self.axis_pts[lo:hi],
                 self.fwd_pts[lo:hi],
@@ -538,6 +674,8 @@ class NucleicAcidPart(Part):
         offset, size = self.getOffsetAndSize(id_num)
 
         if idx < size:
+            if self._helix_blocks is not None:
+                return self._helix_blocks.axisPoint(id_num, idx)
             return self.axis_pts[offset + idx]
         else:
             raise IndexError("idx {} greater than size {}".format(idx, size))
@@ -779,19 +917,22 @@ class NucleicAcidPart(Part):
         """
         self._resetOriginCache()
         self._resetPointCache()
+        self._coordinatesChanged(id_nums)
         origin_pts = self._origin_pts
+        origin_grid = self._origin_grid
         delta_origin = delta[:2]  # x, y only
+        blocks = self._helix_blocks
         for id_num in id_nums:
-            coord_pts, fwd_pts, rev_pts = self.getCoordinates(id_num)
-            coord_pts += delta  # use += to modify the view
-            fwd_pts += delta  # use += to modify the view
-            rev_pts += delta  # use += to modify the view
+            if blocks is not None:
+                blocks.translate(id_num, delta)
+            else:
+                coord_pts, fwd_pts, rev_pts = self.getCoordinates(id_num)
+                coord_pts += delta  # use += to modify the view
+                fwd_pts += delta  # use += to modify the view
+                rev_pts += delta  # use += to modify the view
             origin_pts[id_num, :] += delta_origin
-        try:
-            self.vh_properties.iloc[list(id_nums), Z_PROP_INDEX] += delta[2]
-        except Exception:
-            print(list(id_nums), Z_PROP_INDEX)
-            raise
+            origin_grid.insert(id_num, *origin_pts[id_num])
+        self.vh_properties.column('z')[list(id_nums)] += delta[2]
         self._setVirtualHelixOriginLimits()
     # end def
 
@@ -805,6 +946,8 @@ class NucleicAcidPart(Part):
             ndarray: of :obj:`int` array of indices corresponding to points
         """
         offset, size = self.getOffsetAndSize(id_num)
+        if self._helix_blocks is not None:
+            return np.arange(size, dtype=self._index_dtype)
         lo, hi = offset, offset + size
         return self.indices[lo:hi]
     # end def
@@ -870,12 +1013,16 @@ class NucleicAcidPart(Part):
 
         # 1. Find insert indices
         offset_and_size = self._offset_and_size
-        len_axis_pts = len(self.axis_pts)
 
         new_axis_pts, new_fwd_pts, new_rev_pts = points
         num_points = len(new_axis_pts)  # number of points being added
 
         self._resetPointCache()
+        self._coordinatesChanged([id_num])
+
+        if self._helix_blocks is not None:
+            self._helix_blocks.add(id_num, points, is_right)
+            return
 
         # 1. existing id_num
         offset, size = offset_and_size_tuple
@@ -896,6 +1043,7 @@ class NucleicAcidPart(Part):
 
         # 2. Did exceed allocation???
         total_points = self.total_points
+        len_axis_pts = len(self.axis_pts)
         if total_points + num_points > len_axis_pts:
             diff = self.total_points + num_points - len_axis_pts
             number_of_new_elements = math.ceil(diff / DEFAULT_FULL_SIZE) * DEFAULT_FULL_SIZE
@@ -1079,35 +1227,36 @@ class NucleicAcidPart(Part):
             offset_and_size += [None]*number_of_new_elements
             self.fwd_strandsets += [None]*number_of_new_elements
             self.rev_strandsets += [None]*number_of_new_elements
-        # find the next highest insertion offset
-        next_o = self.total_points
-        for next_o_and_s in offset_and_size[id_num + 1:]:
-            if next_o_and_s:
-                next_o, next_s = next_o_and_s
-                break
-        # this_offset = num_points
-        offset_and_size[id_num] = (next_o, 0)
+        if self._helix_blocks is not None:
+            # offsets are assigned lazily by the blocks
+            self._helix_blocks.create(id_num)
+            offset_and_size[id_num] = (0, 0)
+        else:
+            # find the next highest insertion offset
+            next_o = self.total_points
+            for next_o_and_s in offset_and_size[id_num + 1:]:
+                if next_o_and_s:
+                    next_o, next_s = next_o_and_s
+                    break
+            # this_offset = num_points
+            offset_and_size[id_num] = (next_o, 0)
         # the other offsets will be adjusted later
 
         # 2. Assign origin on creation, resizing as needed
         len_origin_pts = len(self._origin_pts)
         if id_num >= len_origin_pts:
-            diff = id_num - len_origin_pts
+            diff = id_num - len_origin_pts + 1
             number_of_new_elements = math.ceil(diff / DEFAULT_SIZE)*DEFAULT_SIZE
             total_rows = len_origin_pts + number_of_new_elements
-            # resize adding zeros
-            self._origin_pts.resize((total_rows, 2))
-            self._origin_pts[len_origin_pts:] = np.inf
-
-            self.directions.resize((total_rows, 3))
-            self.directions[len_origin_pts:] = 0  # unnecessary as resize fills with zeros
-
-            self.vh_properties = self.vh_properties.append(_defaultDataFrame(number_of_new_elements,
-                                                           self._group_properties['grid_type']),
-                                                           ignore_index=True)
+            self._origin_pts = np.concatenate((self._origin_pts,
+                                               np.full((number_of_new_elements, 2), np.inf)))
+            self.directions = np.concatenate((self.directions,
+                                              np.zeros((number_of_new_elements, 3))))
+            self.vh_properties.resize(total_rows)
 
         self._origin_pts[id_num] = origin[:2]
         new_x, new_y = origin[:2]
+        self._origin_grid.insert(id_num, new_x, new_y)
         xLL, yLL, xUR, yUR = self.origin_limits
         if new_x < xLL:
             xLL = new_x
@@ -1119,7 +1268,10 @@ class NucleicAcidPart(Part):
             yUR = new_y
         self.origin_limits = (xLL, yLL, xUR, yUR)
         self.directions[id_num] = direction
-        self.vh_properties.loc[id_num, ['name', 'color', 'length']] = "vh%d" % (id_num), color, num_points
+        vh_properties = self.vh_properties
+        vh_properties.setValue(id_num, 'name', "vh%d" % (id_num))
+        vh_properties.setValue(id_num, 'color', color)
+        vh_properties.setValue(id_num, 'length', num_points)
 
         if self.fwd_strandsets[id_num] is None:
             self.fwd_strandsets[id_num] = StrandSet(True, id_num, self, num_points)
@@ -1156,12 +1308,12 @@ class NucleicAcidPart(Part):
         """
         rad = self._radius
         BW = self._BASE_WIDTH
-        hp, bpr, tpr, eulerZ, mgroove = self.vh_properties.loc[id_num,
-                                                               ['helical_pitch',
-                                                                'bases_per_repeat',
-                                                                'turns_per_repeat',
-                                                                'eulerZ',
-                                                                'minor_groove_angle']]
+        hp, bpr, tpr, eulerZ, mgroove = self.vh_properties.getValues(id_num,
+                                                                     ['helical_pitch',
+                                                                      'bases_per_repeat',
+                                                                      'turns_per_repeat',
+                                                                      'eulerZ',
+                                                                      'minor_groove_angle'])
         twist_per_base = tpr*360./bpr
         """
         + angle is CCW
@@ -1206,9 +1358,254 @@ class NucleicAcidPart(Part):
         np.add(np.dot(m, coord_pts.T, out=scratch).T, origin, out=coord_pts)
 
         if index < 0:
-            self.vh_properties.loc[id_num, 'eulerZ'] = math.degrees(eulerZ_new)
+            self.vh_properties.setValue(id_num, 'eulerZ', math.degrees(eulerZ_new))
+
+        dtype = self._point_dtype
+        return (coord_pts.astype(dtype, copy=False),
+                fwd_pts.astype(dtype, copy=False),
+                rev_pts.astype(dtype, copy=False))
+    # end def
+
+    def _createHelices(self, id_nums, origins, direction, lengths, color, properties=None):
+        """Bulk version of :meth:`_createHelix` for virtual helices sharing a
+        `direction`.  Coordinates of all virtual helices are generated
+        together and the point arrays grow once
 
-        return (coord_pts, fwd_pts, rev_pts)
+        Args:
+            id_nums (list): of :obj:`int` virtual helix ID numbers
+            origins (array-like): (N, 3) of :obj:`float` origins
+            direction (array-like):  of :obj:`float` of length 3
+            lengths (list): of :obj:`int` number of bases of each virtual helix
+            color (str): hexadecimal color code in the form: `#RRGGBB`
+            properties (dict): optional, of form {key: list of the value of
+                each virtual helix}, see :meth:`_setHelicesProperties`.  The
+                points are generated with these properties
+
+        Returns:
+            list: of :obj:`VirtualHelix`
+        """
+        offset_and_size = self._offset_and_size
+        for id_num in id_nums:
+            if id_num < len(offset_and_size) and offset_and_size[id_num] is not None:
+                raise IndexError('id_num %s already exists' % id_num)
+        if len(set(id_nums)) != len(id_nums):
+            raise IndexError('duplicate id_nums in %s' % (id_nums,))
+        for id_num in id_nums:
+            self._reserveIdNum(id_num)
+        self._resetOriginCache()
+
+        ids = np.array(id_nums, dtype=int)
+        origins = np.asarray(origins, dtype=float).reshape((-1, 3))
+        sizes = np.array(lengths, dtype=int)
+
+        # 1. Grow the per virtual helix bookkeeping once
+        max_id_num = int(ids.max())
+        number_of_new_elements = max_id_num - len(offset_and_size) + 1
+        if number_of_new_elements > 0:
+            offset_and_size += [None]*number_of_new_elements
+            self.fwd_strandsets += [None]*number_of_new_elements
+            self.rev_strandsets += [None]*number_of_new_elements
+        len_origin_pts = len(self._origin_pts)
+        if max_id_num >= len_origin_pts:
+            diff = max_id_num - len_origin_pts + 1
+            number_of_new_elements = math.ceil(diff / DEFAULT_SIZE)*DEFAULT_SIZE
+            self._origin_pts = np.concatenate((self._origin_pts,
+                                               np.full((number_of_new_elements, 2), np.inf)))
+            self.directions = np.concatenate((self.directions,
+                                              np.zeros((number_of_new_elements, 3))))
+            self.vh_properties.resize(len_origin_pts + number_of_new_elements)
+
+        # 2. Assign origins and properties
+        self._origin_pts[ids] = origins[:, :2]
+        origin_grid = self._origin_grid
+        for id_num, (x, y) in zip(id_nums, origins[:, :2].tolist()):
+            origin_grid.insert(id_num, x, y)
+        xLL, yLL, xUR, yUR = self.origin_limits
+        x_min, y_min = origins[:, :2].min(axis=0).tolist()
+        x_max, y_max = origins[:, :2].max(axis=0).tolist()
+        self.origin_limits = (min(xLL, x_min), min(yLL, y_min),
+                              max(xUR, x_max), max(yUR, y_max))
+        self.directions[ids] = direction
+        vh_properties = self.vh_properties
+        vh_properties.column('name')[ids] = ["vh%d" % (id_num) for id_num in id_nums]
+        vh_properties.column('color')[ids] = color
+        vh_properties.column('length')[ids] = sizes
+        if properties is not None:
+            self._setHelicesProperties(ids, properties)
+
+        fwd_strandsets = self.fwd_strandsets
+        rev_strandsets = self.rev_strandsets
+        for id_num, num_points in zip(id_nums, sizes.tolist()):
+            if fwd_strandsets[id_num] is None:
+                fwd_strandsets[id_num] = StrandSet(True, id_num, self, num_points)
+                rev_strandsets[id_num] = StrandSet(False, id_num, self, num_points)
+            else:
+                fwd_strandsets[id_num]._reset(num_points)
+                rev_strandsets[id_num]._reset(num_points)
+        self.total_id_nums += len(id_nums)
+
+        # 3. Create points
+        points = self._pointsFromDirections(ids, origins, direction, sizes)
+        self._addHelicesCoordinates(ids, sizes, points)
+
+        self._group_properties['virtual_helix_order'].extend(id_nums)
+        vhs = []
+        for id_num in id_nums:
+            self._virtual_helices_set[id_num] = vh = VirtualHelix(id_num, self)
+            vhs.append(vh)
+        return vhs
+    # end def
+
+    def _setHelicesProperties(self, ids, properties):
+        """Vectorized :meth:`_setVirtualHelixProperties` for virtual helices
+        being created, without signals.  The points are not updated
+
+        Args:
+            ids (ndarray): of :obj:`int` virtual helix ID numbers
+            properties (dict): of form {key: list of the value of each
+                virtual helix of `ids`}.  'neighbors' values are
+                :obj:`str` or :obj:`list` and set the neighbor graph
+
+        Raises:
+            KeyError: a key is not a property
+        """
+        id_nums = ids.tolist()
+        vh_properties = self.vh_properties
+        for key, values in properties.items():
+            if key == 'neighbors':
+                graph = self._neighbor_graph
+                for id_num, neighbors in zip(id_nums, values):
+                    if isinstance(neighbors, str):
+                        neighbors = NeighborGraph.fromString(neighbors)
+                    graph.setNeighbors(id_num, neighbors)
+                continue
+            if key in self._FLOAT_PROPERTY_KEYS:
+                try:
+                    values = np.asarray(values, dtype=float)
+                except (TypeError, ValueError):
+                    # validate value by value
+                    for id_num, value in zip(id_nums, values):
+                        self._setVirtualHelixProperties(id_num, key, value, emit_signals=False)
+                    continue
+            vh_properties.setValues(ids, key, values)
+    # end def
+
+    def _pointsFromDirections(self, ids, origins, direction, sizes, starts=None):
+        """Vectorized :meth:`_pointsFromDirection` starting at index 0 for
+        many virtual helices sharing a `direction`
+
+        Args:
+            ids (ndarray): of :obj:`int` virtual helix ID numbers
+            origins (ndarray): (N, 3) of :obj:`float` origins
+            direction (array-like): of :obj:`float` of length 3
+            sizes (ndarray): of :obj:`int` number of bases of each virtual helix
+            starts (ndarray): optional, of :obj:`int` index of the first base
+                of each virtual helix to evaluate. Default is ``None`` for 0
+
+        Returns:
+            tuple: (coord_pts, fwd_pts, rev_pts) of all virtual helices
+                concatenated in the order of `ids`
+        """
+        rad = self._radius
+        BW = self._BASE_WIDTH
+        vh_properties = self.vh_properties
+        bpr = vh_properties.column('bases_per_repeat')[ids]
+        tpr = vh_properties.column('turns_per_repeat')[ids]
+        twist_per_base = np.radians(tpr*360./bpr)
+        eulerZ = np.radians(vh_properties.column('eulerZ')[ids])
+        mgroove = np.radians(vh_properties.column('minor_groove_angle')[ids])
+
+        total_points = int(sizes.sum())
+        helix = np.repeat(np.arange(len(ids)), sizes)
+        index = np.arange(total_points) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        if starts is not None:
+            index += starts[helix]
+
+        # right handed rotates clockwise with increasing index / z
+        fwd_angles = -index*twist_per_base[helix] + eulerZ[helix]
+        rev_angles = fwd_angles + mgroove[helix]
+        z_pts = BW*index
+
+        fwd_pts = np.column_stack((rad*np.cos(fwd_angles), rad*np.sin(fwd_angles), z_pts))
+        rev_pts = np.column_stack((rad*np.cos(rev_angles), rad*np.sin(rev_angles), z_pts))
+        coord_pts = np.zeros((total_points, 3))
+        coord_pts[:, 2] = z_pts
+
+        # rotate about 0 index and then translate
+        m = self.makeRotation((0, 0, 1), direction)
+        helix_origins = origins[helix]
+        fwd_pts = np.dot(fwd_pts, m.T) + helix_origins
+        rev_pts = np.dot(rev_pts, m.T) + helix_origins
+        coord_pts = np.dot(coord_pts, m.T) + helix_origins
+        dtype = self._point_dtype
+        return (coord_pts.astype(dtype, copy=False),
+                fwd_pts.astype(dtype, copy=False),
+                rev_pts.astype(dtype, copy=False))
+    # end def
+
+    def _addHelicesCoordinates(self, ids, sizes, points):
+        """Add the points of new virtual helices with a single reallocation of
+        the point arrays
+
+        Args:
+            ids (ndarray): of :obj:`int` new virtual helix ID numbers
+            sizes (ndarray): of :obj:`int` number of bases of each virtual helix
+            points (tuple): (coord_pts, fwd_pts, rev_pts) of all virtual
+                helices concatenated in the order of `ids`
+        """
+        self._resetPointCache()
+        self._coordinatesChanged(ids.tolist())
+        offset_and_size = self._offset_and_size
+
+        if self._helix_blocks is not None:
+            blocks = self._helix_blocks
+            starts = np.cumsum(sizes) - sizes
+            for id_num, start, size in zip(ids.tolist(), starts.tolist(), sizes.tolist()):
+                blocks.create(id_num)
+                offset_and_size[id_num] = (0, 0)
+                blocks.add(id_num, [pts[start:start + size] for pts in points], is_right=True)
+            return
+
+        # 1. Assign offsets keeping points ordered by ID number and record
+        # where each new virtual helix goes in the existing arrays
+        new_sizes = dict(zip(ids.tolist(), sizes.tolist()))
+        insert_at = {}
+        offset = 0
+        old_offset = 0
+        for id_num, o_and_s in enumerate(offset_and_size):
+            size = new_sizes.get(id_num)
+            if size is not None:
+                insert_at[id_num] = old_offset
+            elif o_and_s is None:
+                continue
+            else:
+                size = o_and_s[1]
+                old_offset += size
+            offset_and_size[id_num] = (offset, size)
+            offset += size
+        positions = np.repeat([insert_at[id_num] for id_num in ids.tolist()], sizes)
+
+        # 2. Merge the new points into the existing ones
+        total_points = self.total_points
+        new_total_points = total_points + len(positions)
+        len_axis_pts = len(self.axis_pts)
+        total_rows = len_axis_pts
+        if new_total_points > len_axis_pts:
+            diff = new_total_points - len_axis_pts
+            total_rows += math.ceil(diff / DEFAULT_FULL_SIZE) * DEFAULT_FULL_SIZE
+
+        def merged(old, new, fill):
+            out = np.full((total_rows,) + old.shape[1:], fill, dtype=old.dtype)
+            out[:new_total_points] = np.insert(old[:total_points], positions, new, axis=0)
+            return out
+        new_coord_pts, new_fwd_pts, new_rev_pts = points
+        index = np.arange(len(positions)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        self.axis_pts = merged(self.axis_pts, new_coord_pts, np.inf)
+        self.fwd_pts = merged(self.fwd_pts, new_fwd_pts, np.inf)
+        self.rev_pts = merged(self.rev_pts, new_rev_pts, np.inf)
+        self.id_nums = merged(self.id_nums, np.repeat(ids, sizes), -1)
+        self.indices = merged(self.indices, index, 0)
+        self.total_points = new_total_points
     # end def
 
     def getVirtualHelixProperties(self, id_num, keys, safe=True):
@@ -1224,14 +1621,58 @@ class NucleicAcidPart(Part):
         """
         if safe:
             _, _ = self.getOffsetAndSize(id_num)
-        # 1. Find insert indices
-        props = self.vh_properties.loc[id_num, keys]
-        if isinstance(props, pd.Series):
-            return [v.item() if isinstance(v, (np.float64, np.int64, np.bool_)) else v for v in props]
+        self._syncNeighborProperties()
+        if isinstance(keys, (list, tuple)):
+            return self.vh_properties.getValues(id_num, keys)
         else:
-            return props.item() if isinstance(props, (np.float64, np.int64, np.bool_)) else props
+            return self.vh_properties.getValue(id_num, keys)
     # end
 
+    def getVirtualHelixNeighbors(self, id_num):
+        """
+        Args:
+            id_num (int): virtual helix ID number
+
+        Returns:
+            list: of :obj:`int` sorted neighbor ID numbers
+        """
+        return self._neighbor_graph.neighbors(id_num).tolist()
+    # end def
+
+    def _setVirtualHelixNeighbors(self, id_num, neighbors, emit_signals=True):
+        """Replace the neighbors of a virtual helix.  The neighbors of the
+        neighbors are not updated
+
+        emits `partVirtualHelixPropertyChangedSignal` if the neighbors changed
+
+        Args:
+            id_num (int): virtual helix ID number
+            neighbors (iterable): of :obj:`int` neighbor ID numbers
+            emit_signals (bool): optionally echew signaling
+
+        Returns:
+            bool: ``True`` if the neighbors changed
+        """
+        graph = self._neighbor_graph
+        is_changed = graph.setNeighbors(id_num, neighbors)
+        if is_changed and emit_signals:
+            value = NeighborGraph.toString(graph.neighbors(id_num))
+            self.partVirtualHelixPropertyChangedSignal.emit(
+                self, id_num, self.getVirtualHelix(id_num), ['neighbors'], [value])
+        return is_changed
+    # end def
+
+    def _syncNeighborProperties(self):
+        """Write the string form of changed neighbor lists to `vh_properties`
+        """
+        graph = self._neighbor_graph
+        changed = graph.popChanged()
+        if changed:
+            vh_properties = self.vh_properties
+            for id_num in changed:
+                vh_properties.setValue(id_num, 'neighbors', NeighborGraph.toString(graph.neighbors(id_num)))
+    # end def
+
     def helixPropertiesAndOrigins(self, id_num_list=None):
         """
         Args:
@@ -1247,17 +1688,16 @@ class NucleicAcidPart(Part):
         Raises:
             ValueError:
         """
+        self._syncNeighborProperties()
         if id_num_list is None:
             lim = max(self._highest_even_id_num_used + 2,
                       self._highest_odd_id_num_used + 2)
-            props = self.vh_properties.iloc[:lim]
-            props = props.to_dict(orient='list')
+            props = self.vh_properties.toDict(slice(0, lim))
             origins = self._origin_pts[:lim]
             return props, origins
         elif isinstance(id_num_list, list):
             # select by list of indices
-            props = self.vh_properties.iloc[id_num_list].reset_index(drop=True)
-            props = props.to_dict(orient='list')
+            props = self.vh_properties.toDict(id_num_list)
             origins = self._origin_pts[id_num_list]
             return props, origins
         else:
@@ -1282,12 +1722,9 @@ class NucleicAcidPart(Part):
         """
         if safe:
             _, _ = self.getOffsetAndSize(id_num)
-        # 1. Find insert indices
-        series = self.vh_properties.loc[id_num]
-        # to_dict doesn't promote to python native types needed by QVariant
-        # leaves as numpy integers and floats
-        out = dict((k, v.item()) if isinstance(v, (np.float64, np.int64, np.bool_))
-                   else (k, v) for k, v in zip(series.index, series.tolist()))
+        self._syncNeighborProperties()
+        # promotes to python native types needed by QVariant
+        out = self.vh_properties.getRow(id_num)
         if inject_extras:
             bpr = float(out['bases_per_repeat'])
             tpr = float(out['turns_per_repeat'])
@@ -1350,11 +1787,23 @@ class NucleicAcidPart(Part):
                                                                             values_list[index]))
 
         for index, key in enumerate(keys_list):
+            if key == 'neighbors':
+                neighbors = values_list[index]
+                if isinstance(neighbors, str):
+                    neighbors = NeighborGraph.fromString(neighbors)
+                self._neighbor_graph.setNeighbors(id_num, neighbors)
+                continue
             try:
-                self.vh_properties.loc[id_num, (key)] = values_list[index]
+                self.vh_properties.setValue(id_num, key, values_list[index])
             except KeyError:
                 print("Key not in VH properties {}: {}, {}".format(key, id_num, values))
                 raise
+        if not self._XOVER_PROPERTY_KEYS.isdisjoint(keys_list):
+            if isinstance(self._helix_blocks, ParametricHelices):
+                # parametric points follow the properties right away
+                self._coordinatesChanged([id_num])
+            else:
+                self._invalidateCrossoverIndex([id_num])
 
         if emit_signals:
             self.partVirtualHelixPropertyChangedSignal.emit(
@@ -1432,9 +1881,8 @@ class NucleicAcidPart(Part):
         else:  # delta == 0
             return
         _, final_size = self.getOffsetAndSize(id_num)
-        self.vh_properties.loc[id_num, 'length'] = final_size
-        self._group_properties['max_vhelix_length'] = self.vh_properties['length'].max()
-        # return 0, self.vh_properties['length'].idxmax()
+        self.vh_properties.setValue(id_num, 'length', final_size)
+        self._group_properties['max_vhelix_length'] = self.vh_properties.column('length').max().item()
         return self.zBoundsIds()
     # end def
 
@@ -1445,6 +1893,8 @@ class NucleicAcidPart(Part):
         Returns:
             tuple: of :obj:`int`, of form (ID_z_min, ID_z_max)
         """
+        if self._helix_blocks is not None:
+            return self._helix_blocks.zBoundsIds()
         test = self.axis_pts[:, 2]
         id_z_min = self.id_nums[np.argmin(test)]
         # use numpy masked arrays to mask out infinites
@@ -1485,7 +1935,7 @@ class NucleicAcidPart(Part):
             KeyError:
         """
         offset, size = self.getOffsetAndSize(id_num)
-        origin = self.axis_pts[offset]  # zero point of axis
+        origin = self.getCoordinates(id_num)[0][0]  # zero point of axis
         direction = self.directions[id_num]
         points = self._pointsFromDirection(id_num, origin, direction, size, 0)
         self._setCoordinates(id_num, points)
@@ -1513,6 +1963,11 @@ class NucleicAcidPart(Part):
             raise IndexError(err.format(len(points), idx_start, size))
 
         new_axis_pts, new_fwd_pts, new_rev_pts = points
+        self._resetPointCache()
+        self._coordinatesChanged([id_num])
+        if self._helix_blocks is not None:
+            self._helix_blocks.set(id_num, points, idx_start)
+            return
         lo = offset + idx_start
         hi = lo + len(new_axis_pts)
         self.axis_pts[lo:hi] = new_axis_pts
@@ -1546,47 +2001,55 @@ class NucleicAcidPart(Part):
             idx_start, idx_stop = lo, lo + length
 
         self._resetPointCache()
+        self._coordinatesChanged([id_num])
         offset_and_size = self._offset_and_size
         current_offset_and_size_length = len(offset_and_size)
 
-        # 1. Move the good data
-        total_points = self.total_points
-        relocate_idx_end = total_points - length
-
-        axis_pts = self.axis_pts
-        try:
-            axis_pts[idx_start:relocate_idx_end] = axis_pts[idx_stop:total_points]
-        except Exception:
-            err = "idx_start {}, relocate_idx_end {}, idx_stop {}, total_points {}, length {}"
-            print(err.format(idx_start, relocate_idx_end, idx_stop, total_points, length))
-            raise
-        axis_pts[relocate_idx_end:total_points] = np.inf
-
-        fwd_pts = self.fwd_pts
-        fwd_pts[idx_start:relocate_idx_end] = fwd_pts[idx_stop:total_points]
-        fwd_pts[relocate_idx_end:total_points] = np.inf
-
-        rev_pts = self.rev_pts
-        rev_pts[idx_start:relocate_idx_end] = rev_pts[idx_stop:total_points]
-        rev_pts[relocate_idx_end:total_points] = np.inf
-
-        id_nums = self.id_nums
-        id_nums[idx_start:relocate_idx_end] = id_nums[idx_stop:total_points]
-        id_nums[relocate_idx_end:total_points] = -1
+        if self._helix_blocks is not None:
+            if size == length:
+                self._helix_blocks.remove(id_num)
+            else:
+                self._helix_blocks.trim(id_num, length, is_right)
+        else:
+            # 1. Move the good data
+            total_points = self.total_points
+            relocate_idx_end = total_points - length
 
-        indices = self.indices
-        indices[idx_start:relocate_idx_end] = indices[idx_stop:total_points]
-        indices[relocate_idx_end:total_points] = 0
-        if not is_right:
-            # We need to adjust the base index
-            # lo offset index should not change for a given id_num
-            indices[lo:lo + length] -= length
-
-        # 2. Adjust the offsets of id_nums greater than id_num
-        for i, item in enumerate(offset_and_size[id_num + 1:], start=1):
-            if item is not None:
-                offset_other, size_other = item
-                offset_and_size[i + id_num] = (offset_other - length, size_other)
+            axis_pts = self.axis_pts
+            try:
+                axis_pts[idx_start:relocate_idx_end] = axis_pts[idx_stop:total_points]
+            except Exception:
+                err = "idx_start {}, relocate_idx_end {}, idx_stop {}, total_points {}, length {}"
+                print(err.format(idx_start, relocate_idx_end, idx_stop, total_points, length))
+                raise
+            axis_pts[relocate_idx_end:total_points] = np.inf
+
+            fwd_pts = self.fwd_pts
+            fwd_pts[idx_start:relocate_idx_end] = fwd_pts[idx_stop:total_points]
+            fwd_pts[relocate_idx_end:total_points] = np.inf
+
+            rev_pts = self.rev_pts
+            rev_pts[idx_start:relocate_idx_end] = rev_pts[idx_stop:total_points]
+            rev_pts[relocate_idx_end:total_points] = np.inf
+
+            id_nums = self.id_nums
+            id_nums[idx_start:relocate_idx_end] = id_nums[idx_stop:total_points]
+            id_nums[relocate_idx_end:total_points] = -1
+
+            indices = self.indices
+            indices[idx_start:relocate_idx_end] = indices[idx_stop:total_points]
+            indices[relocate_idx_end:total_points] = 0
+            if not is_right:
+                # We need to adjust the base index of the remaining points
+                # lo offset index should not change for a given id_num
+                indices[lo:lo + size - length] -= length
+
+            # 2. Adjust the offsets of id_nums greater than id_num
+            for i, item in enumerate(offset_and_size[id_num + 1:], start=1):
+                if item is not None:
+                    offset_other, size_other = item
+                    offset_and_size[i + id_num] = (offset_other - length, size_other)
+            self.total_points -= length
 
         # 3. Check if we need to remove Virtual Helix
         if size == length:
@@ -1594,6 +2057,7 @@ class NucleicAcidPart(Part):
             self._resetOriginCache()
             offset_and_size[id_num] = None
             self._origin_pts[id_num, :] = (np.inf, np.inf)  # set off to infinity
+            self._origin_grid.remove(id_num)
             # trim the unused id_nums at the end
             remove_count = 0
             for i in range(current_offset_and_size_length - 1, id_num - 1, -1):
@@ -1607,26 +2071,27 @@ class NucleicAcidPart(Part):
             # print("Did remove", size, length)
             offset_and_size[id_num] = (offset, size - length)
             did_remove = False
-        self.total_points -= length
         return did_remove
     # end def
 
-    def queryBasePoint(self, radius, point):
+    def queryBasePoint(self, radius, point, which='axis'):
         """Cached query
 
         Args:
             radius (float): distance to consider
             point (array-like): :obj:`float` of length 3
+            which (str): optional, one of 'axis', 'fwd' or 'rev' points to
+                query. default is 'axis'
 
         Returns:
             tuple: of :obj:`ndarray`
         """
         qc = self._point_cache
-        query = (radius, point)
+        query = (radius, point, which)
         if query in qc:
             return qc.get(query)
         else:
-            res = self._queryBasePoint(radius, point)
+            res = self._queryBasePoint(radius, point, which)
             self._point_cache_keys.append(query)
             qc[query] = res
             # limit the size of the cache
@@ -1636,29 +2101,35 @@ class NucleicAcidPart(Part):
             return res
     # end def
 
-    def _queryBasePoint(self, radius, point):
+    def _queryBasePoint(self, radius, point, which='axis'):
         """ return the indices of all virtual helices closer than radius
 
         Args:
             radius (float): distance to consider
             point (array-like): of :obj:`float` of length 3
+            which (str): optional, one of 'axis', 'fwd' or 'rev' points to
+                query. default is 'axis'
 
         Returns:
-            tuple: of :obj:`ndarray`
+            tuple: of :obj:`ndarray` (id_nums, indices)
         """
-        difference = self.axis_pts - point
-        ldiff = len(difference)
-        delta = self.delta3D_scratch
-        if ldiff != len(delta):
-            self.delta3D_scratch = delta = np.empty((ldiff,), dtype=float)
+        return self._point_indices[which].queryRadius(radius, point)
+    # end def
+
+    def queryBasePointNearest(self, point, k=1, which='axis'):
+        """Find the `k` closest bases to a point
+
+        Args:
+            point (array-like): of :obj:`float` of length 3
+            k (int): optional, number of bases to return. default is 1
+            which (str): optional, one of 'axis', 'fwd' or 'rev' points to
+                query. default is 'axis'
 
-        # compute square of distance to point
-        delta = inner1d(difference, difference, out=delta)
-        close_points, = np.where(delta < radius*radius)
-        # return list(zip(    np.take(self.id_nums, close_points),
-        #                     np.take(self.indices, close_points) ))
-        return (np.take(self.id_nums, close_points),
-                np.take(self.indices, close_points))
+        Returns:
+            tuple: of :obj:`ndarray` (id_nums, indices, distances) sorted
+                by distance
+        """
+        return self._point_indices[which].queryNearest(point, k)
     # end def
 
     def queryVirtualHelixOrigin(self, radius, point):
@@ -1705,17 +2176,14 @@ class NucleicAcidPart(Part):
         Returns:
             ndarray: close origin points to `point`
         """
-        difference = self._origin_pts - point
-        ldiff = len(difference)
-        delta = self.delta2D_scratch
-        if ldiff != len(delta):
-            self.delta2D_scratch = delta = np.empty((ldiff,), dtype=float)
-
-        # compute square of distance to point
-        inner1d(difference, difference, out=delta)
-        close_points, = np.where(delta <= radius*radius)
-        # take then sort the indices of the points in range
-        sorted_idxs = np.argsort(np.take(delta, close_points))
+        # only check origins in grid cells overlapping the query
+        candidates = self._origin_grid.queryRadius(point[0], point[1], radius)
+        difference = self._origin_pts[candidates] - point[:2]
+        delta = inner1d(difference, difference)
+        close_mask = delta <= radius*radius
+        close_points = candidates[close_mask]
+        # sort the indices of the points in range
+        sorted_idxs = np.argsort(delta[close_mask], kind='stable')
 
         return close_points[sorted_idxs]
     # end def
@@ -1736,16 +2204,12 @@ class NucleicAcidPart(Part):
         """
         # search children
         x1, y1, x2, y2 = rect
-        origin_pts = self._origin_pts
+        candidates = self._origin_grid.queryRect(x1, y1, x2, y2)
+        origin_pts = self._origin_pts[candidates]
         xs = origin_pts[:, 0]
         ys = origin_pts[:, 1]
-        x_lo_mask = xs > x1
-        x_hi_mask = xs < x2
-        combo_x = np.logical_and(x_lo_mask, x_hi_mask)
-        np.logical_and(ys > y1, ys < y2, out=x_lo_mask)
-        np.logical_and(x_lo_mask, combo_x, out=x_hi_mask)
-        id_nums, = np.where(x_hi_mask)
-        return id_nums
+        mask = (xs > x1) & (xs < x2) & (ys > y1) & (ys < y2)
+        return candidates[mask]
     # end def
 
     def _queryIdNumRange(self, id_num, radius, index_slice=None):
@@ -1829,7 +2293,7 @@ class NucleicAcidPart(Part):
                 (start index, bases per repeat)
         """
         offset, size = self.getOffsetAndSize(id_num)
-        bpr = self.vh_properties.loc[id_num, 'bases_per_repeat']
+        bpr = self.vh_properties.getValue(id_num, 'bases_per_repeat')
         half_period = bpr // 2
         if size - index < bpr:
             start = size - bpr
@@ -1860,8 +2324,8 @@ class NucleicAcidPart(Part):
 
         """
         offset, size = self.getOffsetAndSize(id_num)
-        bpr, tpr = self.vh_properties.loc[id_num,
-                                          ['bases_per_repeat', 'turns_per_repeat']]
+        bpr, tpr = self.vh_properties.getValues(id_num,
+                                                ['bases_per_repeat', 'turns_per_repeat'])
         bases_per_turn = bpr / tpr
         if index is None:
             start, length = 0, size
@@ -1896,7 +2360,7 @@ class NucleicAcidPart(Part):
         key_prop_list = ['eulerZ', 'bases_per_repeat',
                          'turns_per_repeat', 'minor_groove_angle']
         for neighbor_id in neighbors:
-            eulerZ, bpr, tpr, mgroove = self.vh_properties.loc[neighbor_id, key_prop_list]
+            eulerZ, bpr, tpr, mgroove = self.vh_properties.getValues(neighbor_id, key_prop_list)
             twist_per_base = tpr*360./bpr
             half_period = math.floor(bpr / 2)
             tpb = math.radians(twist_per_base)
@@ -2019,9 +2483,7 @@ class NucleicAcidPart(Part):
             ValueError:
         """
         offset, size = self.getOffsetAndSize(id_num)
-        bpr, tpr = self.vh_properties.loc[id_num,
-                                          ['bases_per_repeat', 'turns_per_repeat']]
-        bases_per_turn = bpr / tpr
+        bpr = self.vh_properties.getValue(id_num, 'bases_per_repeat')
         if index is None:
             start, length = 0, size
         else:
@@ -2030,24 +2492,113 @@ class NucleicAcidPart(Part):
                 start, length = int(size - bpr), int(bpr)
             else:
                 start, length = int(max(index - half_period, 0)), int(bpr)
-        # norm = np.linalg.norm
-        # cross = np.cross
-        # dot = np.dot
-        # normalize = self.normalize
+        end = start + length
+
+        per_neighbor_hits = {}
+
+        fwd_axis_pairs = {}
+        rev_axis_pairs = {}
+
+        isAGreaterThanB_Z = self.isAGreaterThanB_Z
+        for neighbor_id in neighbors:
+            all_fwd_hits, all_rev_hits = self._potentialCrossoverHits(id_num, neighbor_id)
+            if index is None:
+                fwd_axis_hits = list(all_fwd_hits)
+                rev_axis_hits = list(all_rev_hits)
+            else:
+                fwd_axis_hits = [hit for hit in all_fwd_hits if start <= hit[0] < end]
+                rev_axis_hits = [hit for hit in all_rev_hits if start <= hit[0] < end]
+
+            # Scan for pairs of bases in AP xovers
+            idx_last = -2
+            fwd_axis_pairs = {}
+            for i, f_idxs, r_idxs in fwd_axis_hits:
+                if r_idxs:
+                    if idx_last + 1 == i:
+                        # print("pair", idx_last, i)
+                        fwd_axis_pairs[idx_last] = (True, neighbor_id)  # 5 prime  most strand
+                        fwd_axis_pairs[i] = (False, neighbor_id)        # 3 prime most strand
+                    idx_last = i
+                if f_idxs:
+                    for idxB in f_idxs:
+                        if isAGreaterThanB_Z(id_num, i, neighbor_id, idxB):
+                            fwd_axis_pairs[i] = (False, neighbor_id)
+                        else:
+                            fwd_axis_pairs[i] = (True, neighbor_id)
+
+            # Scan for pairs of bases in AP xovers
+            idx_last = -2
+            for i, f_idxs, r_idxs in rev_axis_hits:
+                if f_idxs:
+                    if idx_last + 1 == i:
+                        # print("pair", idx_last, i)
+                        rev_axis_pairs[idx_last] = (False, neighbor_id)    # 3 prime  most strand
+                        rev_axis_pairs[i] = (True, neighbor_id)            # 5 prime most strand
+                    idx_last = i
+                if r_idxs:
+                    for idxB in r_idxs:
+                        if isAGreaterThanB_Z(id_num, i, neighbor_id, idxB):
+                            rev_axis_pairs[i] = (True, neighbor_id)
+                        else:
+                            rev_axis_pairs[i] = (False, neighbor_id)
+
+            per_neighbor_hits[neighbor_id] = (fwd_axis_hits, rev_axis_hits)
+        # end for
+        return per_neighbor_hits, (fwd_axis_pairs, rev_axis_pairs)
+    # end def
+
+    def _potentialCrossoverHits(self, id_num, neighbor_id):
+        """Get the crossover candidates over the full length of virtual helix
+        `id_num` against `neighbor_id`.  Results are stored in the part wide
+        crossover index until either virtual helix is invalidated by
+        :meth:`_invalidateCrossoverIndex`
+
+        Args:
+            id_num (int): virtual helix ID number
+            neighbor_id (int): neighbor virtual helix ID number
+
+        Returns:
+            tuple: of :obj:`list` (fwd_axis_hits, rev_axis_hits) of form::
+
+                [(id_num_index, forward_neighbor_idxs, reverse_neighbor_idxs), ...]]
+        """
+        id_num_hits = self._xover_index.setdefault(id_num, {})
+        hits = id_num_hits.get(neighbor_id)
+        if hits is not None:
+            return hits
+        p_bounds, ap_bounds = self._crossoverBounds(id_num)
+        _, this_fwd_pts, this_rev_pts = self.getCoordinates(id_num)
+
+        # 1. Finds points within a bond length of the neighbors points
+        _, nfwd_pts, nrev_pts = self.getCoordinates(neighbor_id)
+
+        candidateHits = self._candidateHits
+        # fwd to fwd is PARALLEL and fwd to rev is ANTI-PARALLEL
+        fwd_axis_hits = candidateHits(this_fwd_pts, nfwd_pts, nrev_pts, p_bounds, ap_bounds, 0)
+        # rev to fwd is ANTI-PARALLEL and rev to rev is PARALLEL
+        rev_axis_hits = candidateHits(this_rev_pts, nfwd_pts, nrev_pts, ap_bounds, p_bounds, 0)
+        id_num_hits[neighbor_id] = hits = (fwd_axis_hits, rev_axis_hits)
+        return hits
+    # end def
+
+    def _crossoverBounds(self, id_num):
+        """Compute the squared distance bounds of an ideal crossover of both
+        types for a virtual helix
+
+        Args:
+            id_num (int): virtual helix ID number
+
+        Returns:
+            tuple: (parallel_bounds, anti_parallel_bounds) each of form
+                (delta_min, delta_max, zdelta_min, zdelta_max)
+        """
+        bpr, tpr = self.vh_properties.getValues(id_num,
+                                                ['bases_per_repeat', 'turns_per_repeat'])
+        bases_per_turn = bpr / tpr
         PI = math.pi
-        # TWOPI = 2*PI
         RADIUS = self._radius
         BW = self._BASE_WIDTH
 
-        # theta, radius = self.radiusForAngle(alpha, RADIUS, bases_per_turn, BW)
-        # convert to a list since we can't speed this loop up without cython or something
-        # axis_pts = self.axis_pts
-        fwd_pts = self.fwd_pts
-        rev_pts = self.rev_pts
-        # this_axis_pts = axis_pts[offset + start:offset + start + length].tolist()
-        this_fwd_pts = fwd_pts[offset + start:offset + start + length].tolist()
-        this_rev_pts = rev_pts[offset + start:offset + start + length].tolist()
-
         """TODO: decide how we want to handle maintaining bond length
         ideal adjacent ANTI-PARALLEL xover strands project to a plane normal
         to the helical axis and point in the SAME direction
@@ -2075,7 +2626,6 @@ class NucleicAcidPart(Part):
                               math.sin(ma_f*half_twist_per_base)))**2
         r2_axial = BW*BW
 
-        # print("r2:", r2_radial, r2_tangent, r2_axial)
         # 2. ANTI-PARALLEL
         rsquared_ap = r2_tangent + r2_radial
         rsquared_ap_min = 0
@@ -2085,106 +2635,137 @@ class NucleicAcidPart(Part):
         rsquared_p = r2_tangent + r2_radial + r2_axial
         rsquared_p_min = r2_axial
         rsquared_p_max = rsquared_p + 0.25*r2_axial
-        per_neighbor_hits = {}
 
-        fwd_axis_pairs = {}
-        rev_axis_pairs = {}
+        p_bounds = (rsquared_p_min, rsquared_p_max, 0.3*r2_axial, 1.1*r2_axial)
+        ap_bounds = (rsquared_ap_min, rsquared_ap_max, None, 0.3*r2_axial)
+        return p_bounds, ap_bounds
+    # end def
 
-        for neighbor_id in neighbors:
-            offset, size = self.getOffsetAndSize(neighbor_id)
+    def _coordinatesChanged(self, id_nums):
+        """Invalidate the spatial indices of virtual helices whose
+        coordinates were added, removed, set or moved
 
-            # 1. Finds points that point at neighbors axis point
-            nfwd_pts = fwd_pts[offset:offset + size]
-            nrev_pts = rev_pts[offset:offset + size]
+        Args:
+            id_nums (iterable): of :obj:`int` virtual helix ID numbers
+        """
+        self._invalidateCrossoverIndex(id_nums)
+        for point_index in self._point_indices.values():
+            point_index.invalidate(id_nums)
+        if self._helix_blocks is not None:
+            self._helix_blocks.invalidate(id_nums)
+    # end def
 
-            # direction = self.directions[neighbor_id]
-            len_neighbor_pts = len(nfwd_pts)
-            delta = self.delta3D_scratch
-            if len_neighbor_pts != len(delta):
-                self.delta3D_scratch = delta = np.empty((len_neighbor_pts,), dtype=float)
+    def _invalidateCrossoverIndex(self, id_nums=None):
+        """Drop the cached crossover candidates of the given virtual helices
+        from the crossover index, both as the queried virtual helix and as a
+        neighbor of other virtual helices
 
-            fwd_axis_hits = []
-            for i, point in enumerate(this_fwd_pts):
-                difference = nfwd_pts - point
-                inner1d(difference, difference, out=delta)
-                zdelta = np.square(difference[:, 2])
-                # assume there is only one possible index of intersection with the neighbor
-                f_idxs = np.where((delta > rsquared_p_min) &
-                                  (delta < rsquared_p_max) &
-                                  (zdelta > 0.3*r2_axial) &
-                                  (zdelta < 1.1*r2_axial)
-                                  )[0].tolist()
-                difference = nrev_pts - point
-                inner1d(difference, difference, out=delta)
-                zdelta = np.square(difference[:, 2])
-                # assume there is only one possible index of intersection with the neighbor
-                r_idxs = np.where((delta > rsquared_ap_min) &
-                                  (delta < rsquared_ap_max) &
-                                  (zdelta < 0.3*r2_axial))[0].tolist()
-                if f_idxs or r_idxs:
-                    fwd_axis_hits.append((start + i, f_idxs, r_idxs))
-            # end for
+        Args:
+            id_nums (iterable): optional, of :obj:`int` virtual helix ID
+                numbers.  Default is ``None`` which clears the whole index
+        """
+        xover_index = self._xover_index
+        if id_nums is None:
+            xover_index.clear()
+            return
+        for id_num in id_nums:
+            xover_index.pop(id_num, None)
+        for id_num_hits in xover_index.values():
+            for id_num in id_nums:
+                id_num_hits.pop(id_num, None)
+    # end def
 
-            # Scan for pairs of bases in AP xovers
-            idx_last = -2
-            fwd_axis_pairs = {}
-            isAGreaterThanB_Z = self.isAGreaterThanB_Z
-            for i, f_idxs, r_idxs in fwd_axis_hits:
-                if r_idxs:
-                    if idx_last + 1 == i:
-                        # print("pair", idx_last, i)
-                        fwd_axis_pairs[idx_last] = (True, neighbor_id)  # 5 prime  most strand
-                        fwd_axis_pairs[i] = (False, neighbor_id)        # 3 prime most strand
-                    idx_last = i
-                if f_idxs:
-                    for idxB in f_idxs:
-                        if isAGreaterThanB_Z(id_num, i, neighbor_id, idxB):
-                            fwd_axis_pairs[i] = (False, neighbor_id)
-                        else:
-                            fwd_axis_pairs[i] = (True, neighbor_id)
+    def buildPotentialCrossoverIndex(self):
+        """Compute the crossover candidates of every virtual helix in the part
+        against its neighbors.  Subsequent calls to :meth:`potentialCrossoverMap`
+        are then lookups into the index until geometry changes
 
-            rev_axis_hits = []
-            for i, point in enumerate(this_rev_pts):
-                difference = nfwd_pts - point
-                inner1d(difference, difference, out=delta)
-                zdelta = np.square(difference[:, 2])
-                # assume there is only one possible index of intersection with the neighbor
-                f_idxs = np.where((delta > rsquared_ap_min) &
-                                  (delta < rsquared_ap_max) &
-                                  (zdelta < 0.3*r2_axial))[0].tolist()
+        Returns:
+            dict: of form::
 
-                difference = nrev_pts - point
-                inner1d(difference, difference, out=delta)
-                zdelta = np.square(difference[:, 2])
-                # assume there is only one possible index of intersection with the neighbor
-                r_idxs = np.where((delta > rsquared_p_min) &
-                                  (delta < rsquared_p_max) &
-                                  (zdelta > 0.3*r2_axial) &
-                                  (zdelta < 1.1*r2_axial)
-                                  )[0].tolist()
-                if f_idxs or r_idxs:
-                    rev_axis_hits.append((start + i, f_idxs, r_idxs))
-            # end for
+                id_num: {neighbor_id_num: (fwd_hit_list, rev_hit_list)}
+        """
+        out = {}
+        for id_num in self.getIdNums():
+            neighbors = self._neighbor_graph.neighbors(id_num).tolist()
+            out[id_num] = {neighbor_id: self._potentialCrossoverHits(id_num, neighbor_id)
+                           for neighbor_id in neighbors}
+        return out
+    # end def
 
-            # Scan for pairs of bases in AP xovers
-            idx_last = -2
-            for i, f_idxs, r_idxs in rev_axis_hits:
-                if f_idxs:
-                    if idx_last + 1 == i:
-                        # print("pair", idx_last, i)
-                        rev_axis_pairs[idx_last] = (False, neighbor_id)    # 3 prime  most strand
-                        rev_axis_pairs[i] = (True, neighbor_id)            # 5 prime most strand
-                    idx_last = i
-                if r_idxs:
-                    for idxB in r_idxs:
-                        if isAGreaterThanB_Z(id_num, i, neighbor_id, idxB):
-                            rev_axis_pairs[i] = (True, neighbor_id)
-                        else:
-                            rev_axis_pairs[i] = (False, neighbor_id)
+    @staticmethod
+    def _candidatePairs(this_pts, neighbor_pts, bounds):
+        """Find all pairs of points between two virtual helices within
+        crossover range in a single batched pass.  Since every crossover
+        requires a small `zdelta`, the neighbor points are sorted by z and only
+        the pairs inside of the z window are measured.
 
-            per_neighbor_hits[neighbor_id] = (fwd_axis_hits, rev_axis_hits)
-        # end for
-        return per_neighbor_hits, (fwd_axis_pairs, rev_axis_pairs)
+        Args:
+            this_pts (ndarray): (L, 3) points of the queried virtual helix
+            neighbor_pts (ndarray): (M, 3) points of a neighbor virtual helix
+            bounds (tuple): of form (delta_min, delta_max, zdelta_min, zdelta_max)
+                where `zdelta_min` may be ``None`` for no lower bound
+
+        Returns:
+            tuple: of :obj:`ndarray` (this_idxs, neighbor_idxs) sorted by
+                `this_idxs` and then by `neighbor_idxs`
+        """
+        delta_min, delta_max, zdelta_min, zdelta_max = bounds
+        order = np.argsort(neighbor_pts[:, 2], kind='stable')
+        sorted_z = neighbor_pts[order, 2]
+        # pad the window so it is always a superset of the zdelta test below
+        window = math.sqrt(zdelta_max)*(1. + 1e-6)
+        this_z = this_pts[:, 2]
+        lo = np.searchsorted(sorted_z, this_z - window, side='left')
+        hi = np.searchsorted(sorted_z, this_z + window, side='right')
+        counts = hi - lo
+        total = int(counts.sum())
+        if total == 0:
+            empty = np.empty((0,), dtype=int)
+            return empty, empty
+        this_idxs = np.repeat(np.arange(len(this_pts)), counts)
+        run_starts = np.repeat(np.cumsum(counts) - counts, counts)
+        neighbor_idxs = order[np.repeat(lo, counts) + np.arange(total) - run_starts]
+
+        difference = neighbor_pts[neighbor_idxs] - this_pts[this_idxs]
+        delta = inner1d(difference, difference)
+        zdelta = np.square(difference[:, 2])
+        mask = (delta > delta_min) & (delta < delta_max) & (zdelta < zdelta_max)
+        if zdelta_min is not None:
+            mask &= zdelta > zdelta_min
+        this_idxs = this_idxs[mask]
+        neighbor_idxs = neighbor_idxs[mask]
+        sort_idxs = np.lexsort((neighbor_idxs, this_idxs))
+        return this_idxs[sort_idxs], neighbor_idxs[sort_idxs]
+    # end def
+
+    def _candidateHits(self, this_pts, nfwd_pts, nrev_pts, fwd_bounds, rev_bounds, start):
+        """Batched search of the points of a virtual helix against the
+        forward and reverse points of a neighbor.
+
+        Args:
+            this_pts (ndarray): (L, 3) points of the queried virtual helix
+            nfwd_pts (ndarray): (M, 3) forward points of the neighbor
+            nrev_pts (ndarray): (M, 3) reverse points of the neighbor
+            fwd_bounds (tuple): bounds for hits against `nfwd_pts`
+            rev_bounds (tuple): bounds for hits against `nrev_pts`
+            start (int): index of the first point in `this_pts`
+
+        Returns:
+            list: of :obj:`tuple` of form::
+
+                (id_num_index, forward_neighbor_idxs, reverse_neighbor_idxs)
+        """
+        if len(this_pts) == 0 or len(nfwd_pts) == 0:
+            return []
+        candidatePairs = self._candidatePairs
+        hits = defaultdict(lambda: ([], []))
+        for which, neighbor_pts, bounds in ((0, nfwd_pts, fwd_bounds),
+                                            (1, nrev_pts, rev_bounds)):
+            this_idxs, neighbor_idxs = candidatePairs(this_pts, neighbor_pts, bounds)
+            for i, j in zip(this_idxs.tolist(), neighbor_idxs.tolist()):
+                hits[i][which].append(j)
+        return [(start + i, f_idxs, r_idxs) for i, (f_idxs, r_idxs) in sorted(hits.items())]
     # end def
 
     @staticmethod
@@ -2367,7 +2948,7 @@ class NucleicAcidPart(Part):
 
 
         """
-        neighbors = literal_eval(self.vh_properties.loc[id_num, 'neighbors'])
+        neighbors = self._neighbor_graph.neighbors(id_num).tolist()
         # alpha = self.getProperty('crossover_span_angle')
 
         # idx = None # FORCE this for now to prevent animation GC crashes
@@ -2393,17 +2974,77 @@ class NucleicAcidPart(Part):
         return xLL * scale_factor, yLL * scale_factor, xUR * scale_factor, yUR * scale_factor
     # end def
 
+    def iterSequences(self, sort=False, scaffold=True, staples=True):
+        """Generate the export rows of the oligos one at a time
+
+        Args:
+            sort (bool, optional): order by the ID number and then the index
+                of the 5' end, default is ``False`` for no particular order
+            scaffold (bool, optional): include oligos whose 5' strand is in a
+                scaffold `StrandSet`, default is ``True``
+            staples (bool, optional): include oligos whose 5' strand is in a
+                staple `StrandSet`, default is ``True``
+
+        Yields:
+            tuple: of :obj:`str` in the order of `SEQUENCE_EXPORT_KEYS`
+
+        Raises:
+            CircularOligoException: when a circular oligo is reached
+        """
+        oligos = self._oligos
+        if sort:
+            oligos = sorted(oligos, key=lambda oligo: (oligo.strand5p().idNum(),
+                                                       oligo.strand5p().idx5Prime()))
+        else:
+            oligos = list(oligos)
+        for oligo in oligos:
+            if oligo.strand5p().strandSet().isScaffold():
+                if not scaffold:
+                    continue
+            elif not staples:
+                continue
+            yield oligo.sequenceExportRow()
+    # end def
+
+    def writeSequences(self, f, delimiter=',', sort=False, scaffold=True, staples=True):
+        """Write a header and the export row of each oligo to a file object
+        as they are generated, see :meth:`iterSequences`
+
+        Args:
+            f (file): text file object open for writing
+            delimiter (str, optional): ``','`` for csv or ``'\\t'`` for tsv
+            sort (bool, optional): see :meth:`iterSequences`
+            scaffold (bool, optional): see :meth:`iterSequences`
+            staples (bool, optional): see :meth:`iterSequences`
+        """
+        writer = csv.writer(f, delimiter=delimiter, lineterminator='\n')
+        writer.writerow(SEQUENCE_EXPORT_KEYS)
+        writer.writerows(self.iterSequences(sort=sort, scaffold=scaffold, staples=staples))
+    # end def
+
     def getSequences(self):
-        """getSequences"""
-        # s = "Start\tEnd\tColor\tMod5\tSequence\tMod3\tAbstractSequence\n"
-        keys = ['Start', 'End', 'Color', 'Mod5',
-                'Sequence', 'Mod3', 'AbstractSequence']
-        out = {key: [] for key in keys}
-        for oligo in self._oligos:
-            oligo.sequenceExport(out)
-        df = pd.DataFrame(out, columns=keys)
-        s = df.to_csv(index=False)
-        return s
+        """
+        Returns:
+            str: csv of the export rows of all oligos, see
+                :meth:`writeSequences`
+        """
+        f = io.StringIO()
+        self.writeSequences(f)
+        return f.getvalue()
+    # end def
+
+    def rotationSweep(self, scaffold):
+        """Precompute the pairing of the staples with `scaffold` to score
+        every rotation of a scaffold sequence without applying it
+
+        Args:
+            scaffold (Oligo):
+
+        Returns:
+            RotationSweep:
+        """
+        return RotationSweep(self, scaffold)
+    # end def
 
     def getIdNums(self):
         """return the set of all ids used"""
@@ -2488,6 +3129,40 @@ class NucleicAcidPart(Part):
                 e.redo()
     # end def
 
+    def deferSignals(self):
+        """Context manager for bulk edits of the part, see
+        `Document.deferSignals`.  The queued `strandHasNewOligoSignal` and
+        `strandConnectionChangedSignal` of the strands of the part are
+        replaced by a single `partOligosRebuiltSignal`
+        """
+        return self._document.deferSignals(self._aggregateOligoSignals)
+    # end def
+
+    def _aggregateOligoSignals(self, queue):
+        """Aggregator of :meth:`deferSignals`
+
+        Args:
+            queue (list): of form [((sender, signal name), emit, args), ...]
+                in emission order, modified in place
+
+        Returns:
+            callable: emitting `partOligosRebuiltSignal` or ``None``
+        """
+        strands = {}
+        kept = []
+        for item in queue:
+            sender, name = item[0]
+            if name in _OLIGO_SIGNAL_NAMES and sender.part() is self:
+                strands[sender] = None
+            else:
+                kept.append(item)
+        if not strands:
+            return None
+        queue[:] = kept
+        strands = list(strands)
+        return lambda: self.partOligosRebuiltSignal.emit(self, strands)
+    # end def
+
     def removeAllOligos(self, use_undostack=True):
         # clear existing oligos
         cmds = []
@@ -2519,12 +3194,15 @@ class NucleicAcidPart(Part):
                 return k
 
         # Convert lengths to absolute positions
-        abs_positions = []
-        for olg_len in len_list:
-            id_num, ss_type, idx = oligo.getAbsolutePositionAtLength(olg_len)
-            abs_positions.append((id_num, ss_type, idx))
+        abs_positions = oligo.getAbsolutePositionsAtLengths(len_list)
+        for olg_len, position in zip(len_list, abs_positions):
+            if position is None:
+                return olg_len
+            id_num, ss_type, idx = position
             ss = self.getStrandSets(id_num)[ss_type]
             strand = ss.getStrand(idx)
+            if strand is None:
+                return olg_len
             if strand.hasXoverAt(idx):
                 # print("Will remove xover at len={0}, <VH{1}.{2}>[{3}]".format(olg_len, id_num, ss_type, idx))
                 pass
@@ -2536,6 +3214,11 @@ class NucleicAcidPart(Part):
                 return (id_num, ss_type, idx)
 
         # Now break for real
+        with self.deferSignals():
+            return self._splitAtAbsolutePositions(abs_positions)
+    # end def
+
+    def _splitAtAbsolutePositions(self, abs_positions):
         for id_num, ss_type, idx in abs_positions:
             ss = self.getStrandSets(id_num)[ss_type]
             strand = ss.getStrand(idx)
@@ -2625,11 +3308,14 @@ class NucleicAcidPart(Part):
         lists that have lengths equal to that of x_list and y_list (which must
         also be lists with equal lengths).
 
-        For each element in the specified lists, a CreateVirtualHelixCommand is
-        created and queued in a list.  execCommandList is then called to batch
-        the creation of virtual helices in an undo stack macro.  This results in
-        one undo/redo operation for all the virtual helices created in this
-        batch
+        When neither `properties` nor an unsafe creation is requested, a
+        single BatchCreateVirtualHelicesCommand creates all of the virtual
+        helices in one vectorized pass and emits one
+        `partVirtualHelicesAddedSignal`.  Otherwise, for each element in the
+        specified lists, a CreateVirtualHelixCommand is created and queued in
+        a list.  execCommandList is then called to batch the creation of
+        virtual helices in an undo stack macro.  This results in one undo/redo
+        operation for all the virtual helices created in this batch
 
         Args:
             x_list (list):  A list of length N corresponding to the x
@@ -2671,6 +3357,23 @@ class NucleicAcidPart(Part):
         assert parity is None or isinstance(parity, (list, tuple))
         assert parity is None or len(parity) == len(x_list)
 
+        if properties is None and (safe is None or all(safe)):
+            origins = []
+            lengths = []
+            id_numbers = []
+            for i, x in enumerate(x_list):
+                origins.append((x, y_list[i], z_list[i] if z_list else 0.0))
+                lengths.append(length[i] if length else self._STEP_SIZE*2)
+                _id_num = id_num[i] if id_num else None
+                # Reserve the _id_num to prevent id_number collisions between VHs created in this loop
+                if _id_num is None:
+                    _id_num = self._getNewIdNum(parity=parity[i] if parity else None)
+                    self._reserveIdNum(requested_id_num=_id_num)
+                id_numbers.append(_id_num)
+            command = BatchCreateVirtualHelicesCommand(self, origins, lengths, id_numbers)
+            util.execCommandList(self, commands=[command], desc='SPA', use_undostack=use_undo_stack)
+            return id_numbers
+
         commands = []
         id_numbers = []
 
@@ -2701,6 +3404,55 @@ class NucleicAcidPart(Part):
         return id_numbers
     # end def
 
+    def importVirtualHelices(self, id_nums, origins, lengths, properties):
+        """Create virtual helices read from a file in one pass without
+        commands or the undo stack.  Coordinates, properties and strandsets
+        of all virtual helices are allocated together and the neighbors are
+        taken from the 'neighbors' property rather than computed.  Emits a
+        single `partVirtualHelicesAddedSignal`
+
+        Args:
+            id_nums (list): of :obj:`int` virtual helix ID numbers
+            origins (array-like): (N, 3) of :obj:`float` origins
+            lengths (list): of :obj:`int` length of each virtual helix
+            properties (dict): of form {key: list of the value of each
+                virtual helix}
+
+        Returns:
+            list: of :obj:`VirtualHelix`
+        """
+        max_len = self.getProperty('max_vhelix_length')
+        lengths = [max(length, max_len) for length in lengths]
+        vhs = self._createHelices(id_nums, origins, (0, 0, 1), lengths, self.getColor(),
+                                  properties=properties)
+        self.partVirtualHelicesAddedSignal.emit(self, list(id_nums))
+        return vhs
+    # end def
+
+    def importXovers(self, xovers):
+        """Install crossovers read from a file without commands or the undo
+        stack and without updating oligos, like :meth:`createXover` with
+        ``update_oligo=False``.  Call `RefreshOligosCommand` after
+
+        Args:
+            xovers (list): of :obj:`tuple` of form (from_id, from_is_fwd,
+                from_idx, to_id, to_is_fwd, to_idx) from the 3' end of a
+                strand to the 5' end of another
+        """
+        getStrand = self.getStrand
+        for from_id, from_is_fwd, from_idx, to_id, to_is_fwd, to_idx in xovers:
+            strand5p = getStrand(from_is_fwd, from_id, from_idx)
+            strand3p = getStrand(to_is_fwd, to_id, to_idx)
+            if (strand5p is not strand3p and strand5p.idx3Prime() == from_idx and
+                    strand3p.idx5Prime() == to_idx):
+                strand5p.setConnection3p(strand3p)
+                strand3p.setConnection5p(strand5p)
+            else:
+                # the crossover splits strands
+                self.createXover(strand5p, from_idx, strand3p, to_idx,
+                                 update_oligo=False, use_undostack=False)
+    # end def
+
     def removeVirtualHelix(self, id_num, use_undostack=True):
         """Removes a VirtualHelix from the model. Accepts a reference to the
         VirtualHelix, or a (row,col) lattice coordinate to perform a lookup.
@@ -2956,7 +3708,7 @@ class NucleicAcidPart(Part):
     # end def
 
     def setVirtualHelixSize(self, id_num, new_size, use_undostack=True, zoom_to_fit=False):
-        old_size = self.vh_properties.loc[id_num, 'length']
+        old_size = self.vh_properties.getValue(id_num, 'length')
         delta = int(new_size - old_size)
         c = ResizeVirtualHelixCommand(self, id_num, True, delta, zoom_to_fit)
         util.doCmd(self, c, use_undostack=use_undostack)
@@ -2980,38 +3732,88 @@ class NucleicAcidPart(Part):
         do_deselect tells a view to clear selections that might have
         undesirable Object parenting to make sure the translations are set
         correctly.  set to True when "undo-ing"
+
+        The virtual helices in `vh_set` move rigidly so neighbor relations
+        within the set are kept as is.  Only relations between the set and
+        the rest of the part are recomputed, in one pass over the block, and
+        `partVirtualHelixPropertyChangedSignal` is only emitted for virtual
+        helices whose neighbors changed.
         """
-        threshold = 2.1*self._radius
-        # 1. get old neighbor list
+        graph = self._neighbor_graph
+        moved = set(vh_set)
+        # 1. get old neighbors outside of the moved block
         old_neighbors = set()
-        for id_num in vh_set:
-            neighbors = self._getVirtualHelixOriginNeighbors(id_num, threshold)
-            old_neighbors.update(neighbors)
+        for id_num in moved:
+            old_neighbors.update(graph.neighbors(id_num).tolist())
+        old_neighbors.difference_update(moved)
         # 2. move in the virtual_helix_group
         self._translateCoordinates(vh_set, (dx, dy, dz))
+        if dx == 0 and dy == 0:
+            # origins did not move so neither did the neighbors
+            self.partVirtualHelicesTranslatedSignal.emit(self, vh_set, old_neighbors, do_deselect)
+            return
         # 3. update neighbor calculations
-        new_neighbors = set()
-        for id_num in vh_set:
-            neighbors = self._getVirtualHelixOriginNeighbors(id_num, threshold)
-            try:
-                self.setVirtualHelixProperties(id_num, 'neighbors', str(list(neighbors)), use_undostack=False)
-            except Exception:
-                print("neighbors", list(neighbors))
-                raise
-            new_neighbors.update(neighbors)
+        block_pairs = self._blockOriginNeighbors(moved, 2.1*self._radius)
+        new_neighbors = defaultdict(list)   # moved id_num: outside neighbors
+        moved_neighbors = defaultdict(list)  # outside id_num: moved neighbors
+        for id_num, neighbor_id in block_pairs:
+            new_neighbors[id_num].append(neighbor_id)
+            moved_neighbors[neighbor_id].append(id_num)
+        for id_num in moved:
+            neighbors = [x for x in graph.neighbors(id_num).tolist() if x in moved]
+            self._setVirtualHelixNeighbors(id_num, neighbors + new_neighbors[id_num])
 
         # now update the old and new neighbors that were not in the vh set
-        left_overs = new_neighbors.union(old_neighbors).difference(vh_set)
+        left_overs = old_neighbors.union(moved_neighbors)
         for id_num in left_overs:
-            neighbors = self._getVirtualHelixOriginNeighbors(id_num, threshold)
-            try:
-                self.setVirtualHelixProperties(id_num, 'neighbors', str(list(neighbors)), use_undostack=False)
-            except Exception:
-                print("neighbors", list(neighbors))
-                raise
+            neighbors = [x for x in graph.neighbors(id_num).tolist() if x not in moved]
+            self._setVirtualHelixNeighbors(id_num, neighbors + moved_neighbors.get(id_num, []))
         self.partVirtualHelicesTranslatedSignal.emit(self, vh_set, left_overs, do_deselect)
     # end def
 
+    def _blockOriginNeighbors(self, id_nums, radius, include_internal=False):
+        """Find all pairs of a virtual helix in `id_nums` and a virtual helix
+        not in `id_nums` with origins within `radius` of each other
+
+        Args:
+            id_nums (set): of :obj:`int` virtual helix ID numbers
+            radius (float): radial distance within which a neighbors origin exists
+            include_internal (bool): optional, also find pairs where both
+                virtual helices are in `id_nums`.  Default is ``False``
+
+        Returns:
+            list: of :obj:`tuple` (id_num, neighbor_id) with `id_num` in
+                `id_nums`
+        """
+        if not id_nums:
+            return []
+        block = np.fromiter(id_nums, dtype=int, count=len(id_nums))
+        block_pts = self._origin_pts[block]
+        x1, y1 = block_pts.min(axis=0) - radius
+        x2, y2 = block_pts.max(axis=0) + radius
+        candidates = self._origin_grid.queryRect(x1, y1, x2, y2)
+        if not include_internal:
+            candidates = candidates[~np.isin(candidates, block)]
+        if len(candidates) == 0:
+            return []
+        candidate_pts = self._origin_pts[candidates]
+        rsquared = radius*radius
+        # bound the size of the distance matrix
+        step = max(1, (1 << 20) // len(candidates))
+        out = []
+        for i in range(0, len(block), step):
+            difference = block_pts[i:i + step, np.newaxis, :] - candidate_pts
+            delta = np.einsum('ijk,ijk->ij', difference, difference)
+            rows, cols = np.nonzero(delta <= rsquared)
+            pair_ids = block[rows + i]
+            neighbor_ids = candidates[cols]
+            if include_internal:
+                is_other = pair_ids != neighbor_ids
+                pair_ids, neighbor_ids = pair_ids[is_other], neighbor_ids[is_other]
+            out.extend(zip(pair_ids.tolist(), neighbor_ids.tolist()))
+        return out
+    # end def
+
     ### PRIVATE SUPPORT METHODS ###
 
     ### PUBLIC SUPPORT METHODS ###
@@ -3071,11 +3873,14 @@ class NucleicAcidPart(Part):
         return self.getProperty('virtual_helix_order')
     # end def
 
-    def setImportedVHelixOrder(self, ordered_id_list, check_batch=True):
+    def setImportedVHelixOrder(self, ordered_id_list, check_batch=True, use_undostack=True):
         """Used on file import to store the order of the virtual helices.
         TODO: do something with check_batch or remove it
         """
-        self.setProperty('virtual_helix_order', ordered_id_list)
+        if use_undostack:
+            self.setProperty('virtual_helix_order', ordered_id_list)
+        else:
+            self._setProperty('virtual_helix_order', ordered_id_list, emit_signals=True)
     # end def
 
     def oligos(self):
@@ -3223,6 +4028,27 @@ class NucleicAcidPart(Part):
         return self._insertions
     # end def
 
+    def _strandsChanged(self):
+        """Invalidate the cached 5' to 3' length tables of all oligos
+        """
+        self._strand_version += 1
+    # end def
+
+    def _insertionsChanged(self, id_num, idx):
+        """Invalidate the cached total lengths of the strands covering an
+        insertion and the oligo length tables
+
+        Args:
+            id_num (int): virtual helix ID number
+            idx (int): index of the insertion
+        """
+        for strandset in (self.fwd_strandsets[id_num], self.rev_strandsets[id_num]):
+            strand = strandset.getStrand(idx)
+            if strand is not None:
+                strand._total_length = None
+        self._strand_version += 1
+    # end def
+
     def dumpInsertions(self):
         """ Serialize insertions
 
@@ -0,0 +1,148 @@
+import math
+
+import numpy as np
+
+
+class OriginGrid(object):
+    """Uniform spatial hash of virtual helix origins in the XY plane.
+
+    Origins are bucketed into square cells of `cell_size` so radius and
+    rectangle queries only visit the cells overlapping the query instead of
+    every origin in the part.  Queries return candidate ID numbers, callers
+    do the exact distance or bounds test on the candidates.
+    """
+
+    def __init__(self, cell_size):
+        """
+        Args:
+            cell_size (float): width of a cell, ideally the lattice spacing
+        """
+        self.cell_size = float(cell_size)
+        self._cells = {}
+        """dict: of form {(i, j): set of id_nums}"""
+        self._id_num_cells = {}
+        """dict: of form {id_num: (i, j)}"""
+    # end def
+
+    def __len__(self):
+        return len(self._id_num_cells)
+
+    def __contains__(self, id_num):
+        return id_num in self._id_num_cells
+
+    def copy(self):
+        """
+        Returns:
+            OriginGrid: a new grid with the same contents
+        """
+        new_grid = OriginGrid(self.cell_size)
+        new_grid._cells = {k: set(v) for k, v in self._cells.items()}
+        new_grid._id_num_cells = self._id_num_cells.copy()
+        return new_grid
+    # end def
+
+    def clear(self):
+        self._cells = {}
+        self._id_num_cells = {}
+    # end def
+
+    def cellKey(self, x, y):
+        """
+        Args:
+            x (float):
+            y (float):
+
+        Returns:
+            tuple: of :obj:`int` cell indices (i, j) of the point
+        """
+        cs = self.cell_size
+        return (math.floor(x / cs), math.floor(y / cs))
+    # end def
+
+    def insert(self, id_num, x, y):
+        """Add or move the origin of a virtual helix
+
+        Args:
+            id_num (int): virtual helix ID number
+            x (float):
+            y (float):
+        """
+        key = self.cellKey(x, y)
+        id_num_cells = self._id_num_cells
+        old_key = id_num_cells.get(id_num)
+        if old_key == key:
+            return
+        if old_key is not None:
+            self._discard(id_num, old_key)
+        id_num_cells[id_num] = key
+        cell = self._cells.get(key)
+        if cell is None:
+            self._cells[key] = cell = set()
+        cell.add(id_num)
+    # end def
+
+    def remove(self, id_num):
+        """
+        Args:
+            id_num (int): virtual helix ID number
+        """
+        key = self._id_num_cells.pop(id_num, None)
+        if key is not None:
+            self._discard(id_num, key)
+    # end def
+
+    def _discard(self, id_num, key):
+        cells = self._cells
+        cell = cells[key]
+        cell.discard(id_num)
+        if not cell:
+            del cells[key]
+    # end def
+
+    def queryRect(self, x1, y1, x2, y2):
+        """Get candidate ID numbers of all origins in cells overlapping
+        the rectangle
+
+        Args:
+            x1 (float): lower left x
+            y1 (float): lower left y
+            x2 (float): upper right x
+            y2 (float): upper right y
+
+        Returns:
+            ndarray: sorted candidate ID numbers
+        """
+        i1, j1 = self.cellKey(x1, y1)
+        i2, j2 = self.cellKey(x2, y2)
+        cells = self._cells
+        out = []
+        if (i2 - i1 + 1)*(j2 - j1 + 1) > len(cells):
+            # the rectangle covers more cells than are occupied
+            for (i, j), cell in cells.items():
+                if i1 <= i <= i2 and j1 <= j <= j2:
+                    out.extend(cell)
+        else:
+            for i in range(i1, i2 + 1):
+                for j in range(j1, j2 + 1):
+                    cell = cells.get((i, j))
+                    if cell:
+                        out.extend(cell)
+        out.sort()
+        return np.array(out, dtype=int)
+    # end def
+
+    def queryRadius(self, x, y, radius):
+        """Get candidate ID numbers of all origins in cells overlapping
+        the square bounding the circle
+
+        Args:
+            x (float): center x
+            y (float): center y
+            radius (float):
+
+        Returns:
+            ndarray: sorted candidate ID numbers
+        """
+        return self.queryRect(x - radius, y - radius, x + radius, y + radius)
+    # end def
+# end class
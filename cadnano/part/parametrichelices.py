@@ -0,0 +1,235 @@
+from collections import OrderedDict
+
+import numpy as np
+
+Z_DIRECTION = (0., 0., 1.)
+
+
+class ParametricHelices(object):
+    """Coordinate storage for a `NucleicAcidPart` with a
+    `PointType.Z_ONLY` point type that keeps only the number of bases and
+    the axis z of base 0 of every virtual helix.  Points are evaluated on
+    demand from those, the origin and the `vh_properties` of the virtual
+    helix.  Evaluated points of the most recently used virtual helices are
+    cached.
+
+    The interface matches :class:`HelixBlocks`.  The points of a virtual
+    helix are always those `NucleicAcidPart.resetCoordinates` produces, so
+    resizing never moves points of other virtual helices and changing a
+    property only drops the cached points.
+    """
+    CACHE_SIZE = 64
+
+    def __init__(self, part):
+        """
+        Args:
+            part (NucleicAcidPart):
+        """
+        self._part = part
+        self._sizes = {}
+        """dict: of form {id_num: number of bases}"""
+        self._z0 = {}
+        """dict: of form {id_num: axis z of base 0}"""
+        self._cache = OrderedDict()
+        self._sorted_id_nums = None
+        self._offsets_valid = False
+        self._compacted = None
+        self.total_points = 0
+    # end def
+
+    def __contains__(self, id_num):
+        return id_num in self._sizes
+
+    def create(self, id_num):
+        self._sizes[id_num] = 0
+        self._z0[id_num] = 0.
+        self._layoutChanged()
+    # end def
+
+    def remove(self, id_num):
+        self.total_points -= self._sizes.pop(id_num)
+        del self._z0[id_num]
+        self._cache.pop(id_num, None)
+        self._layoutChanged()
+    # end def
+
+    def _layoutChanged(self):
+        self._sorted_id_nums = None
+        self._offsets_valid = False
+        self._compacted = None
+    # end def
+
+    def _evaluate(self, id_num, start, stop):
+        """
+        Returns:
+            tuple: of :obj:`ndarray` (axis_pts, fwd_pts, rev_pts) of bases
+                `start` to `stop` of a virtual helix
+        """
+        part = self._part
+        x, y = part._origin_pts[id_num]
+        origins = np.array([[x, y, self._z0[id_num]]])
+        return part._pointsFromDirections(np.array([id_num]), origins, Z_DIRECTION,
+                                          np.array([stop - start]),
+                                          starts=np.array([start]))
+    # end def
+
+    def views(self, id_num):
+        """
+        Returns:
+            tuple: of read only :obj:'ndarray' of the form::
+
+                (axis_pts, fwd_pts, rev_pts)
+        """
+        cache = self._cache
+        points = cache.get(id_num)
+        if points is not None:
+            cache.move_to_end(id_num)
+            return points
+        points = self._evaluate(id_num, 0, self._sizes[id_num])
+        for pts in points:
+            pts.flags.writeable = False
+        cache[id_num] = points
+        if len(cache) > self.CACHE_SIZE:
+            cache.popitem(last=False)
+        return points
+    # end def
+
+    def axisPoint(self, id_num, idx):
+        """
+        Returns:
+            ndarray: axis point of base `idx` of a virtual helix
+        """
+        points = self._cache.get(id_num)
+        if points is not None:
+            return points[0][idx]
+        return self._evaluate(id_num, idx, idx + 1)[0][0]
+    # end def
+
+    def size(self, id_num):
+        return self._sizes[id_num]
+    # end def
+
+    def add(self, id_num, points, is_right):
+        num_points = len(points[0])
+        if self._sizes[id_num] == 0:
+            self._z0[id_num] = points[0][0][2]
+        elif not is_right:
+            self._z0[id_num] -= self._part._BASE_WIDTH*num_points
+        self._sizes[id_num] += num_points
+        self.total_points += num_points
+        self._layoutChanged()
+    # end def
+
+    def trim(self, id_num, length, is_right):
+        if not is_right:
+            self._z0[id_num] += self._part._BASE_WIDTH*length
+        self._sizes[id_num] -= length
+        self.total_points -= length
+        self._layoutChanged()
+    # end def
+
+    def set(self, id_num, points, idx_start):
+        """The points are ignored as they are evaluated from the current
+        parameters of the virtual helix
+        """
+        self.invalidate([id_num])
+    # end def
+
+    def translate(self, id_num, delta):
+        """The x and y of `delta` are taken from the origin of the virtual
+        helix which the part moves
+
+        Args:
+            id_num (int): virtual helix ID number
+            delta (array-like): of :obj:`float` of length 3
+        """
+        self._z0[id_num] += delta[2]
+        self.invalidate([id_num])
+    # end def
+
+    def invalidate(self, id_nums):
+        """Drop the cached points of virtual helices whose parameters changed
+        """
+        cache = self._cache
+        for id_num in id_nums:
+            cache.pop(id_num, None)
+        self._compacted = None
+    # end def
+
+    def sortedIdNums(self):
+        if self._sorted_id_nums is None:
+            self._sorted_id_nums = sorted(self._sizes)
+        return self._sorted_id_nums
+    # end def
+
+    def refreshOffsets(self, offset_and_size):
+        """Write the offsets of the compacted layout into `offset_and_size`
+
+        Args:
+            offset_and_size (list): of :obj:`tuple` (offset, size) indexed by
+                ID number
+        """
+        if self._offsets_valid:
+            return
+        sizes = self._sizes
+        offset = 0
+        for id_num in self.sortedIdNums():
+            size = sizes[id_num]
+            offset_and_size[id_num] = (offset, size)
+            offset += size
+        self._offsets_valid = True
+    # end def
+
+    def isCompact(self):
+        return self._compacted is not None
+    # end def
+
+    def _parameterArrays(self):
+        id_num_list = self.sortedIdNums()
+        ids = np.array(id_num_list, dtype=int)
+        sizes = np.array([self._sizes[id_num] for id_num in id_num_list], dtype=int)
+        z0 = np.array([self._z0[id_num] for id_num in id_num_list], dtype=float)
+        return ids, sizes, z0
+    # end def
+
+    def compact(self, offset_and_size):
+        """Evaluate the global point arrays of all virtual helices at once
+
+        Args:
+            offset_and_size (list): of :obj:`tuple` (offset, size) indexed by
+                ID number
+
+        Returns:
+            tuple: of :obj:`ndarray` of the form::
+
+                (axis_pts, fwd_pts, rev_pts, id_nums, indices)
+        """
+        self.refreshOffsets(offset_and_size)
+        if self._compacted is not None:
+            return self._compacted
+        ids, sizes, z0 = self._parameterArrays()
+        origins = np.column_stack((self._part._origin_pts[ids], z0)) if len(ids) else np.empty((0, 3))
+        axis_pts, fwd_pts, rev_pts = self._part._pointsFromDirections(ids, origins,
+                                                                      Z_DIRECTION, sizes)
+        index_dtype = self._part._index_dtype
+        id_nums = np.repeat(ids.astype(index_dtype), sizes)
+        offsets = np.cumsum(sizes) - sizes
+        indices = (np.arange(self.total_points) - np.repeat(offsets, sizes)).astype(index_dtype)
+        self._compacted = (axis_pts, fwd_pts, rev_pts, id_nums, indices)
+        return self._compacted
+    # end def
+
+    def zBoundsIds(self):
+        """
+        Returns:
+            tuple: of :obj:`int`, of form (ID_z_min, ID_z_max)
+        """
+        ids, sizes, z0 = self._parameterArrays()
+        is_empty = sizes == 0
+        if is_empty.all():
+            return -1, -1
+        z_lo = np.where(is_empty, np.inf, z0)
+        z_hi = np.where(is_empty, -np.inf, z0 + self._part._BASE_WIDTH*(sizes - 1))
+        return ids[np.argmin(z_lo)].item(), ids[np.argmax(z_hi)].item()
+    # end def
+# end class
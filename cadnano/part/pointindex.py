@@ -0,0 +1,188 @@
+import numpy as np
+
+
+class PointIndex(object):
+    """Bounding volume index over one of the per base point sets of a
+    `NucleicAcidPart` i.e. axis, forward or reverse points
+
+    Each virtual helix is split into leaves of `LEAF_SIZE` consecutive bases
+    with an axis aligned bounding box per leaf.  Leaves are stored by ID
+    number and local index so they survive the offset changes of other
+    virtual helices.  Leaves of a virtual helix are only rebuilt after
+    :meth:`invalidate` is called for it and the next query happens.
+    """
+    LEAF_SIZE = 64
+
+    def __init__(self, part, which):
+        """
+        Args:
+            part (NucleicAcidPart):
+            which (int): index into the tuple returned by
+                `NucleicAcidPart.getCoordinates` i.e. 0 for axis, 1 for
+                forward and 2 for reverse points
+        """
+        self._part = part
+        self._which = which
+        self._leaves = {}
+        """dict: of form {id_num: (starts, stops, lo, hi)}"""
+        self._dirty = set()
+        self._all_dirty = True
+        self._flat = None
+    # end def
+
+    def invalidate(self, id_nums=None):
+        """Mark virtual helices as needing a rebuild
+
+        Args:
+            id_nums (iterable): optional, of :obj:`int` virtual helix ID
+                numbers.  Default is ``None`` which rebuilds all of them
+        """
+        if id_nums is None:
+            self._all_dirty = True
+            self._dirty.clear()
+        else:
+            self._dirty.update(id_nums)
+        self._flat = None
+    # end def
+
+    def _update(self):
+        """Rebuild the leaves of the dirty virtual helices and the flat leaf
+        arrays used for queries
+        """
+        if self._flat is not None:
+            return self._flat
+        part = self._part
+        leaves = self._leaves
+        if self._all_dirty:
+            leaves.clear()
+            dirty = part.getIdNums()
+            self._all_dirty = False
+        else:
+            dirty = self._dirty
+        which = self._which
+        LEAF_SIZE = self.LEAF_SIZE
+        for id_num in dirty:
+            try:
+                helix_pts = part.getCoordinates(id_num)[which]
+            except KeyError:
+                leaves.pop(id_num, None)
+                continue
+            size = len(helix_pts)
+            if size == 0:
+                leaves.pop(id_num, None)
+                continue
+            starts = np.arange(0, size, LEAF_SIZE)
+            stops = np.minimum(starts + LEAF_SIZE, size)
+            leaves[id_num] = (starts, stops,
+                              np.minimum.reduceat(helix_pts, starts, axis=0),
+                              np.maximum.reduceat(helix_pts, starts, axis=0))
+        self._dirty = set()
+
+        id_nums = sorted(leaves)
+        if id_nums:
+            leaf_list = [leaves[id_num] for id_num in id_nums]
+            leaf_id_nums = np.concatenate([np.full(len(leaf[0]), id_num, dtype=int)
+                                           for id_num, leaf in zip(id_nums, leaf_list)])
+            starts = np.concatenate([leaf[0] for leaf in leaf_list])
+            stops = np.concatenate([leaf[1] for leaf in leaf_list])
+            lo = np.concatenate([leaf[2] for leaf in leaf_list])
+            hi = np.concatenate([leaf[3] for leaf in leaf_list])
+        else:
+            leaf_id_nums = starts = stops = np.empty((0,), dtype=int)
+            lo = hi = np.empty((0, 3), dtype=float)
+        self._flat = (leaf_id_nums, starts, stops, lo, hi)
+        return self._flat
+    # end def
+
+    def _leafDistanceSq(self, point):
+        """
+        Returns:
+            tuple: flat leaf arrays and the squared distance from `point` to
+                each leaf bounding box
+        """
+        flat = self._update()
+        lo, hi = flat[3], flat[4]
+        gap = np.maximum(np.maximum(lo - point, point - hi), 0.)
+        return flat, np.einsum('ij,ij->i', gap, gap)
+    # end def
+
+    def _leafDistanceSqPoints(self, leaf, flat, point):
+        """
+        Returns:
+            tuple: of :obj:`ndarray` (squared distances, local indices) of the
+                points in a leaf
+        """
+        leaf_id_nums, starts, stops = flat[0], flat[1], flat[2]
+        helix_pts = self._part.getCoordinates(leaf_id_nums[leaf])[self._which]
+        start, stop = starts[leaf], stops[leaf]
+        difference = helix_pts[start:stop] - point
+        return np.einsum('ij,ij->i', difference, difference), np.arange(start, stop)
+    # end def
+
+    def queryRadius(self, radius, point):
+        """Get all points closer than `radius` to `point`
+
+        Args:
+            radius (float): distance to consider
+            point (array-like): of :obj:`float` of length 3
+
+        Returns:
+            tuple: of :obj:`ndarray` (id_nums, indices) ordered by ID number
+                then index
+        """
+        point = np.asarray(point, dtype=self._part._point_dtype)
+        rsquared = radius*radius
+        flat, leaf_delta = self._leafDistanceSq(point)
+        out_id_nums = []
+        out_indices = []
+        for leaf in np.flatnonzero(leaf_delta < rsquared).tolist():
+            delta, indices = self._leafDistanceSqPoints(leaf, flat, point)
+            close = indices[delta < rsquared]
+            if len(close):
+                out_id_nums.append(np.full(len(close), flat[0][leaf], dtype=int))
+                out_indices.append(close)
+        if out_id_nums:
+            return np.concatenate(out_id_nums), np.concatenate(out_indices)
+        empty = np.empty((0,), dtype=int)
+        return empty, empty.copy()
+    # end def
+
+    def queryNearest(self, point, k=1):
+        """Get the `k` nearest points to `point`.  Leaves are visited in order
+        of their bounding box distance until no leaf can hold a closer point
+
+        Args:
+            point (array-like): of :obj:`float` of length 3
+            k (int): number of points to return
+
+        Returns:
+            tuple: of :obj:`ndarray` (id_nums, indices, distances) sorted by
+                distance
+        """
+        point = np.asarray(point, dtype=self._part._point_dtype)
+        flat, leaf_delta = self._leafDistanceSq(point)
+        deltas = []
+        id_nums = []
+        indices = []
+        count = 0
+        kth_delta = np.inf
+        for leaf in np.argsort(leaf_delta, kind='stable').tolist():
+            if count >= k and leaf_delta[leaf] > kth_delta:
+                break
+            delta, idxs = self._leafDistanceSqPoints(leaf, flat, point)
+            deltas.append(delta)
+            id_nums.append(np.full(len(delta), flat[0][leaf], dtype=int))
+            indices.append(idxs)
+            count += len(delta)
+            if count >= k:
+                kth_delta = np.partition(np.concatenate(deltas), k - 1)[k - 1]
+        if not deltas:
+            empty = np.empty((0,), dtype=int)
+            return empty, empty.copy(), np.empty((0,), dtype=float)
+        deltas = np.concatenate(deltas)
+        id_nums = np.concatenate(id_nums)
+        indices = np.concatenate(indices)
+        order = np.lexsort((indices, id_nums, deltas))[:k]
+        return id_nums[order], indices[order], np.sqrt(deltas[order])
+    # end def
+# end class
@@ -1,5 +1,4 @@
 from cadnano.proxies.cnproxy import UndoCommand
-from cadnano.strand import Strand
 
 
 class RefreshOligosCommand(UndoCommand):
@@ -14,60 +13,90 @@ class RefreshOligosCommand(UndoCommand):
     Hence, we disable oligo assignment during the xover creation step,
     and then do it all in one pass at the end with this command.
 
+    The strands connected through their 3' connections are grouped with a
+    union-find in a single pass, and each group keeps the oligo of its first
+    strand in virtual helix order.
+
     This command is meant for non-undoable steps, like file-io.
+
+    Args:
+        part (NucleicAcidPart):
+        emit_signals (bool, optional): if ``False`` the per strand
+            `strandHasNewOligoSignal` and `strandConnectionChangedSignal` are
+            replaced by a single `partOligosRebuiltSignal`, default ``True``
     """
 
-    def __init__(self, part):
+    def __init__(self, part, emit_signals=True):
         super(RefreshOligosCommand, self).__init__("refresh oligos")
         self._part = part
+        self._emit_signals = emit_signals
     # end def
 
     def redo(self):
-        visited = {}
         part = self._part
+        emit_signals = self._emit_signals
+        strands = []
         for id_num in part.getIdNums():
             fwd_ss, rev_ss = part.getStrandSets(id_num)
-            for strand in rev_ss:
-                visited[strand] = False
-            for strand in fwd_ss:
-                visited[strand] = False
-
-        fSetOligo = Strand.setOligo
-        for strand in list(visited.keys()):
-            if visited[strand]:
-                continue
-            visited[strand] = True
-            start_oligo = strand.oligo()
-
-            strand5gen = strand.generator5pStrand()
-            # this gets the oligo and burns a strand in the generator
-            strand5 = next(strand5gen)
-            for strand5 in strand5gen:
-                oligo5 = strand5.oligo()
-                if oligo5 != start_oligo:
-                    oligo5.removeFromPart(emit_signals=True)
-                    fSetOligo(strand5, start_oligo, emit_signals=True)  # emits strandHasNewOligoSignal
-                visited[strand5] = True
-            # end for
-            start_oligo.setStrand5p(strand5)
-            # is it a loop?
-            if strand.connection3p() == strand5:
-                start_oligo._setLoop(True)
+            strands.extend(rev_ss)
+            strands.extend(fwd_ss)
+        strand_idxs = {strand: i for i, strand in enumerate(strands)}
+
+        # union-find where the root of a group is its lowest index
+        parent = list(range(len(strands)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = i = parent[parent[i]]
+            return i
+
+        for i, strand in enumerate(strands):
+            strand3p = strand._strand3p
+            if strand3p is not None:
+                root_a, root_b = find(i), find(strand_idxs[strand3p])
+                if root_a < root_b:
+                    parent[root_b] = root_a
+                elif root_b < root_a:
+                    parent[root_a] = root_b
+        # end for
+
+        groups = {}
+        for i, strand in enumerate(strands):
+            root = find(i)
+            if root in groups:
+                groups[root].append(strand)
             else:
-                strand3gen = strand.generator3pStrand()
-                strand3 = next(strand3gen)   # burn one
-                for strand3 in strand3gen:
-                    oligo3 = strand3.oligo()
-                    if oligo3 != start_oligo:
-                        oligo3.removeFromPart(emit_signals=True)
-                        fSetOligo(strand3, start_oligo, emit_signals=True)  # emits strandHasNewOligoSignal
-                    visited[strand3] = True
-                # end for
-            start_oligo.refreshLength(emit_signals=True)
+                groups[root] = [strand]
+
+        for root, group in groups.items():
+            start_strand = strands[root]
+            start_oligo = start_strand.oligo()
+            strand5p = None
+            length = 0
+            removed_oligos = set()
+            for strand in group:
+                oligo = strand.oligo()
+                if oligo is not start_oligo:
+                    if oligo not in removed_oligos:
+                        removed_oligos.add(oligo)
+                        oligo.removeFromPart(emit_signals=True)
+                    strand.setOligo(start_oligo, emit_signals=emit_signals)
+                if strand._strand5p is None:
+                    strand5p = strand
+                length += strand.totalLength()
+            # end for
+            # a loop starts 3' of the first strand
+            is_circular = strand5p is None
+            start_oligo.setStrand5p(start_strand._strand3p if is_circular else strand5p)
+            start_oligo._setLoop(is_circular)
+            start_oligo._setLength(length, emit_signals=True)
         # end for
 
-        for strand in visited.keys():
-            strand.strandConnectionChangedSignal.emit(strand)
+        if emit_signals:
+            for strand in strands:
+                strand.strandConnectionChangedSignal.emit(strand)
+        else:
+            part.partOligosRebuiltSignal.emit(part, strands)
     # end def
 
     def undo(self):
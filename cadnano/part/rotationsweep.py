@@ -0,0 +1,193 @@
+import numpy as np
+
+from cadnano import util
+
+_COMPLEMENT = np.frombuffer(util.complement_bytes, dtype=np.uint8)
+_SPACE = ord(' ')
+
+
+class RotationSweep(object):
+    """Headless evaluation of every circular rotation of a scaffold sequence.
+
+    The scaffold position paired with every base of the other oligos
+    (staples) is computed once, so the staple sequences of a rotation are a
+    single gather from the complemented scaffold sequence.  Nothing is
+    applied to the model, and neither the undo stack nor signals are touched,
+    until :meth:`applyRotation` is called.
+
+    Staple bases that pair with nothing are a space as after
+    `Oligo.applySequence` of the scaffold.  The sweep is only valid until the
+    strands, crossovers or insertions of the part change.
+    """
+
+    def __init__(self, part, scaffold):
+        """
+        Args:
+            part (NucleicAcidPart):
+            scaffold (Oligo): the oligo the sequence is applied to
+        """
+        self._part = part
+        self._scaffold = scaffold
+        scaf_strands, scaf_offsets = scaffold._lengthTable()
+
+        staples = [oligo for oligo in part.oligos() if oligo is not scaffold]
+        staples.sort(key=lambda oligo: oligo.strand5p().dump5p())
+        self._staples = staples
+
+        # offset and total length of every staple strand in the buffer
+        strand_spans = {}
+        bounds = [0]
+        for oligo in staples:
+            strands, offsets = oligo._lengthTable()
+            start = bounds[-1]
+            for i, strand in enumerate(strands):
+                strand_spans[strand] = (start + offsets[i], offsets[i + 1] - offsets[i])
+            bounds.append(start + offsets[-1])
+        self._bounds = bounds
+
+        pairs = np.full((bounds[-1],), -1, dtype=np.int64)
+        insertions = part.insertions()
+        for i, c_strand in enumerate(scaf_strands):
+            c_offset = scaf_offsets[i]
+            c_length = scaf_offsets[i + 1] - c_offset
+            c_low_idx, c_high_idx = c_strand.idxs()
+            id_insertions = insertions[c_strand.idNum()]
+            for s_strand in c_strand.getComplementStrands():
+                span = strand_spans.get(s_strand)
+                if span is None:
+                    continue
+                s_offset, s_length = span
+                s_low_idx, s_high_idx = s_strand.idxs()
+                low_idx, high_idx = util.overlap(s_low_idx, s_high_idx, c_low_idx, c_high_idx)
+                # same arithmetic as Strand.setComplementSequence
+                a = id_insertions.lengthBetween(s_low_idx, low_idx - 1)
+                b = id_insertions.lengthBetween(low_idx, high_idx)
+                c = id_insertions.lengthBetween(c_low_idx, low_idx - 1)
+                start = low_idx - s_low_idx + a
+                num_chars = b + high_idx - low_idx + 1
+                s_chars = np.arange(start, start + num_chars)
+                c_chars = s_chars + (low_idx - c_low_idx + c - start)
+                s_pos = s_offset + (s_chars if s_strand.isForward() else s_length - 1 - s_chars)
+                c_pos = c_offset + (c_chars if c_strand.isForward() else c_length - 1 - c_chars)
+                pairs[s_pos] = c_pos
+        self._pairs = pairs
+    # end def
+
+    def scaffold(self):
+        """
+        Returns:
+            Oligo: the scaffold of the sweep
+        """
+        return self._scaffold
+    # end def
+
+    def staples(self):
+        """
+        Returns:
+            list: of :class:`Oligo` in the order of :meth:`stapleSequences`
+        """
+        return list(self._staples)
+    # end def
+
+    def _gather(self, sequence):
+        """
+        Returns:
+            tuple: of form (comp, idxs) where ``comp[(idxs + rotation) %
+                len(sequence)]`` are the staple bases of a rotation and
+                negative `idxs` are unpaired
+        """
+        if isinstance(sequence, str):
+            sequence = sequence.encode('utf-8')
+        seq_length = len(sequence)
+        if seq_length == 0:
+            raise ValueError("sequence is empty")
+        comp = np.empty((seq_length + 1,), dtype=np.uint8)
+        comp[:seq_length] = _COMPLEMENT[np.frombuffer(sequence, dtype=np.uint8)]
+        comp[seq_length] = _SPACE
+        pairs = self._pairs
+        # bases of the scaffold beyond the sequence are blank like padding
+        idxs = np.where((pairs >= 0) & (pairs < seq_length), pairs, -1)
+        return comp, idxs
+    # end def
+
+    def _rotate(self, comp, idxs, rotation):
+        seq_length = len(comp) - 1
+        src = (idxs + rotation) % seq_length
+        src[idxs < 0] = seq_length
+        return comp[src].tobytes().decode('utf-8')
+    # end def
+
+    def _split(self, text):
+        bounds = self._bounds
+        return [text[bounds[i]:bounds[i + 1]] for i in range(len(bounds) - 1)]
+    # end def
+
+    def stapleSequences(self, sequence, rotation=0):
+        """
+        Args:
+            sequence (str): the scaffold sequence
+            rotation (int): start offset into `sequence`
+
+        Returns:
+            list: of :obj:`str` 5' to 3' sequences of :meth:`staples`
+        """
+        comp, idxs = self._gather(sequence)
+        return self._split(self._rotate(comp, idxs, rotation))
+    # end def
+
+    def scoreRotations(self, sequence, filters, rotations=None):
+        """Score rotations of `sequence`.  Each filter is called with the
+        list of staple sequences of a rotation and returns a number,
+        i.e.::
+
+            def gggg(staple_seqs):
+                return sum('GGGG' in seq for seq in staple_seqs)
+
+        Args:
+            sequence (str): the scaffold sequence
+            filters (list): of callables returning a penalty
+            rotations (iterable, optional): of :obj:`int` start offsets,
+                default is every rotation of `sequence`
+
+        Returns:
+            ndarray: summed penalty of the filters for each rotation
+        """
+        comp, idxs = self._gather(sequence)
+        if rotations is None:
+            rotations = range(len(comp) - 1)
+        rotate = self._rotate
+        split = self._split
+        scores = []
+        for rotation in rotations:
+            staple_seqs = split(rotate(comp, idxs, rotation))
+            scores.append(sum(f(staple_seqs) for f in filters))
+        return np.array(scores, dtype=float)
+    # end def
+
+    def bestRotation(self, sequence, filters, rotations=None):
+        """
+        Returns:
+            tuple: of form (rotation, score) of the lowest penalty, the
+                first one for ties.  See :meth:`scoreRotations` for args
+        """
+        if rotations is None:
+            rotations = range(len(sequence))
+        rotations = list(rotations)
+        scores = self.scoreRotations(sequence, filters, rotations)
+        i = int(np.argmin(scores))
+        return rotations[i], scores[i].item()
+    # end def
+
+    def applyRotation(self, sequence, rotation, use_undostack=True):
+        """Commit a rotation by applying it to the scaffold
+
+        Args:
+            sequence (str): the scaffold sequence
+            rotation (int): start offset into `sequence`
+            use_undostack (bool, optional): default is ``True``
+        """
+        rotation %= len(sequence)
+        self._scaffold.applySequence(sequence[rotation:] + sequence[:rotation],
+                                     use_undostack=use_undostack)
+    # end def
+# end class
@@ -0,0 +1,198 @@
+import numpy as np
+
+
+class VHPropertyStore(object):
+    """Struct of arrays storage of virtual helix properties indexed by ID
+    number.  Every property is a NumPy column typed from its default value:
+    `bool`, `int64`, `float64` or `object` for strings.
+
+    Scalar access returns native Python types as needed by QVariant, and
+    :meth:`column` gives vectorized access to a property across virtual
+    helices.
+    """
+
+    def __init__(self, keys, defaults, size):
+        """
+        Args:
+            keys (tuple): of :obj:`str` property names in column order
+            defaults (tuple): default value of each property
+            size (int): number of rows to allocate
+        """
+        self._keys = list(keys)
+        self._defaults = dict(zip(keys, defaults))
+        self._columns = {key: self._newColumn(self._defaults[key], size) for key in keys}
+        self._size = size
+    # end def
+
+    @staticmethod
+    def _newColumn(default, size):
+        if isinstance(default, bool):
+            dtype = bool
+        elif isinstance(default, int):
+            dtype = np.int64
+        elif isinstance(default, float):
+            dtype = float
+        else:
+            dtype = object
+        return np.full((size,), default, dtype=dtype)
+    # end def
+
+    def __len__(self):
+        return self._size
+
+    def keys(self):
+        """
+        Returns:
+            list: of :obj:`str` property names in column order
+        """
+        return list(self._keys)
+    # end def
+
+    def copy(self):
+        """
+        Returns:
+            VHPropertyStore: deep copy of the columns
+        """
+        new_store = VHPropertyStore(self._keys, [self._defaults[k] for k in self._keys], 0)
+        new_store._columns = {k: v.copy() for k, v in self._columns.items()}
+        new_store._size = self._size
+        return new_store
+    # end def
+
+    def resize(self, size):
+        """Grow the number of rows, filling new rows with the defaults
+
+        Args:
+            size (int): new number of rows
+        """
+        old_size = self._size
+        if size <= old_size:
+            return
+        defaults = self._defaults
+        for key, column in self._columns.items():
+            new_column = np.empty((size,), dtype=column.dtype)
+            new_column[:old_size] = column
+            new_column[old_size:] = defaults[key]
+            self._columns[key] = new_column
+        self._size = size
+    # end def
+
+    def resetRow(self, id_num):
+        """Restore the default values of a row
+
+        Args:
+            id_num (int): virtual helix ID number
+        """
+        defaults = self._defaults
+        for key, column in self._columns.items():
+            column[id_num] = defaults[key]
+    # end def
+
+    def column(self, key):
+        """
+        Args:
+            key (str): property name
+
+        Returns:
+            ndarray: the column of property `key`.  In place modification
+                changes the store
+
+        Raises:
+            KeyError: `key` is not a property
+        """
+        return self._columns[key]
+    # end def
+
+    def getValue(self, id_num, key):
+        """
+        Args:
+            id_num (int): virtual helix ID number
+            key (str): property name
+
+        Returns:
+            object: native Python value of the property
+        """
+        value = self._columns[key][id_num]
+        return value.item() if isinstance(value, np.generic) else value
+    # end def
+
+    def getValues(self, id_num, keys):
+        """
+        Args:
+            id_num (int): virtual helix ID number
+            keys (iterable): of :obj:`str` property names
+
+        Returns:
+            list: of native Python values of the properties
+        """
+        getValue = self.getValue
+        return [getValue(id_num, key) for key in keys]
+    # end def
+
+    def setValue(self, id_num, key, value):
+        """Set a property.  Assigning a non integral float to an integer
+        column promotes the column to float
+
+        Args:
+            id_num (int): virtual helix ID number
+            key (str): property name
+            value (object):
+
+        Raises:
+            KeyError: `key` is not a property
+        """
+        column = self._columns[key]
+        kind = column.dtype.kind
+        if kind == 'i' and isinstance(value, (float, np.floating)) and not float(value).is_integer():
+            self._columns[key] = column = column.astype(float)
+        column[id_num] = value
+    # end def
+
+    def setValues(self, id_nums, key, values):
+        """Vectorized :meth:`setValue` of a property of many virtual helices
+
+        Args:
+            id_nums (array-like): of :obj:`int` virtual helix ID numbers
+            key (str): property name
+            values (list): value of each virtual helix of `id_nums`
+
+        Raises:
+            KeyError: `key` is not a property
+        """
+        column = self._columns[key]
+        kind = column.dtype.kind
+        if kind == 'O':
+            new_values = np.empty((len(values),), dtype=object)
+            new_values[:] = values
+        else:
+            new_values = np.asarray(values)
+            if kind == 'i' and new_values.dtype.kind == 'f' and \
+                    not np.all(np.mod(new_values, 1.) == 0.):
+                self._columns[key] = column = column.astype(float)
+        column[id_nums] = new_values
+    # end def
+
+    def getRow(self, id_num):
+        """
+        Args:
+            id_num (int): virtual helix ID number
+
+        Returns:
+            dict: of all properties of a virtual helix in column order
+        """
+        getValue = self.getValue
+        return {key: getValue(id_num, key) for key in self._keys}
+    # end def
+
+    def toDict(self, id_nums):
+        """
+        Args:
+            id_nums (object): :obj:`slice` or :obj:`list` of ID numbers
+
+        Returns:
+            dict: of form {key: list of native values} in column order
+        """
+        columns = self._columns
+        return {key: columns[key][id_nums].tolist() for key in self._keys}
+    # end def
+# end class
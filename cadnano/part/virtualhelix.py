@@ -58,6 +58,10 @@ class VirtualHelix(CNObject):
         return self._part.getVirtualHelixProperties(self._id_num, 'color')
     # end def
 
+    def getNeighbors(self):
+        return self._part.getVirtualHelixNeighbors(self._id_num)
+    # end def
+
     def getSize(self):
         offset, size = self._part.getOffsetAndSize(self._id_num)
         return int(size)
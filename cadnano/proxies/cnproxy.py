@@ -39,6 +39,155 @@ class ProxyObject(object):
 # end class
 
 
+_deferred = None
+"""list: of form [((sender, signal name), emit, args), ...] of the emissions
+queued by the open deferred emit transaction in emission order, or ``None``"""
+_latest_args = {}
+"""dict: of form {(sender, signal name): args} of the latest queued emission
+of each key"""
+_defer_depth = 0
+_aggregators = []
+
+
+def _sameArgs(args_a, args_b):
+    """Compare emitted arguments without comparing arrays or models by value
+    """
+    if len(args_a) != len(args_b):
+        return False
+    for a, b in zip(args_a, args_b):
+        if a is b:
+            continue
+        if type(a) is not type(b) or type(a) not in (int, float, str, bool, tuple):
+            return False
+        if a != b:
+            return False
+    return True
+# end def
+
+
+def queueEmit(sender, name, emit, args):
+    """Queue an emission of the open deferred emit transaction, dropping it
+    if it repeats the arguments of the latest queued emission of the same
+    (sender, signal).  An earlier emission is never dropped in favour of a
+    later one, so the replay ends in the state of the model
+
+    Returns:
+        bool: ``True`` if queued, ``False`` if no transaction is open
+    """
+    if _deferred is None:
+        return False
+    key = (sender, name)
+    latest = _latest_args.get(key)
+    if latest is not None and _sameArgs(latest, args):
+        return True
+    _latest_args[key] = args
+    _deferred.append((key, emit, args))
+    return True
+# end def
+
+
+def isDeferringEmit():
+    """
+    Returns:
+        bool: ``True`` if a deferred emit transaction is open
+    """
+    return _deferred is not None
+# end def
+
+
+def beginDeferredEmit(aggregator=None):
+    """Open, or nest into, a deferred emit transaction.  Emissions of
+    :class:`DummySignal` and :class:`QtProxySignal` are queued until the
+    outermost :func:`endDeferredEmit`
+
+    Args:
+        aggregator (callable, optional): called at the flush with the queue
+            before it is replayed.  It may remove the items it replaces with
+            an aggregated emission from the queue in place and return a
+            callable emitting it after the replay
+    """
+    global _deferred, _defer_depth
+    if _defer_depth == 0:
+        _deferred = []
+    _defer_depth += 1
+    if aggregator is not None and aggregator not in _aggregators:
+        _aggregators.append(aggregator)
+# end def
+
+
+def endDeferredEmit():
+    """Close a deferred emit transaction.  Closing the outermost one replays
+    the queued emissions in the order they were emitted and then calls the
+    aggregators
+    """
+    global _deferred, _defer_depth
+    if _defer_depth == 0:
+        raise RuntimeError("no deferred emit transaction is open")
+    _defer_depth -= 1
+    if _defer_depth > 0:
+        return
+    queue, _deferred = _deferred, None
+    _latest_args.clear()
+    aggregators = list(_aggregators)
+    del _aggregators[:]
+    pending = [aggregator(queue) for aggregator in aggregators]
+    for key, emit, args in queue:
+        emit(*args)
+    # aggregated emissions go last so the views of added items exist
+    for flush in pending:
+        if flush is not None:
+            flush()
+# end def
+
+
+class NullProxyObject(ProxyObject):
+    """`ProxyObject` of the headless "null" proxy mode which keeps no record
+    of connections
+    """
+    __slots__ = ()
+
+    def __init__(self, parent):
+        self._parent = parent
+    # end def
+
+    def connect(self, sender, bsignal, method):
+        pass
+
+    def disconnect(self, sender, bsignal, method):
+        pass
+
+    def signals(self):
+        return {}
+    # end def
+# end class
+
+
+class NullSignal(object):
+    """Signal of the headless "null" proxy mode.  Every signal is the same
+    shared instance, connecting does nothing and emitting is free.
+    """
+    __slots__ = ()
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(NullSignal, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def connect(self, target):
+        pass
+
+    def disconnect(self, target):
+        pass
+
+    def emit(self, *args):
+        pass
+# end class
+
+
 class DummySignal(object):
     def __init__(self, *args, **kwargs):
         name = kwargs.get('name')
@@ -55,11 +204,65 @@ class DummySignal(object):
         self.targets.remove(target)
 
     def emit(self, *args):
+        # by convention the first argument is the sender
+        if _deferred is not None and queueEmit(args[0] if args else None,
+                                               self.name, self._emit, args):
+            return
+        self._emit(*args)
+
+    def _emit(self, *args):
         for t in self.targets:
             t(*args)
 # end class
 
 
+class QtProxySignal(object):
+    """Descriptor standing in for a `pyqtSignal` so its emissions can be
+    queued by a deferred emit transaction.  The `pyqtSignal` is created on
+    the owner class under a private name and its bound signal is returned
+    directly while no transaction is open.
+    """
+    signal_type = None
+    """type: set to `pyqtSignal` by `proxyConfigure`"""
+
+    def __init__(self, *args, **kwargs):
+        name = kwargs.get('name')
+        if name is None:
+            raise ValueError("missing name")
+        self.argtypes = args
+        self.name = name
+        self.attr_name = '_qt_' + name
+
+    def __set_name__(self, owner, name):
+        setattr(owner, self.attr_name, self.signal_type(*self.argtypes, name=self.name))
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        bound = getattr(obj, self.attr_name)
+        if _deferred is None:
+            return bound
+        return _DeferredBoundSignal(obj, self.name, bound)
+# end class
+
+
+class _DeferredBoundSignal(object):
+    __slots__ = '_sender', '_name', '_bound'
+
+    def __init__(self, sender, name, bound):
+        self._sender = sender
+        self._name = name
+        self._bound = bound
+
+    def emit(self, *args):
+        if not queueEmit(self._sender, self._name, self._bound.emit, args):
+            self._bound.emit(*args)
+
+    def __getattr__(self, attr):
+        return getattr(self._bound, attr)
+# end class
+
+
 ProxySignal = DummySignal
 BaseObject = ProxyObject
 UndoCommand = undocommand.UndoCommand
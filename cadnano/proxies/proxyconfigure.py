@@ -4,6 +4,11 @@ import cadnano.proxies.cnproxy as cnp
 def proxyConfigure(signal_type=None):
     """ call once per application at the start of
     the import chain
+
+    Args:
+        signal_type (str, optional): "PyQt", "blinker", or "null" for
+            headless scripts with no views where every signal is a shared
+            no-op, default is `DummySignal`
     """
     if signal_type == "blinker":
         import blinker
@@ -27,10 +32,14 @@ def proxyConfigure(signal_type=None):
     elif signal_type == "PyQt":
         from PyQt6.QtCore import QObject, pyqtSignal
         from PyQt6.QtGui import QUndoCommand, QUndoStack
-        cnp.ProxySignal = pyqtSignal
+        cnp.QtProxySignal.signal_type = pyqtSignal
+        cnp.ProxySignal = cnp.QtProxySignal
         cnp.BaseObject = QObject
         cnp.UndoCommand = QUndoCommand
         cnp.UndoStack = QUndoStack
+    elif signal_type == "null":
+        cnp.ProxySignal = cnp.NullSignal
+        cnp.BaseObject = cnp.NullProxyObject
     else:
         cnp.ProxySignal = cnp.DummySignal
         cnp.BaseObject = cnp.ProxyObject
@@ -21,6 +21,7 @@ class AddInsertionCommand(UndoCommand):
         c_strand = self._comp_strand
         inst = self._insertion
         self._insertions[self._idx] = inst
+        strand.part()._insertionsChanged(strand.idNum(), self._idx)
         strand.oligo()._incrementLength(inst.length(), emit_signals=True)
         strand.strandInsertionAddedSignal.emit(strand, inst)
         if c_strand:
@@ -37,6 +38,7 @@ class AddInsertionCommand(UndoCommand):
             c_strand.oligo()._decrementLength(inst.length(), emit_signals=True)
         idx = self._idx
         del self._insertions[idx]
+        strand.part()._insertionsChanged(strand.idNum(), idx)
         strand.strandInsertionRemovedSignal.emit(strand, idx)
         if c_strand:
             c_strand.strandInsertionRemovedSignal.emit(c_strand, idx)
@@ -65,6 +67,7 @@ class RemoveInsertionCommand(UndoCommand):
             c_strand.oligo()._decrementLength(inst.length(), emit_signals=True)
         idx = self._idx
         del self._insertions[idx]
+        strand.part()._insertionsChanged(strand.idNum(), idx)
         strand.strandInsertionRemovedSignal.emit(strand, idx)
         if c_strand:
             c_strand.strandInsertionRemovedSignal.emit(c_strand, idx)
@@ -76,6 +79,7 @@ class RemoveInsertionCommand(UndoCommand):
         inst = self._insertion
         strand.oligo()._incrementLength(inst.length(), emit_signals=True)
         self._insertions[self._idx] = inst
+        strand.part()._insertionsChanged(strand.idNum(), self._idx)
         strand.strandInsertionAddedSignal.emit(strand, inst)
         if c_strand:
             c_strand.oligo()._incrementLength(inst.length(), emit_signals=True)
@@ -108,6 +112,8 @@ class ChangeInsertionCommand(UndoCommand):
         c_strand = self._comp_strand
         inst = self._insertions[self._idx]
         inst.setLength(self._new_length)
+        self._insertions.lengthChanged()
+        strand.part()._insertionsChanged(strand.idNum(), self._idx)
         strand.oligo()._incrementLength(self._new_length - self._old_length,
                                         emit_signals=True)
         strand.strandInsertionChangedSignal.emit(strand, inst)
@@ -123,6 +129,8 @@ class ChangeInsertionCommand(UndoCommand):
         c_strand = self._comp_strand
         inst = self._insertions[self._idx]
         inst.setLength(self._old_length)
+        self._insertions.lengthChanged()
+        strand.part()._insertionsChanged(strand.idNum(), self._idx)
         strand.oligo()._decrementLength(self._new_length - self._old_length,
                                         emit_signals=True)
         strand.strandInsertionChangedSignal.emit(strand, inst)
@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import numpy as np
+
 from cadnano.proxies.cnproxy import UndoCommand
 
 
@@ -28,44 +30,110 @@ class ResizeCommand(UndoCommand):
     # end def
 
     def redo(self):
-        std = self.strand
-        n_i = self.new_idxs
-        o_i = self.old_indices
-        strandset = self.strand.strandSet()
-        part = strandset.part()
-
-        std.oligo()._incrementLength(self.delta, emit_signals=True)
-        std.setIdxs(n_i)
-        strandset._updateStrandIdxs(std, o_i, n_i)
-        if self.update_segments:
-            part.refreshSegments(strandset.idNum())
-
-        std.strandResizedSignal.emit(std, n_i)
-        # for updating the Slice View displayed helices
-        part.partStrandChangedSignal.emit(part, strandset.idNum())
-        std5p = std.connection5p()
-        if std5p:
-            std5p.strandResizedSignal.emit(std5p, std5p.idxs())
+        _resizeStrand(self.strand, self.old_indices, self.new_idxs, self.delta,
+                      self.update_segments)
     # end def
 
     def undo(self):
-        std = self.strand
-        n_i = self.new_idxs
-        o_i = self.old_indices
-        strandset = self.strand.strandSet()
-        part = strandset.part()
-
-        std.oligo()._decrementLength(self.delta, emit_signals=True)
-        std.setIdxs(o_i)
-        strandset._updateStrandIdxs(std, n_i, o_i)
-        if self.update_segments:
-            part.refreshSegments(strandset.idNum())
-
-        std.strandResizedSignal.emit(std, o_i)
-        # for updating the Slice View displayed helices
-        part.partStrandChangedSignal.emit(part, strandset.idNum())
-        std5p = std.connection5p()
-        if std5p:
-            std5p.strandResizedSignal.emit(std5p, std5p.idxs())
+        _resizeStrand(self.strand, self.new_idxs, self.old_indices, -self.delta,
+                      self.update_segments)
+    # end def
+
+    @staticmethod
+    def journal(commands):
+        """Compact consecutive `ResizeCommand` of a large macro, see
+        `UndoStack.compactCommands`
+
+        Args:
+            commands (list): of :class:`ResizeCommand`
+
+        Returns:
+            list: of :class:`ResizeJournalCommand`, one per run of commands
+                of the same part and `update_segments`
+        """
+        journals = []
+        run = []
+        key = None
+        for cmd in commands:
+            cmd_key = (cmd.strand.part(), cmd.update_segments)
+            if run and cmd_key != key:
+                journals.append(ResizeJournalCommand(run))
+                run = []
+            key = cmd_key
+            run.append(cmd)
+        if run:
+            journals.append(ResizeJournalCommand(run))
+        return journals
     # end def
 # end class
+
+
+class ResizeJournalCommand(UndoCommand):
+    """Compact replacement of a sequence of `ResizeCommand` which stores the
+    id_num, strand type, index ranges and length delta of each resize in
+    an array instead of the strands.  Each strand is looked up by its
+    current indices, which is only valid as the undo stack replays the
+    commands in order, and an `IndexError` is raised if no strand has them.
+    """
+
+    def __init__(self, commands):
+        super(ResizeJournalCommand, self).__init__("resize strands")
+        strand = commands[0].strand
+        self._part = strand.part()
+        self._update_segments = commands[0].update_segments
+        records = [(cmd.strand.idNum(), cmd.strand.strandType()) +
+                   tuple(cmd.old_indices) + tuple(cmd.new_idxs) + (cmd.delta,)
+                   for cmd in commands]
+        self._records = np.array(records, dtype=np.int32)
+        """ndarray: of form [[id_num, strand_type, old_low, old_high,
+        new_low, new_high, delta], ...]"""
+    # end def
+
+    def __len__(self):
+        return len(self._records)
+    # end def
+
+    def redo(self):
+        part = self._part
+        update_segments = self._update_segments
+        for id_num, strand_type, o_l, o_h, n_l, n_h, delta in self._records.tolist():
+            strand = part.getStrandSets(id_num)[strand_type]._strandAtIdxs(o_l, o_h)
+            _resizeStrand(strand, (o_l, o_h), (n_l, n_h), delta, update_segments)
+    # end def
+
+    def undo(self):
+        part = self._part
+        update_segments = self._update_segments
+        for id_num, strand_type, o_l, o_h, n_l, n_h, delta in reversed(self._records.tolist()):
+            strand = part.getStrandSets(id_num)[strand_type]._strandAtIdxs(n_l, n_h)
+            _resizeStrand(strand, (n_l, n_h), (o_l, o_h), -delta, update_segments)
+    # end def
+# end class
+
+
+def _resizeStrand(std, o_i, n_i, delta, update_segments):
+    """Resize `std` from `o_i` to `n_i`
+
+    Args:
+        std (Strand):
+        o_i (tuple): current indices
+        n_i (tuple): new indices
+        delta (int): change of the total length of the strand
+        update_segments (bool): refresh the segments of the virtual helix
+    """
+    strandset = std.strandSet()
+    part = strandset.part()
+
+    std.oligo()._incrementLength(delta, emit_signals=True)
+    std.setIdxs(n_i)
+    strandset._updateStrandIdxs(std, o_i, n_i)
+    if update_segments:
+        part.refreshSegments(strandset.idNum())
+
+    std.strandResizedSignal.emit(std, n_i)
+    # for updating the Slice View displayed helices
+    part.partStrandChangedSignal.emit(part, strandset.idNum())
+    std5p = std.connection5p()
+    if std5p:
+        std5p.strandResizedSignal.emit(std5p, std5p.idxs())
+# end def
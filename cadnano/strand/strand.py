@@ -1,5 +1,4 @@
 # -*- coding: utf-8 -*-
-from array import array
 from operator import attrgetter
 from cadnano import util
 from cadnano.proxies.cnobject import CNObject
@@ -10,15 +9,6 @@ from .modscmd import AddModsCommand, RemoveModsCommand
 from .resizecmd import ResizeCommand
 
 
-def sixb(x): return x.encode('utf-8')
-
-
-ARRAY_TYPE = 'B'
-
-
-def tostring(x): return x.tobytes().decode('utf-8')
-
-
 class Strand(CNObject):
     """A Strand is a continuous stretch of bases that are all in the same
     StrandSet (recall: a VirtualHelix is made up of two StrandSets).
@@ -59,7 +49,8 @@ class Strand(CNObject):
         self._oligo = oligo
         self._strand5p = None  # 5' connection to another strand
         self._strand3p = None  # 3' connection to another strand
-        self._sequence = None
+        self._sequence = None  # bytearray from the low to the high index
+        self._total_length = None  # cached by totalLength
 
         self.segments = []
         self.abstract_sequence = []
@@ -194,8 +185,13 @@ class Strand(CNObject):
     # end def
 
     def sequence(self, for_export=False):
+        """
+        Returns:
+            str: the sequence from 5' to 3'
+        """
         seq = self._sequence
         if seq:
+            seq = seq.decode() if self._is_forward else seq[::-1].decode()
             return util.markwhite(seq) if for_export else seq
         elif for_export:
             return ''.join(['?' for x in range(self.totalLength())])
@@ -220,22 +216,23 @@ class Strand(CNObject):
         return the tuple (used, unused) portion of the sequence_string
 
         Args:
-            sequence_string (str):
+            sequence_string (str or bytes):
 
         Returns:
-            tuple: of :obj:`str` of form::
+            tuple: of :obj:`bytes` of form::
 
                 (used, unused)
         """
         if sequence_string is None:
             self._sequence = None
             return None, None
+        if isinstance(sequence_string, str):
+            sequence_string = sequence_string.encode('utf-8')
         length = self.totalLength()
         if len(sequence_string) < length:
-            bonus = length - len(sequence_string)
-            sequence_string += ''.join([' ' for x in range(bonus)])
+            sequence_string += b' '*(length - len(sequence_string))
         temp = sequence_string[0:length]
-        self._sequence = temp
+        self._sequence = bytearray(temp if self._is_forward else temp[::-1])
         return temp, sequence_string[length:]
     # end def
 
@@ -252,9 +249,9 @@ class Strand(CNObject):
 
         for comp_strand in comp_ss.getOverlappingStrands(self._base_idx_low,
                                                          self._base_idx_high):
-            comp_seq = comp_strand.sequence()
-            used_seq = util.comp(comp_seq) if comp_seq else None
-            used_seq = self.setComplementSequence(used_seq, comp_strand)
+            comp_seq = comp_strand._sequence
+            used_seq = comp_seq.translate(util.complement_bytes) if comp_seq else None
+            self.setComplementSequence(used_seq, comp_strand)
         # end for
     # end def
 
@@ -270,71 +267,47 @@ class Strand(CNObject):
         """This version takes anothers strand and only sets the indices that
         align with the given complimentary strand.
 
-        As it depends which direction this is going, and strings are stored in
-        memory left to right, we need to test for is_forward to map the
-        reverse compliment appropriately, as we traverse overlapping strands.
-
-        We reverse the sequence ahead of time if we are applying it 5' to 3',
-        otherwise we reverse the sequence post parsing if it's 3' to 5'
-
-        Again, sequences are stored as strings in memory 5' to 3' so we need
-        to jump through these hoops to iterate 5' to 3' through them correctly
-
-        Perhaps it's wiser to merely store them left to right and reverse them
-        at draw time, or export time
+        Sequences of both directions are stored in memory from the low to the
+        high index of the virtual helix, so the complement of `strand` lines
+        up with this strand and is copied with a single slice assignment.
 
         Args:
-            sequence_string (str):
+            sequence_string (bytes): complement of the sequence of `strand`
+                from its low to its high index, or ``None`` to clear the
+                overlap
             strand (Strand):
 
         Returns:
-            str: the used portion of the sequence_string
+            bytearray: the sequence of this strand from the low to the high
+                index
         """
         s_low_idx, s_high_idx = self._base_idx_low, self._base_idx_high
         c_low_idx, c_high_idx = strand.idxs()
-        is_forward = self._is_forward
-        self_seq = self._sequence
         # get the ovelap
         low_idx, high_idx = util.overlap(s_low_idx, s_high_idx, c_low_idx, c_high_idx)
 
-        # only get the characters we're using, while we're at it, make it the
-        # reverse compliment
-
-        total_length = self.totalLength()
-
-        # see if we are applying
-        if sequence_string is None:
-            # clear out string for in case of not total overlap
-            use_seq = ''.join([' ' for x in range(total_length)])
-        else:  # use the string as is
-            use_seq = sequence_string[::-1] if is_forward else sequence_string
-
-        temp = array(ARRAY_TYPE, sixb(use_seq))
+        self_seq = self._sequence
         if self_seq is None:
-            temp_self = array(ARRAY_TYPE, sixb(''.join([' ' for x in range(total_length)])))
+            self_seq = self._sequence = bytearray(b' '*self.totalLength())
+
+        # generate the index into this sequence and the compliment string
+        insertions = self.part().insertions()[self._id_num]
+        if insertions:
+            a = insertions.lengthBetween(s_low_idx, low_idx - 1)
+            b = insertions.lengthBetween(low_idx, high_idx)
+            c = insertions.lengthBetween(c_low_idx, low_idx - 1)
         else:
-            temp_self = array(ARRAY_TYPE, sixb(self_seq) if is_forward else sixb(self_seq[::-1]))
-
-        # generate the index into the compliment string
-        a = self.insertionLengthBetweenIdxs(s_low_idx, low_idx - 1)
-        b = self.insertionLengthBetweenIdxs(low_idx, high_idx)
-        c = strand.insertionLengthBetweenIdxs(c_low_idx, low_idx - 1)
-        start = low_idx - c_low_idx + c
+            a = b = c = 0
+        start = low_idx - s_low_idx + a
         end = start + b + high_idx - low_idx + 1
-        temp_self[low_idx - s_low_idx + a:high_idx - s_low_idx + 1 + a + b] = temp[start:end]
-        # print("old sequence", self_seq)
-        self._sequence = tostring(temp_self)
-
-        # if we need to reverse it do it now
-        if not is_forward:
-            self._sequence = self._sequence[::-1]
+        if sequence_string is None:
+            self_seq[start:end] = b' '*(end - start)
+        else:
+            c_start = low_idx - c_low_idx + c
+            self_seq[start:end] = sequence_string[c_start:c_start + end - start]
 
-        # test to see if the string is empty(), annoyingly expensive
-        # if len(self._sequence.strip()) == 0:
-        if not self._sequence:
+        if not self_seq:
             self._sequence = None
-
-        # print("new sequence", self._sequence)
         return self._sequence
     # end def
 
@@ -368,7 +341,7 @@ class Strand(CNObject):
     def copyAbstractSequenceToSequence(self):
         abstract_seq = self.abstract_sequence
         # self._sequence = ''.join([ascii_letters[i % 52] for i in abstract_seq])
-        self._sequence = ''.join(['|' for i in abstract_seq])
+        self._sequence = bytearray(b'|'*len(abstract_seq))
     # end def
 
     ### PUBLIC METHODS FOR QUERYING THE MODEL ###
@@ -419,7 +392,7 @@ class Strand(CNObject):
         """
         seqList = []
         is_forward = self._is_forward
-        seq = self._sequence if is_forward else self._sequence[::-1]
+        seq = self._sequence.decode()  # stored from the low to the high index
         # assumes a sequence has been applied correctly and is up to date
         tL = self.totalLength()
 
@@ -571,28 +544,15 @@ class Strand(CNObject):
     def insertionLengthBetweenIdxs(self, idxL, idxH):
         """includes the length of insertions in addition to the bases
         """
-        tL = 0
-        insertions = self.insertionsOnStrand(idxL, idxH)
-        for insertion in insertions:
-            tL += insertion.length()
-        return tL
+        return self.part().insertions()[self._id_num].lengthBetween(idxL, idxH)
     # end def
 
     def insertionsOnStrand(self, idxL=None, idxH=None):
         """if passed indices it will use those as a bounds
         """
-        insertions = []
-        insertionsDict = self.part().insertions()[self._id_num]
-        sortedIndices = sorted(insertionsDict.keys())
         if idxL is None:
             idxL, idxH = self.idxs()
-        for index in sortedIndices:
-            insertion = insertionsDict[index]
-            if idxL <= insertion.idx() <= idxH:
-                insertions.append(insertion)
-            # end if
-        # end for
-        return insertions
+        return self.part().insertions()[self._id_num].insertionsBetween(idxL, idxH)
     # end def
 
     def modifersOnStrand(self):
@@ -617,14 +577,46 @@ class Strand(CNObject):
     # end def
 
     def totalLength(self):
-        """includes the length of insertions in addition to the bases
+        """includes the length of insertions in addition to the bases.
+        Cached until the indices or the insertions of the strand change
         """
-        tL = 0
-        insertions = self.insertionsOnStrand()
+        if self._total_length is None:
+            idxL, idxH = self.idxs()
+            self._total_length = self.insertionLengthBetweenIdxs(idxL, idxH) + idxH - idxL + 1
+        return self._total_length
+    # end def
+
+    def idxAtLength(self, length):
+        """The index of the base `length` bases from the 5' end of the strand,
+        walking in the 3' direction.  The bases of an insertion belong to its
+        index and a skip has none.
+
+        Args:
+            length (int): number of bases from the 5' end, 0 is the 5' base
 
+        Returns:
+            int: base index, or ``None`` if `length` is not less than
+                :meth:`totalLength`
+        """
+        if length < 0 or length >= self.totalLength():
+            return None
+        step = 1 if self._is_forward else -1
+        idx = self.idx5Prime()
+        insertions = self.insertionsOnStrand()
+        if not self._is_forward:
+            insertions = reversed(insertions)
         for insertion in insertions:
-            tL += insertion.length()
-        return tL + self.length()
+            insertion_idx = insertion.idx()
+            distance = (insertion_idx - idx)*step
+            if length < distance:
+                break
+            length -= distance
+            num_bases = 1 + insertion.length()
+            if length < num_bases:
+                return insertion_idx
+            length -= num_bases
+            idx = insertion_idx + step
+        return idx + length*step
     # end def
 
     ### PUBLIC METHODS FOR EDITING THE MODEL ###
@@ -776,15 +768,19 @@ class Strand(CNObject):
 
     def setConnection3p(self, strand):
         self._strand3p = strand
+        self.part()._strandsChanged()
     # end def
 
     def setConnection5p(self, strand):
         self._strand5p = strand
+        self.part()._strandsChanged()
     # end def
 
     def setIdxs(self, idxs):
         self._base_idx_low = idxs[0]
         self._base_idx_high = idxs[1]
+        self._total_length = None
+        self.part()._strandsChanged()
     # end def
 
     def setOligo(self, new_oligo, emit_signals=False):
@@ -886,7 +882,7 @@ class Strand(CNObject):
         """
         new_s = Strand(strandset, *self.idxs())
         new_s._oligo = oligo
-        new_s._sequence = self._sequence
+        new_s._sequence = None if self._sequence is None else bytearray(self._sequence)
         return new_s
     # end def
 # end class
@@ -55,12 +55,10 @@ class MergeCommand(UndoCommand):
         if strand_low._sequence or strand_high._sequence:
             tL = strand_low.totalLength()
             tH = strand_high.totalLength()
-            seqL = strand_low._sequence if strand_low._sequence else "".join([" " for i in range(tL)])
-            seqH = strand_high._sequence if strand_high._sequence else "".join([" " for i in range(tH)])
-            if new_strand.isForward():
-                new_strand._sequence = seqL + seqH
-            else:
-                new_strand._sequence = seqH + seqL
+            seqL = strand_low._sequence if strand_low._sequence else b' '*tL
+            seqH = strand_high._sequence if strand_high._sequence else b' '*tH
+            # sequences are stored from the low to the high index
+            new_strand._sequence = bytearray(seqL + seqH)
     # end def
 
     def redo(self):
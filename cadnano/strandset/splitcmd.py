@@ -90,14 +90,10 @@ class SplitCommand(UndoCommand):
         # end if
 
         if update_sequence and old_sequence:
-            if is5to3:  # strand_low has priority
-                tL = strand_low.totalLength()
-                strand_low._sequence = old_sequence[0:tL]
-                strand_high._sequence = old_sequence[tL:]
-            else:
-                tH = strand_high.totalLength()
-                strand_high._sequence = old_sequence[0:tH]
-                strand_low._sequence = old_sequence[tH:]
+            # sequences are stored from the low to the high index
+            tL = strand_low.totalLength()
+            strand_low._sequence = old_sequence[0:tL]
+            strand_high._sequence = old_sequence[tL:]
 
     # end def
 
@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
-from bisect import bisect_left, insort_left
+from bisect import bisect_left, bisect_right
 import cadnano.util as util
 from cadnano.proxies.cnproxy import ProxySignal
 from cadnano.proxies.cnobject import CNObject
 from cadnano.proxies.cnenum import StrandType
+from cadnano.oligo import Oligo
+from cadnano.strand import Strand
 from .createstrandcmd import CreateStrandCommand
 from .removestrandcmd import RemoveStrandCommand
 from .mergecmd import MergeCommand
@@ -19,17 +21,20 @@ class StrandSet(CNObject):
     determining if edits can be made, such as the bounds of empty space in
     which a strand can be created or resized.
 
-    Internally :class:`StrandSet` uses redundant heap and a list data structures
-    to track :class:`Strands` objects, with the list of length of a virtual
-    helix looking like::
+    Internally :class:`StrandSet` tracks :class:`Strands` objects as sorted
+    intervals, a strand_heap::
 
-        strand_array = [strandA, strandA, strandA, ..., None, strandB, strandB, ...]
+        strand_heap = [strandA, strandB, strandC, ...]
 
-    Where every index strandA spans has a reference to strandA and strand_heap::
+    which is merely a sorted list from low index to high index of strand
+    objects, and parallel lists of their low and high indices::
 
-        strand_heap = [strandA, strandB, strandC, ...]
+        _low_idxs = [strandA.lowIdx(), strandB.lowIdx(), strandC.lowIdx(), ...]
+        _high_idxs = [strandA.highIdx(), strandB.highIdx(), strandC.highIdx(), ...]
 
-    is merely a sorted list from low index to high index of strand objects
+    Strands never overlap, so both index lists are sorted and queries are
+    plain integer bisects without any per base storage.  `_strand_low_idxs`
+    maps each strand in the set to its low index
 
     Args:
         is_fwd (bool):  is this a forward or reverse StrandSet?
@@ -62,7 +67,7 @@ class StrandSet(CNObject):
             part (Part): part to copy this into
         """
         return StrandSet(self._is_fwd, self._id_num,
-                         part, len(self.strand_array))
+                         part, self._length)
     # end def
 
     def __iter__(self):
@@ -123,8 +128,11 @@ class StrandSet(CNObject):
         Args:
             initial_size (int): size to revert to
         """
-        self.strand_array = [None]*(initial_size)
+        self._length = initial_size
         self.strand_heap = []
+        self._low_idxs = []
+        self._high_idxs = []
+        self._strand_low_idxs = {}
     # end def
 
     def resize(self, delta_low, delta_high):
@@ -135,11 +143,7 @@ class StrandSet(CNObject):
             delta_low (int):  amount to resize the low index end
             delta_high (int):  amount to resize the high index end
         """
-        if delta_low < 0:
-            self.strand_array = self.strand_array[delta_low:]
-        if delta_high < 0:
-            self.strand_array = self.strand_array[:delta_high]
-        self.strand_array = [None]*delta_low + self.strand_array + [None]*delta_high
+        self._length += delta_low + delta_high
     # end def
 
     ### PUBLIC METHODS FOR QUERYING THE MODEL ###
@@ -192,7 +196,7 @@ class StrandSet(CNObject):
         Returns:
             int: length of the set
         """
-        return len(self.strand_array)
+        return self._length
 
     def idNum(self):
         """Get the associated virtual helix ID number
@@ -214,9 +218,9 @@ class StrandSet(CNObject):
             tuple: (low neighbor, high neighbor) of types :class:`Strand` or :obj:`None`
         """
         sh = self.strand_heap
-        i = bisect_left(sh, strand)
-        if sh[i] != strand:
+        if strand not in self._strand_low_idxs:
             raise ValueError("getNeighbors: strand not in set")
+        i = bisect_left(self._low_idxs, strand.lowIdx())
         if i == 0:
             low_strand = None
         else:
@@ -250,40 +254,33 @@ class StrandSet(CNObject):
 
                 (low_idx, high_idx)
         """
-        class DummyStrand(object):
-            _base_idx_low = base_idx
-
-            def __lt__(self, other):
-                return self._base_idx_low < other._base_idx_low
-
-        ds = DummyStrand()
-        sh = self.strand_heap
-        lsh = len(sh)
+        low_idxs = self._low_idxs
+        lsh = len(low_idxs)
         if lsh == 0:
-            return 0, len(self.strand_array) - 1
+            return 0, self._length - 1
 
         # the i-th index is the high-side strand and the i-1 index
         # is the low-side strand since bisect_left gives the index
-        # to insert the dummy strand at
-        i = bisect_left(sh, ds)
+        # to insert a strand starting at base_idx at
+        i = bisect_left(low_idxs, base_idx)
         if i == 0:
             low_idx = 0
         else:
-            low_idx = sh[i - 1].highIdx() + 1
+            low_idx = self._high_idxs[i - 1] + 1
 
-        # would be an append to the list effectively if inserting the dummy strand
+        # would be an append to the list effectively if inserting the strand
         if i == lsh:
-            high_idx = len(self.strand_array) - 1
+            high_idx = self._length - 1
         else:
-            high_idx = sh[i].lowIdx() - 1
+            high_idx = low_idxs[i] - 1
         return (low_idx, high_idx)
     # end def
 
     def indexOfRightmostNonemptyBase(self):
         """Returns the high base_idx of the last strand, or 0."""
-        sh = self.strand_heap
-        if len(sh) > 0:
-            return sh[-1].highIdx()
+        high_idxs = self._high_idxs
+        if len(high_idxs) > 0:
+            return high_idxs[-1]
         else:
             return 0
     # end def
@@ -346,12 +343,51 @@ class StrandSet(CNObject):
         return 0
     # end def
 
-    def isStrandInSet(self, strand):
-        sl = self.strand_array
-        if sl[strand.lowIdx()] == strand and sl[strand.highIdx()] == strand:
-            return True
+    def importStrands(self, idx_pairs, colors, emit_signals=False):
+        """Bulk version of :meth:`createDeserializedStrand` adding the strands
+        read from a file in one pass, each with a new :class:`Oligo`, without
+        commands or the undo stack.  Strands are assumed not to overlap.
+        Segments are not refreshed, call `Part.refreshSegments` once after
+
+        Args:
+            idx_pairs (list): of (low, high) :obj:`int` indices of each strand
+            colors (list): of :obj:`str` color of the oligo of each strand
+            emit_signals (:obj:`bool`, optional): emit
+                `strandsetStrandAddedSignal` for each strand and a
+                `partStrandChangedSignal`, default=False
+
+        Returns:
+            list: of the new :class:`Strand` objects
+        """
+        part = self._part
+        strands = []
+        for (idx_low, idx_high), color in zip(idx_pairs, colors):
+            strand = Strand(self, idx_low, idx_high)
+            oligo = Oligo(None, color, length=strand.totalLength())
+            oligo.setStrand5p(strand)
+            strand.setOligo(oligo)
+            oligo.addToPart(part, emit_signals=emit_signals)
+            strands.append(strand)
+
+        if self.strand_heap:
+            for strand in strands:
+                self._addToStrandList(strand, update_segments=False)
         else:
-            return False
+            heap = sorted(strands, key=Strand.lowIdx)
+            self.strand_heap = heap
+            self._low_idxs = [strand.lowIdx() for strand in heap]
+            self._high_idxs = [strand.highIdx() for strand in heap]
+            self._strand_low_idxs = dict(zip(heap, self._low_idxs))
+
+        if emit_signals:
+            for strand in strands:
+                self.strandsetStrandAddedSignal.emit(self, strand)
+            part.partStrandChangedSignal.emit(part, self._id_num)
+        return strands
+    # end def
+
+    def isStrandInSet(self, strand):
+        return strand in self._strand_low_idxs
     # end def
 
     def removeStrand(self, strand, use_undostack=True, solo=True):
@@ -532,32 +568,9 @@ class StrandSet(CNObject):
             bool: True if strandset has a strand in the region between idx_low
             and idx_high (both included). False otherwise
         """
-        sa = self.strand_array
-        sh = self.strand_heap
-        lsh = len(sh)
-        strand = sa[idx_low]
-
-        if strand is None:
-            class DummyStrand(object):
-                _base_idx_low = idx_low
-
-                def __lt__(self, other):
-                    return self._base_idx_low < other._base_idx_low
-
-            ds = DummyStrand()
-            i = bisect_left(sh, ds)
-
-            while i < lsh:
-                strand = sh[i]
-                if strand.lowIdx() > idx_high:
-                    return False
-                elif idx_low <= strand.highIdx():
-                    return True
-                else:
-                    i += 1
-            return False
-        else:
-            return True
+        # the first strand ending at or after idx_low is the only candidate
+        i = bisect_left(self._high_idxs, idx_low)
+        return i < len(self._high_idxs) and self._low_idxs[i] <= idx_high
     # end def
 
     def getOverlappingStrands(self, idx_low, idx_high):
@@ -570,35 +583,10 @@ class StrandSet(CNObject):
         Returns:
             :obj:`list` of :class:`Strand`: all :class:`Strand` objects in range
         """
-        sa = self.strand_array
-        sh = self.strand_heap
-        lsh = len(sh)
-
-        strand = sa[idx_low]
-        out = []
-        if strand is None:
-            class DummyStrand(object):
-                _base_idx_low = idx_low
-
-                def __lt__(self, other):
-                    return self._base_idx_low < other._base_idx_low
-
-            ds = DummyStrand()
-            i = bisect_left(sh, ds)
-        else:
-            out.append(strand)
-            i = bisect_left(sh, strand) + 1
-
-        while i < lsh:
-            strand = sh[i]
-            if strand.lowIdx() > idx_high:
-                break
-            elif idx_low <= strand.highIdx():
-                out.append(strand)
-                i += 1
-            else:
-                i += 1
-        return out
+        # strands ending at or after idx_low and starting at or before idx_high
+        i = bisect_left(self._high_idxs, idx_low)
+        j = bisect_right(self._low_idxs, idx_high)
+        return self.strand_heap[i:j]
     # end def
 
     # def hasStrandAtAndNoXover(self, idx):
@@ -610,8 +598,7 @@ class StrandSet(CNObject):
     #     Returns:
     #         bool: True if hasStrandAtAndNoXover, False otherwise
     #     """
-    #     sl = self.strand_array
-    #     strand = sl[idx]
+    #     strand = self.getStrand(idx)
     #     if strand is None:
     #         return False
     #     elif strand.hasXoverAt(idx):
@@ -629,8 +616,7 @@ class StrandSet(CNObject):
     #     Returns:
     #         bool: True if hasNoStrandAtOrNoXover, False otherwise
     #     """
-    #     sl = self.strand_array
-    #     strand = sl[idx]
+    #     strand = self.getStrand(idx)
     #     if strand is None:
     #         return True
     #     elif strand.hasXoverAt(idx):
@@ -647,12 +633,19 @@ class StrandSet(CNObject):
 
         Returns:
             Strand: :class:`Strand` at `base_idx` if it exists
+
+        Raises:
+            IndexError: `base_idx` is out of range of the :class:`StrandSet`
         """
-        try:
-            return self.strand_array[base_idx]
-        except Exception:
-            print(self.strand_array)
-            raise
+        length = self._length
+        if base_idx < 0:
+            base_idx += length
+        if not 0 <= base_idx < length:
+            raise IndexError("base_idx {} out of range for length {}".format(base_idx, length))
+        i = bisect_right(self._low_idxs, base_idx) - 1
+        if i >= 0 and base_idx <= self._high_idxs[i]:
+            return self.strand_heap[i]
+        return None
     # end def
 
     def dump(self, xover_list):
@@ -681,45 +674,66 @@ class StrandSet(CNObject):
 
     ### PRIVATE SUPPORT METHODS ###
     def _addToStrandList(self, strand, update_segments=True):
-        """Inserts strand into the strand_array at idx
+        """Inserts strand into the strand_heap in low index order
 
         Args:
             strand (Strand): the strand to add
             update_segments (:obj:`bool`, optional): whether to signal default=True
         """
         idx_low, idx_high = strand.idxs()
-        for i in range(idx_low, idx_high+1):
-            self.strand_array[i] = strand
-        insort_left(self.strand_heap, strand)
+        i = bisect_left(self._low_idxs, idx_low)
+        self.strand_heap.insert(i, strand)
+        self._low_idxs.insert(i, idx_low)
+        self._high_idxs.insert(i, idx_high)
+        self._strand_low_idxs[strand] = idx_low
         if update_segments:
             self._part.refreshSegments(self._id_num)
 
     def _updateStrandIdxs(self, strand, old_idxs, new_idxs):
-        """update indices in the strand array/list of an existing strand
+        """update the low index of an existing strand.  A resize never moves
+        a strand past its neighbors so the order of strand_heap is kept
 
         Args:
             strand (Strand): the strand
-            old_idxs (tuple): range (:obj:`int`) to clear
-            new_idxs (tuple): range (:obj:`int`) to set to `strand`
+            old_idxs (tuple): range (:obj:`int`) the strand spanned
+            new_idxs (tuple): range (:obj:`int`) the strand spans now
         """
-        for i in range(old_idxs[0], old_idxs[1] + 1):
-            self.strand_array[i] = None
-        for i in range(new_idxs[0], new_idxs[1] + 1):
-            self.strand_array[i] = strand
+        i = bisect_left(self._low_idxs, old_idxs[0])
+        self._low_idxs[i], self._high_idxs[i] = new_idxs
+        self._strand_low_idxs[strand] = new_idxs[0]
+
+    def _strandAtIdxs(self, idx_low, idx_high):
+        """
+        Args:
+            idx_low (int): low index of a strand of the set
+            idx_high (int): high index of the strand
+
+        Returns:
+            Strand: the strand found like :meth:`_updateStrandIdxs` does
+
+        Raises:
+            IndexError: no strand of the set spans exactly (idx_low, idx_high)
+        """
+        low_idxs = self._low_idxs
+        i = bisect_left(low_idxs, idx_low)
+        if i == len(low_idxs) or low_idxs[i] != idx_low or self._high_idxs[i] != idx_high:
+            raise IndexError("StrandSet._strandAtIdxs: no strand at ({}, {}) in {}".format(
+                idx_low, idx_high, self))
+        return self.strand_heap[i]
+    # end def
 
     def _removeFromStrandList(self, strand, update_segments=True):
-        """Remove strand from strand_array.
+        """Remove strand from strand_heap.
 
         Args:
             strand (Strand): the strand
             update_segments (:obj:`bool`, optional): whether to signal default=True
         """
         self._document.removeStrandFromSelection(strand)  # make sure the strand is no longer selected
-        idx_low, idx_high = strand.idxs()
-        for i in range(idx_low, idx_high + 1):
-            self.strand_array[i] = None
-        i = bisect_left(self.strand_heap, strand)
+        i = bisect_left(self._low_idxs, self._strand_low_idxs.pop(strand))
         self.strand_heap.pop(i)
+        self._low_idxs.pop(i)
+        self._high_idxs.pop(i)
         if update_segments:
             self._part.refreshSegments(self._id_num)
 
@@ -730,11 +744,10 @@ class StrandSet(CNObject):
         Returns:
             tuple: (:obj:`bool`, :obj:`int`)
         """
-        try:
-            ind = self.strand_array.index(strand)
-            return (True, ind)
-        except ValueError:
+        idx_low = self._strand_low_idxs.get(strand)
+        if idx_low is None:
             return (False, 0)
+        return (True, idx_low)
     # end def
 
     def _deepCopy(self, virtual_helix):
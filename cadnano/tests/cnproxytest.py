@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from cntestcase import cnapp
+
+from nucleicacidparttest import create3Helix
+from cadnano.proxies import cnproxy
+
+
+def testDeferSignals(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, [0, 0, 1], 42)
+    fwd_ss0, rev_ss0 = part.getStrandSets(0)
+    fwd_ss1, rev_ss1 = part.getStrandSets(1)
+    strand0 = fwd_ss0.createStrand(0, 20)
+    strand1 = rev_ss1.createStrand(0, 20)
+
+    resized, rebuilt = [], []
+
+    def resizedSlot(strand, idxs):
+        resized.append((strand, idxs))
+
+    def rebuiltSlot(sender, strands):
+        rebuilt.append(set(strands))
+    strand0.strandResizedSignal.connect(resizedSlot)
+    part.partOligosRebuiltSignal.connect(rebuiltSlot)
+    try:
+        with part.deferSignals():
+            with doc.deferSignals():
+                strand0.resize((2, 20))
+                strand0.resize((2, 20))
+                part.createXover(strand0, 20, strand1, 20)
+            assert resized == []
+            strand0.resize((3, 20))
+            assert rebuilt == []
+        # identical emissions are dropped, the rest replay in order
+        assert resized == [(strand0, (2, 20)), (strand0, (3, 20))]
+        assert rebuilt == [{strand0, strand1}]
+        assert strand1.oligo() is strand0.oligo()
+
+        strand0.resize((4, 20))
+        assert resized[-1] == (strand0, (4, 20))
+
+        # reverting to an earlier state replays the revert last
+        del resized[:]
+        with doc.deferSignals():
+            strand0.resize((3, 20))
+            strand0.resize((4, 20))
+            strand0.resize((3, 20))
+        assert resized == [(strand0, (3, 20)), (strand0, (4, 20)), (strand0, (3, 20))]
+        assert resized[-1][1] == strand0.idxs()
+    finally:
+        strand0.strandResizedSignal.disconnect(resizedSlot)
+        part.partOligosRebuiltSignal.disconnect(rebuiltSlot)
+# end def
+
+
+def testQtProxySignal():
+    """The descriptor behaves as the `pyqtSignal` it owns outside of a
+    transaction and queues its emissions inside one
+    """
+    QtCore = pytest.importorskip('PyQt6.QtCore')
+
+    class QtSignal(cnproxy.QtProxySignal):
+        signal_type = QtCore.pyqtSignal
+
+    class QtSender(QtCore.QObject):
+        valueChangedSignal = QtSignal(object, int, name='valueChangedSignal')
+
+    sender = QtSender()
+    assert isinstance(QtSender.__dict__['_qt_valueChangedSignal'], QtCore.pyqtSignal)
+    assert isinstance(sender.valueChangedSignal, QtCore.pyqtBoundSignal)
+
+    received = []
+
+    def slot(a_sender, value):
+        received.append(value)
+    sender.valueChangedSignal.connect(slot)
+    sender.valueChangedSignal.emit(sender, 1)
+    assert received == [1]
+
+    cnproxy.beginDeferredEmit()
+    try:
+        sender.valueChangedSignal.emit(sender, 2)
+        sender.valueChangedSignal.emit(sender, 2)
+        sender.valueChangedSignal.emit(sender, 3)
+        sender.valueChangedSignal.emit(sender, 2)
+        assert received == [1]
+    finally:
+        cnproxy.endDeferredEmit()
+    assert received == [1, 2, 3, 2]
+
+    # connections made inside a transaction are made on the Qt signal
+    cnproxy.beginDeferredEmit()
+    try:
+        sender.valueChangedSignal.disconnect(slot)
+    finally:
+        cnproxy.endDeferredEmit()
+    sender.valueChangedSignal.emit(sender, 4)
+    assert received == [1, 2, 3, 2]
+# end def
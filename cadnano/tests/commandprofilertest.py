@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+import io
+import json
+
+import pytest
+
+from cntestcase import cnapp
+
+from nucleicacidparttest import create3Helix
+from cadnano.commandprofiler import CommandProfiler
+
+
+def testCommandProfiler(cnapp):
+    from cadnano.part.xovercmds import CreateXoverCommand
+    redo = CreateXoverCommand.redo
+    doc = cnapp.document
+    part = create3Helix(doc, [0, 0, 1], 42)
+    fwd_ss0, rev_ss0 = part.getStrandSets(0)
+    fwd_ss1, rev_ss1 = part.getStrandSets(1)
+    with CommandProfiler() as profiler:
+        assert CreateXoverCommand.redo is not redo
+        strand0 = fwd_ss0.createStrand(0, 20)
+        strand1 = rev_ss1.createStrand(0, 20)
+        part.createXover(strand0, 20, strand1, 20)
+        doc.undoStack().undo()
+        fwd_ss0.splitStrand(strand0, 10, use_undostack=False)
+        with pytest.raises(RuntimeError):
+            CommandProfiler().start()
+    assert CreateXoverCommand.redo is redo
+
+    stats = profiler.stats()
+    assert stats[('CreateXoverCommand', 'redo')]['count'] == 1
+    assert stats[('CreateXoverCommand', 'undo')]['count'] == 1
+    assert stats[('CreateStrandCommand', 'redo')]['leaf_count'] == 2
+    split = stats[('SplitCommand', 'redo')]
+    assert split['count'] == 1
+    assert split['self_time'] <= split['total_time']
+
+    f = io.StringIO()
+    profiler.writeChromeTrace(f)
+    events = json.loads(f.getvalue())['traceEvents']
+    assert len(events) == sum(stat['count'] for stat in stats.values())
+    assert all(event['ph'] == 'X' and event['dur'] >= 0 for event in events)
+    f = io.StringIO()
+    profiler.writeJSON(f)
+    rows = json.loads(f.getvalue())['commands']
+    assert [row['self_time'] for row in rows] == sorted((row['self_time'] for row in rows), reverse=True)
+# end def
+
+
+def testCommandProfilerMacroNames(cnapp):
+    """Plain macros are keyed by their name rather than merged in a single
+    UndoCommand row
+    """
+    doc = cnapp.document
+    us = doc.undoStack()
+    part = create3Helix(doc, [0, 0, 1], 42)
+    fwd_ss0, rev_ss0 = part.getStrandSets(0)
+    fwd_ss1, rev_ss1 = part.getStrandSets(1)
+    strand0 = fwd_ss0.createStrand(0, 20)
+    strand1 = rev_ss1.createStrand(0, 20)
+    with CommandProfiler() as profiler:
+        part.createXover(strand0, 20, strand1, 20)
+        us.undo()
+        us.redo()
+        doc.addStrandToSelection(strand1, (True, True))
+        doc.resizeSelection(1)
+        us.undo()
+        us.redo()
+
+    stats = profiler.stats()
+    for name in ('Create Xover', 'Resize Selection'):
+        assert stats[(name, 'redo')]['macro_count'] == 1
+        assert stats[(name, 'undo')]['macro_count'] == 1
+    assert all(name != 'UndoCommand' for name, op in stats)
+    f = io.StringIO()
+    profiler.writeChromeTrace(f)
+    names = {event['name'] for event in json.loads(f.getvalue())['traceEvents']}
+    assert {'Create Xover', 'Resize Selection', 'CreateXoverCommand'} <= names
+# end def
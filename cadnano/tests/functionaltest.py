@@ -1,7 +1,17 @@
 # -*- coding: utf-8 -*-
+import csv
+import io
+import os
+import subprocess
+import sys
+from ast import literal_eval
+
 import pytest
 
 from cntestcase import CNTestApp
+from pathsetup import PROJECT_PATH, TEST_PATH
+
+from cadnano.oligo import SEQUENCE_EXPORT_KEYS
 
 
 @pytest.fixture()
@@ -81,6 +91,69 @@ def testStapleOutput_Nature09_monolith_legacy(cnapp):
     ref_set = cnapp.getRefSequences(refname)
     assert test_set == ref_set
 
+
+def testStapleOutput_streaming(cnapp):
+    """Streamed tsv rows split into staples and scaffold match the reference"""
+    designname = "Science09_prot120_98_v3.json"
+    refname = "Science09_prot120_98_v3.csv"
+    sequences = [("p7704", 0, 105)]
+    test_set = cnapp.getTestSequences(designname, sequences)
+    part = cnapp.document.activePart()
+
+    rows = []
+    for staples in (True, False):
+        f = io.StringIO()
+        part.writeSequences(f, delimiter='\t', sort=True, scaffold=not staples, staples=staples)
+        f.seek(0)
+        reader = csv.reader(f, delimiter='\t')
+        assert tuple(next(reader)) == SEQUENCE_EXPORT_KEYS
+        part_rows = list(reader)
+        starts = [literal_eval(row[0].replace('[', ',').replace(']', '')) for row in part_rows]
+        assert starts == sorted(starts)
+        rows += part_rows
+    assert len(rows) == len(part.oligos())
+
+    f = io.StringIO()
+    csv.writer(f, lineterminator='\n').writerows(rows)
+    assert set(f.getvalue().splitlines()) | {','.join(SEQUENCE_EXPORT_KEYS)} == test_set
+    assert test_set == cnapp.getRefSequences(refname)
+
+
+_NULL_SIGNAL_EXPORT = """
+import sys
+from cadnano.proxies.proxyconfigure import proxyConfigure
+proxyConfigure('null')
+from cadnano.document import Document
+from cadnano.extras.dnasequences import sequences
+doc = Document()
+doc.readFile(sys.argv[1])
+part = doc.activePart()
+scaffold = max(part.oligos(), key=lambda o: (o.length(), o.locString()))
+scaffold.applySequence(sequences['p7560'], use_undostack=False)
+sys.stdout.write(part.getSequences())
+"""
+
+
+def testNullSignalMode(cnapp):
+    """Headless "null" proxy mode decodes and exports the same sequences as
+    the default `DummySignal` mode.  The mode is configured before the model
+    is imported so it runs in its own process.  For timings see
+    misc/benchmarks/null_signal_benchmark.py
+    """
+    from cadnano.extras.dnasequences import sequences
+    design = os.path.join(TEST_PATH, 'data', 'Nature09_monolith.json')
+    env = dict(os.environ, PYTHONPATH=PROJECT_PATH)
+    out = subprocess.check_output([sys.executable, '-c', _NULL_SIGNAL_EXPORT, design],
+                                  env=env, universal_newlines=True)
+    doc = cnapp.document
+    doc.readFile(design)
+    part = doc.activePart()
+    scaffold = max(part.oligos(), key=lambda o: (o.length(), o.locString()))
+    scaffold.applySequence(sequences['p7560'], use_undostack=False)
+    # oligos are exported in set order
+    assert sorted(out.splitlines()) == sorted(part.getSequences().splitlines())
+
+
 # def testStapleOutput_Nature09_squarenut(cnapp):
 #      """Staples match reference set for Nature09 squarenut"""
 #      designname = "Nature09_squarenut.json"
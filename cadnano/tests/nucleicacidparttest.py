@@ -1,8 +1,13 @@
 # -*- coding: utf-8 -*-
 import pytest
 import math
+import os
+from ast import literal_eval
+
+import numpy as np
 
 from cntestcase import cnapp
+from pathsetup import TEST_PATH
 
 from cadnano.part.nucleicacidpart import NucleicAcidPart
 
@@ -51,3 +56,448 @@ def testRemove(cnapp):
     assert len(doc.children()) == 0
     us.undo()
     assert len(doc.children()) == 1
+
+
+def testQueryIdNumNeighborPairs(cnapp):
+    """The batched candidate search must match a brute force point by point
+    search over every pair of points
+    """
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 84)
+    fwd_pts, rev_pts = part.fwd_pts, part.rev_pts
+    for id_num in part.getIdNums():
+        neighbors = part.getVirtualHelixProperties(id_num, 'neighbors')
+        neighbors = literal_eval(neighbors)
+        assert len(neighbors) > 0
+        offset, size = part.getOffsetAndSize(id_num)
+        this_pts = fwd_pts[offset:offset + size]
+        for neighbor_id in neighbors:
+            n_offset, n_size = part.getOffsetAndSize(neighbor_id)
+            nrev_pts = rev_pts[n_offset:n_offset + n_size]
+            bounds = (0, 0.5, None, 0.05)
+            this_idxs, neighbor_idxs = part._candidatePairs(this_pts, nrev_pts, bounds)
+            expected = []
+            for i, point in enumerate(this_pts):
+                for j, npoint in enumerate(nrev_pts):
+                    difference = npoint - point
+                    zdelta = difference[2]**2
+                    if 0 < difference.dot(difference) < 0.5 and zdelta < 0.05:
+                        expected.append((i, j))
+            assert list(zip(this_idxs.tolist(), neighbor_idxs.tolist())) == expected
+        per_neighbor_hits, pairs = part.queryIdNumNeighbor(id_num, neighbors)
+        assert set(per_neighbor_hits.keys()) == set(neighbors)
+        assert any(fwd_hits or rev_hits for fwd_hits, rev_hits in per_neighbor_hits.values())
+
+
+def testPotentialCrossoverIndex(cnapp):
+    """Cached crossover candidates are reused until the geometry of a virtual
+    helix changes
+    """
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 84)
+    index = part.buildPotentialCrossoverIndex()
+    assert set(index.keys()) == {0, 1, 2}
+    hits_01 = part._potentialCrossoverHits(0, 1)
+    assert part._potentialCrossoverHits(0, 1) is hits_01
+    assert part.potentialCrossoverMap(0)[0][1] == hits_01
+
+    # translating invalidates the moved helix as a neighbor too
+    part.translateVirtualHelices([1], 0, 0, 0.34, finalize=False, use_undostack=False)
+    assert 1 not in part._xover_index
+    assert 1 not in part._xover_index[0]
+    assert 2 in part._xover_index[0]
+    assert part._potentialCrossoverHits(0, 1) != hits_01
+    part.translateVirtualHelices([1], 0, 0, -0.34, finalize=False, use_undostack=False)
+    assert part._potentialCrossoverHits(0, 1) == hits_01
+
+    # resizing invalidates
+    part._potentialCrossoverHits(1, 0)
+    part.setVirtualHelixSize(1, 126)
+    assert 1 not in part._xover_index
+    assert 1 not in part._xover_index[0]
+    assert part._potentialCrossoverHits(0, 1) == hits_01
+
+    # crossover geometry properties invalidate
+    part._potentialCrossoverHits(1, 0)
+    part.setVirtualHelixProperties(1, 'minor_groove_angle', 150., use_undostack=False)
+    assert 1 not in part._xover_index
+    part._potentialCrossoverHits(1, 0)
+    part.setVirtualHelixProperties(1, 'name', 'foo', use_undostack=False)
+    assert 0 in part._xover_index[1]
+
+
+def testOriginGrid(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    radius = part.radius()
+    grid = part._origin_grid
+    assert len(grid) == 3
+    assert part.getVirtualHelixAtPoint((0, 0)) == 0
+    assert set(part.queryVirtualHelixOrigin(2.1*radius, (0, 0))) == {0, 1, 2}
+    assert part.getVirtualHelicesInArea((-0.5, -0.5, 0.5, 2.5*radius)) == {0, 2}
+
+    part.translateVirtualHelices([2], 20*radius, 0, 0, finalize=False)
+    assert part.getVirtualHelixAtPoint((0, 2*radius)) is None
+    assert part.getVirtualHelixAtPoint((20*radius, 2*radius)) == 2
+    assert part.getVirtualHelicesInArea((-0.5, -0.5, 0.5, 2.5*radius)) == {0}
+
+    part.removeVirtualHelix(2)
+    assert 2 not in grid
+    assert part.getVirtualHelixAtPoint((20*radius, 2*radius)) is None
+
+
+def testQueryBasePoint(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    point = tuple(part.getCoordinate(1, 10))
+    id_nums, indices = part.queryBasePoint(0.01, point)
+    assert id_nums.tolist() == [1]
+    assert indices.tolist() == [10]
+
+    id_nums, indices, distances = part.queryBasePointNearest(point, k=3)
+    assert (id_nums[0], indices[0], distances[0]) == (1, 10, 0.)
+    assert set(zip(id_nums.tolist(), indices.tolist())) == {(1, 9), (1, 10), (1, 11)}
+
+    # the index follows moved helices
+    part.translateVirtualHelices([1], 0, 0, 100*part.baseWidth(), finalize=False)
+    id_nums, indices = part.queryBasePoint(0.01, point)
+    assert id_nums.tolist() == []
+    id_nums, indices = part.queryBasePoint(0.01, tuple(part.getCoordinate(1, 10)))
+    assert id_nums.tolist() == [1]
+    assert indices.tolist() == [10]
+
+
+def testChunkedCoordinates(cnapp):
+    """Chunked coordinate storage matches the contiguous arrays"""
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    chunked_part = doc.createNucleicAcidPart(chunked_coordinates=True)
+    for id_num in part.getIdNums():
+        x, y = part.getVirtualHelixOrigin(id_num)
+        chunked_part.createVirtualHelix(x, y, 0., 42, id_num=id_num)
+
+    def checkEqual():
+        total_points = part.total_points
+        assert chunked_part.total_points == total_points
+        for attr in ('axis_pts', 'fwd_pts', 'rev_pts', 'id_nums', 'indices'):
+            assert np.array_equal(getattr(part, attr)[:total_points],
+                                  getattr(chunked_part, attr)[:total_points])
+        for id_num in part.getIdNums():
+            assert part.getOffsetAndSize(id_num) == chunked_part.getOffsetAndSize(id_num)
+        assert part.zBoundsIds() == chunked_part.zBoundsIds()
+    checkEqual()
+
+    for a_part in (part, chunked_part):
+        a_part.setVirtualHelixSize(0, 84)
+        a_part.translateVirtualHelices([1], 0, 0, 5*a_part.baseWidth(), finalize=False)
+        a_part.removeVirtualHelix(2)
+    checkEqual()
+    assert len(chunked_part.getCoordinates(0)[0]) == 84
+
+    # removal is undone before the next part uses the shared undo stack
+    for a_part in (part, chunked_part):
+        a_part.removeVirtualHelix(1)
+        a_part.undoStack().undo()
+    checkEqual()
+
+
+def testParametricCoordinates(cnapp):
+    """Parametric coordinates match the contiguous arrays"""
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    parametric_part = doc.createNucleicAcidPart(parametric_coordinates=True)
+    for id_num in part.getIdNums():
+        x, y = part.getVirtualHelixOrigin(id_num)
+        parametric_part.createVirtualHelix(x, y, 0., 42, id_num=id_num)
+
+    def checkEqual():
+        total_points = part.total_points
+        assert parametric_part.total_points == total_points
+        for attr in ('axis_pts', 'fwd_pts', 'rev_pts'):
+            assert np.allclose(getattr(part, attr)[:total_points],
+                               getattr(parametric_part, attr)[:total_points])
+        for attr in ('id_nums', 'indices'):
+            assert np.array_equal(getattr(part, attr)[:total_points],
+                                  getattr(parametric_part, attr)[:total_points])
+        for id_num in part.getIdNums():
+            assert part.getOffsetAndSize(id_num) == parametric_part.getOffsetAndSize(id_num)
+            for pts, parametric_pts in zip(part.getCoordinates(id_num),
+                                           parametric_part.getCoordinates(id_num)):
+                assert np.allclose(pts, parametric_pts)
+            assert np.allclose(part.getCoordinate(id_num, 5), parametric_part.getCoordinate(id_num, 5))
+            assert part.potentialCrossoverMap(id_num) == parametric_part.potentialCrossoverMap(id_num)
+        assert part.zBoundsIds() == parametric_part.zBoundsIds()
+    checkEqual()
+
+    for a_part in (part, parametric_part):
+        a_part.setVirtualHelixSize(0, 84)
+        a_part._resizeHelix(1, False, 21)
+        a_part.translateVirtualHelices([1], 0, 0, 5*a_part.baseWidth(), finalize=False)
+        a_part.setVirtualHelixProperties(2, 'eulerZ', 10., use_undostack=False)
+    # parametric points are always what resetCoordinates makes
+    part.resetCoordinates(1)
+    part.resetCoordinates(2)
+    checkEqual()
+    assert len(parametric_part.getCoordinates(1)[0]) == 63
+
+    # removal is undone before the next part uses the shared undo stack
+    for a_part in (part, parametric_part):
+        a_part.removeVirtualHelix(2)
+        a_part.undoStack().undo()
+    checkEqual()
+
+
+@pytest.mark.parametrize('designname', ['Nature09_squarenut.json',
+                                        'Science09_beachball_v1.json',
+                                        'super_barcode_hex.json'])
+def testSinglePrecision(cnapp, designname):
+    """Crossover maps of single precision parts match double precision"""
+    from cadnano.document import Document
+    from cadnano.fileio import v3decode, v3encode
+    doc = cnapp.document
+    doc.readFile(os.path.join(TEST_PATH, 'data', designname))
+    doc_dict = v3encode.encodeDocument(doc)
+    for part_dict in doc_dict['parts']:
+        part_dict['single_precision'] = True
+    single_doc = Document()
+    v3decode.decode(single_doc, doc_dict)
+
+    part = doc.activePart()
+    single_part = single_doc.activePart()
+    assert single_part.axis_pts.dtype == np.float32
+    assert single_part.indices.dtype == np.int32
+    assert v3encode.encodePart(single_part)['single_precision'] is True
+    for id_num in part.getIdNums():
+        assert single_part.getCoordinates(id_num)[1].dtype == np.float32
+        assert part.potentialCrossoverMap(id_num) == single_part.potentialCrossoverMap(id_num)
+        assert part.potentialCrossoverMap(id_num, 30) == single_part.potentialCrossoverMap(id_num, 30)
+
+
+def assertSameV3Encoding(part, new_part):
+    """Check that a decoded part encodes like the original one, up to the
+    order of the crossovers and oligos, and has the same neighbors,
+    coordinates and strand indices
+    """
+    from cadnano.fileio import v3encode
+    part_dict = v3encode.encodePart(part)
+    new_part_dict = v3encode.encodePart(new_part)
+    for key in ('virtual_helices', 'vh_list', 'strands', 'insertions',
+                'virtual_helix_order', 'grid_type'):
+        assert new_part_dict[key] == part_dict[key]
+    assert np.array_equal(new_part_dict['origins'], part_dict['origins'])
+    assert sorted(new_part_dict['xovers']) == sorted(part_dict['xovers'])
+
+    def oligoKey(oligo_dict):
+        return (oligo_dict['id_num'], oligo_dict['idx5p'], oligo_dict['is_5p_fwd'])
+    assert (sorted(new_part_dict['oligos'], key=oligoKey) ==
+            sorted(part_dict['oligos'], key=oligoKey))
+
+    for id_num in part.getIdNums():
+        assert new_part.getVirtualHelixNeighbors(id_num) == part.getVirtualHelixNeighbors(id_num)
+        for new_pts, pts in zip(new_part.getCoordinates(id_num), part.getCoordinates(id_num)):
+            assert np.allclose(new_pts, pts)
+        for new_ss, ss in zip(new_part.getStrandSets(id_num), part.getStrandSets(id_num)):
+            assert new_ss._low_idxs == ss._low_idxs
+            assert new_ss._high_idxs == ss._high_idxs
+
+
+@pytest.mark.parametrize('designname', ['Nature09_squarenut.json',
+                                        'Science09_beachball_v1.json',
+                                        'Nature09_monolith.json'])
+def testImportVirtualHelices(cnapp, designname):
+    """Bulk v3 decoding round trips and leaves the undo stack empty"""
+    from cadnano.document import Document
+    from cadnano.fileio import v3decode, v3encode
+    doc = cnapp.document
+    doc.readFile(os.path.join(TEST_PATH, 'data', designname))
+    doc_dict = v3encode.encodeDocument(doc)
+    new_doc = Document()
+    v3decode.decode(new_doc, doc_dict)
+
+    assert not new_doc.undoStack().canUndo()
+    assertSameV3Encoding(doc.activePart(), new_doc.activePart())
+
+
+@pytest.mark.parametrize('designname', ['Nature09_squarenut.json',
+                                        'Science09_beachball_v1.json'])
+def testCnzRoundTrip(cnapp, designname, tmp_path):
+    """Saving to .cnz and loading it back gives the same v3 encoding"""
+    from cadnano.document import Document
+    from cadnano.fileio import cnzdecode
+    doc = cnapp.document
+    doc.readFile(os.path.join(TEST_PATH, 'data', designname))
+    filename = str(tmp_path / 'design.cnz')
+    doc.writeToFile(filename)
+
+    header, arrays = cnzdecode.readArchive(filename)
+    assert len(header['parts']) == 1
+    assert isinstance(arrays['part0/origins'].base, np.memmap)
+
+    new_doc = Document()
+    new_doc.readFile(filename)
+    assert not new_doc.undoStack().canUndo()
+    assertSameV3Encoding(doc.activePart(), new_doc.activePart())
+
+
+def testPropertyStore(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    props = part.getAllVirtualHelixProperties(1)
+    assert props['name'] == 'vh1'
+    assert props['length'] == 42
+    for key in ('is_visible', 'eulerZ', 'length', 'z', 'bases_per_turn'):
+        assert type(props[key]) in (bool, int, float)
+    assert type(part.getVirtualHelixProperties(1, 'eulerZ')) is int
+    assert part.getVirtualHelixProperties(1, ['name', 'length']) == ['vh1', 42]
+
+    props, origins = part.helixPropertiesAndOrigins([2, 0])
+    assert props['name'] == ['vh2', 'vh0']
+    assert props['length'] == [42, 42]
+    assert origins.shape == (2, 2)
+
+    # a non integral value promotes an integer property
+    part.setVirtualHelixProperties(1, 'eulerZ', 37.5, use_undostack=False)
+    assert part.getVirtualHelixProperties(1, 'eulerZ') == 37.5
+    assert part.getVirtualHelixProperties(0, 'eulerZ') == 40
+
+    # ID numbers past the initial allocation grow the store
+    id_num = len(part.vh_properties)
+    part.createVirtualHelix(0, 20*part.radius(), id_num=id_num, length=42)
+    assert len(part.vh_properties) > id_num
+    assert part.getVirtualHelixProperties(id_num, 'name') == 'vh%d' % id_num
+    assert part.getVirtualHelixAtPoint((0, 20*part.radius())) == id_num
+
+
+def testNeighborGraph(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    assert part.getVirtualHelixNeighbors(0) == [1, 2]
+    assert part.getVirtualHelixProperties(0, 'neighbors') == '[1, 2]'
+    assert part.getVirtualHelixNeighbors(1) == [0]
+
+    part.removeVirtualHelix(0)
+    assert part.getVirtualHelixNeighbors(1) == []
+    assert part.getVirtualHelixProperties(2, 'neighbors') == '[]'
+    part.undoStack().undo()
+    assert part.getVirtualHelixNeighbors(0) == [1, 2]
+    assert part.getVirtualHelixNeighbors(2) == [0]
+
+    # the file format string sets the graph
+    part.setVirtualHelixProperties(2, 'neighbors', '[1, 0]', use_undostack=False)
+    assert part.getVirtualHelixNeighbors(2) == [0, 1]
+    props, _ = part.helixPropertiesAndOrigins([2])
+    assert props['neighbors'] == ['[0, 1]']
+
+    part.translateVirtualHelices([2], 20*part.radius(), 0, 0, finalize=False)
+    assert part.getVirtualHelixNeighbors(2) == []
+    assert part.getVirtualHelixNeighbors(0) == [1]
+    assert part.getAllVirtualHelixProperties(0)['neighbors'] == '[1]'
+
+
+def testTranslateNeighbors(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    radius = part.radius()
+    changed = []
+
+    def propertyChanged(sender, id_num, virtual_helix, keys, values):
+        if 'neighbors' in keys:
+            changed.append(id_num)
+    part.partVirtualHelixPropertyChangedSignal.connect(propertyChanged)
+
+    # neighbors within the moved block are kept and nothing changed
+    part.translateVirtualHelices([0, 2], 0.01*radius, 0, 0, finalize=False)
+    assert changed == []
+    assert part.getVirtualHelixNeighbors(0) == [1, 2]
+
+    part.translateVirtualHelices([0, 2], 0, 10*radius, 0, finalize=False)
+    assert sorted(changed) == [0, 1]
+    assert part.getVirtualHelixNeighbors(0) == [2]
+    assert part.getVirtualHelixNeighbors(1) == []
+    assert part.getVirtualHelixNeighbors(2) == [0]
+
+    part.translateVirtualHelices([0, 2], 0, -10*radius, 0, finalize=False)
+    assert part.getVirtualHelixNeighbors(0) == [1, 2]
+    assert part.getVirtualHelixNeighbors(1) == [0]
+
+
+@pytest.mark.parametrize('chunked', [False, True])
+def testBatchCreateVirtualHelices(cnapp, chunked):
+    """Bulk creation matches creating the virtual helices one at a time"""
+    doc = cnapp.document
+    radius = doc.createNucleicAcidPart().radius()
+    xs = [2*radius*i for i in range(4)]*3
+    ys = [2*radius*j for j in range(3) for i in range(4)]
+    id_nums = list(range(12))
+
+    part = doc.createNucleicAcidPart(chunked_coordinates=chunked)
+    seq_part = doc.createNucleicAcidPart(use_undostack=False)
+    for id_num in (0, 5):
+        for a_part in (part, seq_part):
+            a_part.createVirtualHelix(xs[id_num], ys[id_num], 0., 42, id_num=id_num, use_undostack=False)
+    new_id_nums = [id_num for id_num in id_nums if id_num not in (0, 5)]
+    for id_num in new_id_nums:
+        seq_part.createVirtualHelix(xs[id_num], ys[id_num], 0., 42, id_num=id_num, use_undostack=False)
+
+    added = []
+    part.partVirtualHelicesAddedSignal.connect(lambda sender, id_nums: added.append(list(id_nums)))
+    created = part.batchCreateVirtualHelices([xs[i] for i in new_id_nums],
+                                             [ys[i] for i in new_id_nums],
+                                             length=[42]*len(new_id_nums),
+                                             id_num=new_id_nums)
+    assert created == new_id_nums
+    assert added == [new_id_nums]
+
+    def checkEqual():
+        total_points = part.total_points
+        assert seq_part.total_points == total_points
+        for attr in ('axis_pts', 'fwd_pts', 'rev_pts', 'id_nums', 'indices'):
+            assert np.allclose(getattr(part, attr)[:total_points],
+                               getattr(seq_part, attr)[:total_points])
+        for id_num in id_nums:
+            assert part.getOffsetAndSize(id_num) == seq_part.getOffsetAndSize(id_num)
+            assert part.getVirtualHelixNeighbors(id_num) == seq_part.getVirtualHelixNeighbors(id_num)
+            assert part.getVirtualHelixProperties(id_num, 'name') == 'vh%d' % id_num
+    checkEqual()
+
+    # one undo removes the whole batch
+    part.undoStack().undo()
+    assert sorted(part.getIdNums()) == [0, 5]
+    assert part.getVirtualHelixNeighbors(0) == []
+    part.undoStack().redo()
+    checkEqual()
+
+
+@pytest.mark.parametrize('designname', ['loops_and_skips.json',
+                                        'Nature09_squarenut.json'])
+def testRotationSweep(cnapp, designname):
+    """Staple sequences of a sweep match applying the rotated scaffold"""
+    from cadnano.extras.dnasequences import sequences
+    doc = cnapp.document
+    doc.readFile(os.path.join(TEST_PATH, 'data', designname))
+    part = doc.activePart()
+    scaffold = max(part.oligos(), key=lambda oligo: (oligo.length(), oligo.locString()))
+    seq = sequences['p8064']
+    sweep = part.rotationSweep(scaffold)
+
+    emitted = []
+    for oligo in part.oligos():
+        oligo.oligoSequenceAddedSignal.connect(lambda oligo: emitted.append(oligo))
+
+    def gggg(staple_seqs):
+        return sum('GGGG' in staple_seq for staple_seq in staple_seqs)
+    rotations = range(0, len(seq), 97)
+    scores = sweep.scoreRotations(seq, [gggg], rotations)
+    assert len(scores) == len(rotations)
+    assert not emitted
+
+    rotation, score = sweep.bestRotation(seq, [gggg], rotations)
+    assert score == scores.min() == gggg(sweep.stapleSequences(seq, rotation))
+    for rot in (rotation, 5, len(seq) - 1):
+        staple_seqs = sweep.stapleSequences(seq, rot)
+        sweep.applyRotation(seq, rot)
+        assert scaffold.sequence() == (seq[rot:] + seq[:rot])[:scaffold.length()]
+        for oligo, staple_seq in zip(sweep.staples(), staple_seqs):
+            assert staple_seq == ''.join(strand.sequence() or ' '*strand.totalLength()
+                                         for strand in oligo.strand5p().generator3pStrand())
+    assert emitted
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+from cntestcase import cnapp
+
+from nucleicacidparttest import create3Helix
+
+
+def createOligo(part):
+    """A 42 base oligo from fwd VH0 [0, 20] to rev VH1 [20, 0]
+    """
+    fwd_ss0, rev_ss0 = part.getStrandSets(0)
+    fwd_ss1, rev_ss1 = part.getStrandSets(1)
+    strand0 = fwd_ss0.createStrand(0, 20)
+    strand1 = rev_ss1.createStrand(0, 20)
+    part.createXover(strand0, 20, strand1, 20)
+    return strand0, strand1
+
+
+def testOligoPositionLookup(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, [0, 0, 1], 42)
+    strand0, strand1 = createOligo(part)
+    oligo = strand0.oligo()
+    lengths = [0, 20, 21, 25, 41, 42]
+    positions = oligo.getAbsolutePositionsAtLengths(lengths)
+    # the reverse strand runs from its 5' end at index 20 down to 0
+    assert positions == [(0, 0, 0), (0, 0, 20), (1, 1, 20), (1, 1, 16), (1, 1, 0), None]
+    assert [oligo.getAbsolutePositionAtLength(x) for x in lengths] == positions
+
+    # the bases of an insertion belong to its index
+    strand0.addInsertion(3, 2)
+    assert oligo.getAbsolutePositionsAtLengths([2, 3, 5, 6, 23]) == \
+        [(0, 0, 2), (0, 0, 3), (0, 0, 3), (0, 0, 4), (1, 1, 20)]
+    strand1.addInsertion(10, 2)
+    assert oligo.getAbsolutePositionsAtLengths([23 + 9, 23 + 12, 23 + 13, 46]) == \
+        [(1, 1, 11), (1, 1, 10), (1, 1, 9), None]
+    # a skip has no base
+    strand1.addInsertion(15, -1)
+    assert oligo.getAbsolutePositionsAtLengths([23 + 4, 23 + 5]) == [(1, 1, 16), (1, 1, 14)]
+# end def
+
+
+def testSplitOligoAtAbsoluteLengths(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, [0, 0, 1], 42)
+    strand0, strand1 = createOligo(part)
+    # the base at the length ends the 5' oligo, also on a reverse strand
+    assert part.splitOligoAtAbsoluteLengths(strand0.oligo(), [10, 35]) is None
+    oligos = sorted((oligo.length(), oligo.strand5p().idxs()) for oligo in part.oligos())
+    assert oligos == [(6, (0, 5)), (11, (0, 10)), (25, (11, 20))]
+    fwd_ss0, rev_ss0 = part.getStrandSets(0)
+    fwd_ss1, rev_ss1 = part.getStrandSets(1)
+    assert [strand.idxs() for strand in fwd_ss0] == [(0, 10), (11, 20)]
+    assert [strand.idxs() for strand in rev_ss1] == [(0, 5), (6, 20)]
+# end def
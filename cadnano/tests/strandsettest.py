@@ -93,3 +93,172 @@ def testStrandset(cnapp):
 
     # resize --> resize Part???
 # end def
+
+
+def testStrandsetIntervals(cnapp):
+    doc = cnapp.document
+    HELIX_LENGTH = 42
+    part = create3Helix(doc, [0, 0, 1], HELIX_LENGTH)
+    fwd_ss, rev_ss = part.getStrandSets(0)
+    strand_low = fwd_ss.createStrand(2, 10)
+    strand_high = fwd_ss.createStrand(20, 30)
+    assert [fwd_ss.getStrand(i) for i in (1, 2, 10, 11, 19, 20, 30, 31)] == \
+        [None, strand_low, strand_low, None, None, strand_high, strand_high, None]
+    assert fwd_ss.getStrand(-12) is strand_high
+    with pytest.raises(IndexError):
+        fwd_ss.getStrand(HELIX_LENGTH)
+    assert fwd_ss.getBoundsOfEmptyRegionContaining(15) == (11, 19)
+    assert fwd_ss.hasStrandAt(10, 19)
+    assert not fwd_ss.hasStrandAt(11, 19)
+    assert fwd_ss.getOverlappingStrands(11, 19) == []
+    assert fwd_ss.getOverlappingStrands(5, 25) == [strand_low, strand_high]
+    assert fwd_ss.getOverlappingStrands(25, 41) == [strand_high]
+
+    # resizing a strand moves its interval
+    strand_high.resize((15, 35))
+    assert fwd_ss.getStrand(15) is strand_high
+    assert fwd_ss.getStrand(35) is strand_high
+    assert fwd_ss.getBoundsOfEmptyRegionContaining(12) == (11, 14)
+    assert fwd_ss.getStrandIndex(strand_high) == (True, 15)
+    strand_high.undoStack().undo()
+    assert fwd_ss.getStrand(15) is None
+    assert fwd_ss.getStrandIndex(strand_high) == (True, 20)
+
+    # resizing the virtual helix changes the length of both ends
+    part.setVirtualHelixSize(0, 84)
+    assert fwd_ss.length() == rev_ss.length() == 84
+    assert fwd_ss.getBoundsOfEmptyRegionContaining(50) == (31, 83)
+    part._resizeHelix(0, False, -1)
+    assert fwd_ss.length() == 83
+# end def
+
+
+def testInsertionLengths(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, [0, 0, 1], 42)
+    fwd_ss, rev_ss = part.getStrandSets(0)
+    strand = fwd_ss.createStrand(0, 30)
+    strand.addInsertion(5, 3)
+    strand.addInsertion(20, -1)
+    strand.addInsertion(12, 2)
+    assert [x.idx() for x in strand.insertionsOnStrand()] == [5, 12, 20]
+    assert [x.idx() for x in strand.insertionsOnStrand(6, 20)] == [12, 20]
+    assert strand.insertionLengthBetweenIdxs(0, 12) == 5
+    assert strand.insertionLengthBetweenIdxs(13, 30) == -1
+    assert strand.totalLength() == 31 + 4
+
+    strand.changeInsertion(12, 6)
+    assert strand.totalLength() == 31 + 8
+    strand.undoStack().undo()
+    assert strand.totalLength() == 31 + 4
+    strand.removeInsertion(5)
+    assert strand.insertionLengthBetweenIdxs(0, 12) == 2
+    assert strand.oligo().length() == strand.totalLength()
+# end def
+
+
+def testOligoLengthCache(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, [0, 0, 1], 42)
+    fwd_ss0, rev_ss0 = part.getStrandSets(0)
+    fwd_ss1, rev_ss1 = part.getStrandSets(1)
+    strand0 = fwd_ss0.createStrand(0, 20)
+    strand1 = rev_ss1.createStrand(0, 20)
+    part.createXover(strand0, 20, strand1, 20)
+    oligo = strand0.oligo()
+    assert oligo.getStrandLengths() == [21, 21]
+    assert oligo.getNumberOfBasesToEachXover() == [21]
+    assert oligo.getAbsolutePositionAtLength(25) == (1, 1, 16)
+
+    strand1.addInsertion(10, 2)
+    assert oligo.getStrandLengths() == [21, 23]
+    assert oligo.length() == 44
+    strand0.addInsertion(3, -1)
+    assert oligo.getNumberOfBasesToEachXover(use_3p_idx=True) == [21]
+    strand0.undoStack().undo()
+    assert oligo.getStrandLengths() == [21, 23]
+
+    strand0.resize((5, 20))
+    assert oligo.getStrandLengths() == [16, 23]
+    assert oligo.length() == 39
+    strand0.undoStack().undo()
+    assert oligo.getStrandLengths() == [21, 23]
+
+    strand1.split(5)
+    low, high = rev_ss1.strands()
+    assert high.oligo() is strand0.oligo()
+    assert high.oligo().getStrandLengths() == [21, high.totalLength()]
+    assert low.oligo().getStrandLengths() == [low.totalLength()]
+    assert high.oligo().length() + low.oligo().length() == 44
+    strand0.undoStack().undo()
+    assert strand0.oligo().getStrandLengths() == [21, 23]
+    assert strand0.oligo().length() == 44
+# end def
+
+
+def testSequenceComplement(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, [0, 0, 1], 42)
+    fwd_ss, rev_ss = part.getStrandSets(0)
+    fwd_strand = fwd_ss.createStrand(0, 9)
+    rev_strand = rev_ss.createStrand(4, 15)
+    fwd_strand.addInsertion(6, 2)
+    fwd_strand.addInsertion(8, -1)
+    assert rev_strand.totalLength() == 13
+
+    fwd_strand.oligo().applySequence('ACGTACGTACG')
+    assert fwd_strand.sequence() == 'ACGTACGTACG'
+    # bases 4 to 9 with the insertion and skip pair with the reverse strand
+    assert rev_strand.sequence() == '      ' + 'CGTACGT'
+    assert rev_strand.sequence(for_export=True) == '??????' + 'CGTACGT'
+
+    rev_strand.split(10)
+    low, high = rev_ss.strands()
+    assert high.sequence() + low.sequence() == '      CGTACGT'
+    assert low.sequence().endswith('CGTACGT')
+    low.merge(low.highIdx())
+    assert rev_ss.strands()[0].sequence() == '      CGTACGT'
+
+    doc.undoStack().undo()
+    doc.undoStack().undo()
+    assert rev_strand.sequence() == '      CGTACGT'
+    doc.undoStack().undo()
+    assert not fwd_strand.sequence().strip()
+    assert not rev_strand.sequence().strip()
+# end def
+
+
+def testRefreshOligos(cnapp):
+    from cadnano.part.refresholigoscmd import RefreshOligosCommand
+    doc = cnapp.document
+    part = create3Helix(doc, [0, 0, 1], 42)
+    fwd_ss0, rev_ss0 = part.getStrandSets(0)
+    fwd_ss1, rev_ss1 = part.getStrandSets(1)
+    fwd0 = fwd_ss0.createStrand(0, 20, use_undostack=False)
+    rev1 = rev_ss1.createStrand(0, 20, use_undostack=False)
+    # a loop between the forward strand of 0 and the reverse strand of 1
+    part.createXover(fwd0, 20, rev1, 20, update_oligo=False, use_undostack=False)
+    part.createXover(rev1, 0, fwd0, 0, update_oligo=False, use_undostack=False)
+    fwd1a = fwd_ss1.createStrand(0, 10, use_undostack=False)
+    rev0 = rev_ss0.createStrand(5, 10, use_undostack=False)
+    part.createXover(fwd1a, 10, rev0, 10, update_oligo=False, use_undostack=False)
+    single = fwd_ss1.createStrand(30, 35, use_undostack=False)
+
+    rebuilt = []
+    part.partOligosRebuiltSignal.connect(lambda sender, strands: rebuilt.append(set(strands)))
+    RefreshOligosCommand(part, emit_signals=False).redo()
+    assert rebuilt == [{fwd0, rev1, fwd1a, rev0, single}]
+
+    loop = fwd0.oligo()
+    assert loop is rev1.oligo()
+    assert loop.isCircular()
+    assert loop.length() == 42
+    assert loop.strand5p() is fwd0.connection3p()
+    staple = rev0.oligo()
+    assert staple is fwd1a.oligo()
+    assert not staple.isCircular()
+    assert staple.strand5p() is fwd1a
+    assert staple.length() == 11 + 6
+    assert single.oligo().length() == 6
+    assert part.oligos() == {loop, staple, single.oligo()}
+# end def
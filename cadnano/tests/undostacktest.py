@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from cntestcase import cnapp
+
+from nucleicacidparttest import create3Helix
+from cadnano.undocommand import UndoCommand
+from cadnano.undostack import UndoStack
+
+
+class LogCommand(UndoCommand):
+    def __init__(self, log, name):
+        super(LogCommand, self).__init__(name)
+        self.log = log
+
+    def redo(self):
+        self.log.append(('redo', self.name))
+
+    def undo(self):
+        self.log.append(('undo', self.name))
+# end class
+
+
+def testPushRunsImmediately():
+    log = []
+    us = UndoStack()
+    us.push(LogCommand(log, 'a'))
+    assert log == [('redo', 'a')]
+    # also inside a macro, before the macro ends
+    us.beginMacro("macro")
+    us.push(LogCommand(log, 'b'))
+    assert log == [('redo', 'a'), ('redo', 'b')]
+    us.endMacro()
+    # ending the macro does not run its commands again
+    assert log == [('redo', 'a'), ('redo', 'b')]
+    assert len(us.undostack) == 2
+# end def
+
+
+def testNestedMacro():
+    log = []
+    us = UndoStack()
+    us.beginMacro("outer")
+    us.push(LogCommand(log, 'a'))
+    us.beginMacro("inner")
+    us.push(LogCommand(log, 'b'))
+    us.endMacro()
+    us.push(LogCommand(log, 'c'))
+    us.endMacro()
+    # the inner macro is a command of the outer one
+    assert len(us.undostack) == 1
+    outer = us.undostack[0]
+    assert [cmd.name for cmd in outer.commands] == ['a', 'inner', 'c']
+    assert [cmd.name for cmd in outer.commands[1].commands] == ['b']
+    del log[:]
+    us.undo()
+    assert log == [('undo', 'c'), ('undo', 'b'), ('undo', 'a')]
+# end def
+
+
+def testMacroUndoOrder():
+    log = []
+    us = UndoStack()
+    us.beginMacro("macro")
+    for name in 'abc':
+        us.push(LogCommand(log, name))
+    us.endMacro()
+    del log[:]
+    us.undo()
+    assert log == [('undo', 'c'), ('undo', 'b'), ('undo', 'a')]
+    del log[:]
+    us.redo()
+    assert log == [('redo', 'a'), ('redo', 'b'), ('redo', 'c')]
+# end def
+
+
+def testNewCommandClearsRedo():
+    log = []
+    us = UndoStack()
+    us.push(LogCommand(log, 'a'))
+    us.push(LogCommand(log, 'b'))
+    us.undo()
+    assert us.canRedo()
+    us.push(LogCommand(log, 'c'))
+    assert not us.canRedo()
+    assert us.redo_sizes == []
+    assert [cmd.name for cmd in us.undostack] == ['a', 'c']
+# end def
+
+
+def testUndoLimits():
+    log = []
+    # a count limit of 0 means no limit
+    us = UndoStack(limit=0, memory_limit=None)
+    for i in range(20):
+        us.push(LogCommand(log, str(i)))
+    assert len(us.undostack) == 20
+
+    us = UndoStack(limit=3, memory_limit=None)
+    for i in range(5):
+        us.push(LogCommand(log, str(i)))
+    assert [cmd.name for cmd in us.undostack] == ['2', '3', '4']
+    assert us.memorySize() == sum(us.undo_sizes)
+
+    # the oldest commands are dropped by memory but the most recent is kept
+    us = UndoStack(limit=0, memory_limit=1)
+    us.push(LogCommand(log, 'a'))
+    us.push(LogCommand(log, 'b'))
+    assert [cmd.name for cmd in us.undostack] == ['b']
+    assert us.memorySize() > us.memory_limit
+# end def
+
+
+def testResizeJournalMismatch(cnapp):
+    from cadnano.strand.resizecmd import ResizeCommand, ResizeJournalCommand
+    doc = cnapp.document
+    part = create3Helix(doc, [0, 0, 1], 42)
+    fwd_ss, rev_ss = part.getStrandSets(0)
+    strand = fwd_ss.createStrand(2, 10)
+    cmd = ResizeCommand(strand, (3, 10), update_segments=True)
+    cmd.redo()
+    journal = ResizeJournalCommand([cmd])
+    journal.undo()
+    assert strand.idxs() == (2, 10)
+    # a journal replayed against another state does not resize any strand
+    strand.resize((2, 11), use_undostack=False)
+    with pytest.raises(IndexError):
+        journal.redo()
+    assert strand.idxs() == (2, 11)
+# end def
+
+
+def testUndoHistory(cnapp):
+    from cadnano.strand.resizecmd import ResizeJournalCommand
+    doc = cnapp.document
+    us = doc.undoStack()
+    us.COMPACT_SIZE = 4
+    part = create3Helix(doc, [0, 0, 1], 42)
+    strands = []
+    for id_num in range(3):
+        fwd_ss, rev_ss = part.getStrandSets(id_num)
+        strands.append(fwd_ss.createStrand(2, 10))
+        strands.append(fwd_ss.createStrand(20, 30))
+
+    # commands of a nested macro run as they are pushed
+    us.beginMacro("outer")
+    strands[0].resize((3, 10))
+    assert strands[0].idxs() == (3, 10)
+    us.endMacro()
+    us.undo()
+    assert strands[0].idxs() == (2, 10)
+
+    for strand in strands:
+        doc.addStrandToSelection(strand, (True, True))
+    doc.resizeSelection(1)
+    assert [strand.idxs() for strand in strands] == [(3, 11), (21, 31)]*3
+    macro = us.undostack[-1]
+    assert [type(cmd) for cmd in macro.commands][0] is ResizeJournalCommand
+    assert len(macro.commands[0]) == 6
+    us.undo()
+    assert [strand.idxs() for strand in strands] == [(2, 10), (20, 30)]*3
+    assert strands[0].oligo().length() == 9
+    us.redo()
+    assert [strand.idxs() for strand in strands] == [(3, 11), (21, 31)]*3
+    assert strands[0].oligo().length() == 9
+
+    # the most recent command is always kept
+    us.setMemoryLimit(us.memorySize())
+    depth = len(us.undostack)
+    strands[1].resize((21, 32))
+    assert len(us.undostack) < depth + 1
+    assert us.memorySize() <= us.memory_limit or len(us.undostack) == 1
+    assert us.memorySize() == sum(us.undo_sizes)
+    us.setMemoryLimit(0)
+    strands[1].resize((21, 33))
+    assert len(us.undostack) == 1
+    us.undo()
+    assert strands[1].idxs() == (21, 32)
+    assert not us.canUndo()
+# end def
@@ -1,11 +1,10 @@
 # -*- coding: utf-8 -*-
-from collections import deque
 
 
 class UndoCommand(object):
     def __init__(self, name=None):
         self.name = name
-        self.commands = deque()
+        self.commands = []
     # end def
 
     def redo(self):
@@ -14,7 +13,7 @@ class UndoCommand(object):
     # end def
 
     def undo(self):
-        for cmd in self.commands:
+        for cmd in reversed(self.commands):
             cmd.undo()
     # end def
 
@@ -1,14 +1,38 @@
 # -*- coding: utf-8 -*-
+import sys
 from collections import deque
 
+import numpy as np
+
 from cadnano.undocommand import UndoCommand
 
 
 class UndoStack(object):
-    def __init__(self, limit=10):
+    """Pure python undo stack.  The history is capped by the number of
+    commands, ``0`` for no limit, and by their estimated memory, see
+    :func:`estimateSize`.  The most recent command is always kept.
+
+    Commands run as they are pushed, also inside a macro.  Macros of at
+    least `COMPACT_SIZE` commands are compacted with :func:`compactCommands`
+    when they end.
+
+    Args:
+        limit (int, optional): maximum number of commands, default 10
+        memory_limit (int, optional): maximum estimated bytes of the
+            commands, ``None`` for no limit, default `DEFAULT_MEMORY_LIMIT`
+    """
+    COMPACT_SIZE = 64
+    DEFAULT_MEMORY_LIMIT = 64 << 20
+
+    def __init__(self, limit=10, memory_limit=DEFAULT_MEMORY_LIMIT):
         self.undostack = deque()    # not using deque maxlen because pattern is awkward
         self.redostack = []
         self.limit = limit
+        self.memory_limit = memory_limit
+
+        self.undo_sizes = deque()   # estimated size of each command of the undostack
+        self.redo_sizes = []
+        self.memory_size = 0
 
         self.top_macro = None
         self.current_macro = None
@@ -17,23 +41,51 @@ class UndoStack(object):
     # end def
 
     def push(self, undocommand):
+        """Run `undocommand` and add it to the current macro or the stack,
+        like `QUndoStack.push`
+        """
         if self.macro_count > 0:
+            undocommand.redo()
             self.current_macro.addCommand(undocommand)
         else:
             self.appendUndoStack(undocommand)
     # end def
 
     def appendUndoStack(self, undocommand):
+        undocommand.redo()
+        self._commit(undocommand)
+    # end def
+
+    def _commit(self, undocommand):
+        """Add a command that already ran to the stack
+        """
+        if len(undocommand.commands) >= self.COMPACT_SIZE:
+            undocommand.commands = compactCommands(undocommand.commands)
+        # a new command drops the commands that were undone
+        self.redostack = []
+        self.redo_sizes = []
+        self._append(undocommand, estimateSize(undocommand))
+    # end def
+
+    def _append(self, undocommand, size):
         stack = self.undostack
+        sizes = self.undo_sizes
         stack.append(undocommand)
-        undocommand.redo()
-        if len(stack) > self.limit:
+        sizes.append(size)
+        self.memory_size += size
+        limit = self.limit
+        memory_limit = self.memory_limit
+        while len(stack) > 1 and ((limit and len(stack) > limit) or
+                                  (memory_limit is not None and self.memory_size > memory_limit)):
             stack.popleft()
+            self.memory_size -= sizes.popleft()
     # end def
 
     def beginMacro(self, message):
         new_macro = UndoCommand(message)
         if self.current_macro is not None:
+            # a nested macro is a command of the enclosing one
+            self.current_macro.addCommand(new_macro)
             self.macro_stack.append(self.current_macro)
         self.current_macro = new_macro
         if self.macro_count == 0:
@@ -50,21 +102,26 @@ class UndoStack(object):
             self.current_macro = None
         # print('e', self.current_macro self.macro_count)
         if self.macro_count == 0:
-            self.appendUndoStack(self.top_macro)
+            # the commands of the macro ran as they were pushed
+            self._commit(self.top_macro)
     # end def
 
     def undo(self):
         if self.canUndo():
             undo_cmd = self.undostack.pop()
+            size = self.undo_sizes.pop()
+            self.memory_size -= size
             undo_cmd.undo()
             self.redostack.append(undo_cmd)
+            self.redo_sizes.append(size)
     # end def
 
     def redo(self):
         if self.canRedo():
             redo_cmd = self.redostack.pop()
+            size = self.redo_sizes.pop()
             redo_cmd.redo()
-            self.undostack.append(redo_cmd)
+            self._append(redo_cmd, size)
     # end def
 
     def canUndo(self):
@@ -78,3 +135,113 @@ class UndoStack(object):
     def setUndoLimit(self, lim):
         self.limit = lim
     # end def
+
+    def setMemoryLimit(self, memory_limit):
+        """
+        Args:
+            memory_limit (int): maximum estimated bytes of the commands, or
+                ``None`` for no limit
+        """
+        self.memory_limit = memory_limit
+    # end def
+
+    def memorySize(self):
+        """
+        Returns:
+            int: estimated bytes of the commands of the undostack
+        """
+        return self.memory_size
+    # end def
+# end class
+
+
+def estimateSize(undocommand):
+    """Estimate the memory held by a command.  Arrays, strings and
+    containers of numbers or strings are counted, model objects like
+    strands are not as they are shared with the model.
+
+    Args:
+        undocommand (UndoCommand):
+
+    Returns:
+        int: estimated bytes
+    """
+    size = sys.getsizeof(undocommand)
+    attrs = getattr(undocommand, '__dict__', None)
+    if attrs:
+        size += sys.getsizeof(attrs)
+        for key, value in attrs.items():
+            if key == 'commands':
+                size += sys.getsizeof(value)
+                for cmd in value:
+                    size += estimateSize(cmd)
+            else:
+                size += _valueSize(value)
+    return size
+# end def
+
+
+def _valueSize(value):
+    if isinstance(value, np.ndarray):
+        return sys.getsizeof(value) + (0 if value.base is not None else value.nbytes)
+    if isinstance(value, (str, bytes, bytearray, int, float)):
+        return sys.getsizeof(value)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        size = sys.getsizeof(value)
+        for item in value:
+            if isinstance(item, (str, bytes, bytearray, int, float, list, tuple)):
+                size += _valueSize(item)
+        return size
+    if isinstance(value, dict):
+        size = sys.getsizeof(value)
+        for item in value.values():
+            if isinstance(item, (str, bytes, bytearray, int, float, list, tuple)):
+                size += _valueSize(item)
+        return size
+    # a reference to a model object
+    return 0
+# end def
+
+
+def compactCommands(commands):
+    """Flatten the nested macros of `commands` and replace each run of
+    consecutive commands of a class with a ``journal`` static method by the
+    commands it returns, which hold index ranges and id_nums instead of
+    model objects.
+
+    Args:
+        commands (iterable): of :class:`UndoCommand`
+
+    Returns:
+        list: of :class:`UndoCommand` running the same changes in order
+    """
+    compacted = []
+    run = []
+    for cmd in _flatten(commands):
+        if run and type(cmd) is not type(run[0]):
+            compacted += _journal(run)
+            run = []
+        if getattr(type(cmd), 'journal', None) is not None:
+            run.append(cmd)
+        else:
+            compacted.append(cmd)
+    compacted += _journal(run)
+    return compacted
+# end def
+
+
+def _flatten(commands):
+    for cmd in commands:
+        # only plain macros run their commands in order and nothing else
+        if type(cmd) is UndoCommand:
+            yield from _flatten(cmd.commands)
+        else:
+            yield cmd
+# end def
+
+
+def _journal(run):
+    if len(run) > 1:
+        return type(run[0]).journal(run)
+    return run
+# end def
@@ -59,8 +59,10 @@ def trace(n):
 
 if IS_PY_3:
     complement = str.maketrans('ACGTacgt', 'TGCATGCA')
+    complement_bytes = bytes.maketrans(b'ACGTacgt', b'TGCATGCA')
 else:
     complement = string.maketrans('ACGTacgt', 'TGCATGCA')
+    complement_bytes = complement
 
 
 def rcomp(seqStr):
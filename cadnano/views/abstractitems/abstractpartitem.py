@@ -87,6 +87,9 @@ class QAbstractPartItem(QGraphicsRectItem):
     def partOligoAddedSlot(self, part, oligo):
         pass
 
+    def partOligosRebuiltSlot(self, part, strands):
+        pass
+
     def partParentChangedSlot(self, sender):
         pass
 
@@ -120,6 +123,12 @@ class QAbstractPartItem(QGraphicsRectItem):
     def partVirtualHelixAddedSlot(self, model_part, id_num, virtual_helix, neighbors):
         pass
 
+    def partVirtualHelicesAddedSlot(self, model_part, id_nums):
+        for id_num in id_nums:
+            self.partVirtualHelixAddedSlot(model_part, id_num,
+                                           model_part.getVirtualHelix(id_num),
+                                           model_part.getVirtualHelixNeighbors(id_num))
+
     def partVirtualHelixRemovingSlot(self, sender, id_num, virtual_helix, neighbors):
         pass
 
@@ -200,6 +209,9 @@ class AbstractPartItem(object):
     def partOligoAddedSlot(self, part, oligo):
         pass
 
+    def partOligosRebuiltSlot(self, part, strands):
+        pass
+
     def partParentChangedSlot(self, sender):
         pass
 
@@ -230,6 +242,12 @@ class AbstractPartItem(object):
     def partVirtualHelixAddedSlot(self, model_part, id_num, virtual_helix, neighbors):
         pass
 
+    def partVirtualHelicesAddedSlot(self, model_part, id_nums):
+        for id_num in id_nums:
+            self.partVirtualHelixAddedSlot(model_part, id_num,
+                                           model_part.getVirtualHelix(id_num),
+                                           model_part.getVirtualHelixNeighbors(id_num))
+
     def partVirtualHelixRemovingSlot(self, sender, id_num, virtual_helix, neighbors):
         pass
 
@@ -4,7 +4,6 @@ Attributes:
     DELTA (TYPE): Description
     HIGHLIGHT_WIDTH (TYPE): Description
 """
-from ast import literal_eval
 from PyQt6.QtCore import QPointF, Qt, QRectF
 from PyQt6.QtWidgets import QGraphicsItem
 from PyQt6.QtWidgets import QGraphicsRectItem
@@ -234,8 +233,7 @@ class GridNucleicAcidPartItem(QAbstractPartItem):
             id_num (int): VirtualHelix ID number. See `NucleicAcidPart` for description and related methods.
             vhi (cadnano.views.gridview.virtualhelixitem.GridVirtualHelixItem): the item associated with id_num
         """
-        neighbors = vhi.cnModel().getProperty('neighbors')
-        neighbors = literal_eval(neighbors)
+        neighbors = vhi.cnModel().getNeighbors()
         vhi.beginAddWedgeGizmos()
         for nvh in neighbors:
             nvhi = self._virtual_helix_item_hash.get(nvh, False)
@@ -14,6 +14,7 @@ from cadnano.views.resizehandles import ResizeHandleGroup
 from . import pathstyles as styles
 from .pathextras import PathWorkplaneItem
 from .prexovermanager import PreXoverManager
+from .strand.stranditem import StrandItem
 from .strand.xoveritem import XoverNode3
 from .virtualhelixitem import PathVirtualHelixItem
 
@@ -356,6 +357,44 @@ class PathNucleicAcidPartItem(QAbstractPartItem):
             self.show()
     # end def
 
+    def partVirtualHelicesAddedSlot(self, model_part, id_nums):
+        """Batched version of `partVirtualHelixAddedSlot` that lays out the
+        virtual helix items once
+
+        Args:
+            model_part (Part): The model part
+            id_nums (list): of :obj:`int` VirtualHelix ID numbers
+        """
+        vhi_list = self._virtual_helix_item_list
+        for id_num in id_nums:
+            vhi = PathVirtualHelixItem(model_part.getVirtualHelix(id_num), self, self._viewroot)
+            self._virtual_helix_item_hash[id_num] = vhi
+            vhi_list.append(vhi)
+        ztf = not getBatch()
+        self._setVirtualHelixItemList(vhi_list, zoom_to_fit=ztf)
+        if not self.isVisible():
+            self.show()
+    # end def
+
+    def partOligosRebuiltSlot(self, model_part, strands):
+        """Batched version of `strandHasNewOligoSlot` and
+        `strandConnectionChangedSlot` of the `StrandItem` of each strand
+
+        Args:
+            model_part (Part): The model part
+            strands (list): of :obj:`Strand` whose oligo or connections may
+                have changed
+        """
+        strands = set(strands)
+        for vhi in self._virtual_helix_item_list:
+            for item in vhi.childItems():
+                if isinstance(item, StrandItem):
+                    strand = item.strand()
+                    if strand in strands:
+                        item.strandHasNewOligoSlot(strand)
+                        item.strandConnectionChangedSlot(strand)
+    # end def
+
     def partVirtualHelixResizedSlot(self, sender, id_num, virtual_helix):
         """Notifies the virtualhelix at coord to resize.
 
@@ -1,5 +1,3 @@
-from ast import literal_eval
-
 from PyQt6.QtCore import QPointF, QRectF, Qt
 from PyQt6.QtWidgets import QGraphicsItem, QGraphicsLineItem, QGraphicsRectItem, QGraphicsSceneMouseEvent
 
@@ -256,8 +254,7 @@ class SliceNucleicAcidPartItem(QAbstractPartItem):
             id_num (int): VirtualHelix ID number. See `NucleicAcidPart` for description and related methods.
             vhi (cadnano.views.sliceview.virtualhelixitem.SliceVirtualHelixItem): the item associated with id_num
         """
-        neighbors = vhi.cnModel().getProperty('neighbors')
-        neighbors = literal_eval(neighbors)
+        neighbors = vhi.cnModel().getNeighbors()
         vhi.beginAddWedgeGizmos()
         for nvh in neighbors:
             nvhi = self._virtual_helix_item_hash.get(nvh, False)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# null_signal_benchmark.py
+# BSD-3 open-source license
+# Run from terminal: python3 null_signal_benchmark.py [design.json] [repeats]
+# Compares the default DummySignal proxy mode with the headless "null" mode
+# of proxyConfigure.  Each mode runs in its own process because the mode
+# must be configured before the model modules are imported.  The best of
+# `repeats` runs is reported for:
+#   decode   - decodeFile of the design
+#   export   - part.getSequences after applying a scaffold sequence
+#   strands  - bulk creation of ~10k strands and their oligos, where the
+#              per object ProxyObject bookkeeping dominates
+
+import json
+import os
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PROJECT_PATH = os.path.dirname(os.path.dirname(HERE))
+DEFAULT_DESIGN = os.path.join(PROJECT_PATH, 'cadnano', 'tests', 'data', 'Nature09_monolith.json')
+
+
+def run(mode, design, repeats):
+    import time
+    from cadnano.proxies.proxyconfigure import proxyConfigure
+    if mode == 'null':
+        proxyConfigure('null')
+    from cadnano.document import Document
+    from cadnano.fileio.decode import decodeFile
+    from cadnano.extras.dnasequences import sequences
+
+    best = {'decode': float('inf'), 'export': float('inf'), 'strands': float('inf')}
+    for _ in range(repeats):
+        doc = Document()
+        t = time.perf_counter()
+        decodeFile(design, document=doc)
+        best['decode'] = min(best['decode'], time.perf_counter() - t)
+        part = doc.activePart()
+        scaffold = max(part.oligos(), key=lambda o: (o.length(), o.locString()))
+        scaffold.applySequence(sequences['p7560'], use_undostack=False)
+        t = time.perf_counter()
+        part.getSequences()
+        best['export'] = min(best['export'], time.perf_counter() - t)
+
+        num_helices, length, step = 40, 4200, 32
+        part = Document().createNucleicAcidPart(use_undostack=False)
+        radius = part.radius()
+        part.batchCreateVirtualHelices([2*radius*i for i in range(num_helices)], [0.]*num_helices,
+                                       length=[length]*num_helices,
+                                       id_num=list(range(num_helices)), use_undo_stack=False)
+        idx_pairs = [(i, i + step - 2) for i in range(0, length - step, step)]
+        colors = ['#0066cc']*len(idx_pairs)
+        t = time.perf_counter()
+        for id_num in range(num_helices):
+            for strandset in part.getStrandSets(id_num):
+                strandset.importStrands(idx_pairs, colors)
+        best['strands'] = min(best['strands'], time.perf_counter() - t)
+    print(json.dumps(best))
+# end def
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--mode':
+        run(sys.argv[2], sys.argv[3], int(sys.argv[4]))
+        return
+    design = os.path.abspath(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_DESIGN
+    repeats = sys.argv[2] if len(sys.argv) > 2 else '7'
+    env = dict(os.environ, PYTHONPATH=PROJECT_PATH)
+    results = {}
+    for mode in ('dummy', 'null'):
+        out = subprocess.check_output([sys.executable, __file__, '--mode', mode, design, repeats],
+                                      env=env, universal_newlines=True)
+        results[mode] = json.loads(out.splitlines()[-1])
+    print(os.path.basename(design), 'best of', repeats)
+    for key in ('decode', 'export', 'strands'):
+        dummy, null = results['dummy'][key], results['null'][key]
+        print("{0:8s} dummy {1:.4f}s  null {2:.4f}s  {3:+.0%}".format(key, dummy, null,
+                                                                   null/dummy - 1.))
+# end def
+
+
+if __name__ == '__main__':
+    main()
@@ -136,7 +136,7 @@ exclude_list = ['*.genbank', '*.fasta',
 cn_packages = find_packages(exclude=exclude_list)
 
 install_requires = ['PyQt6',
-                    'pandas',
+                    'numpy',
                     'termcolor'
                     ]
 